@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+图形界面卡顿基准测试
+在 Xvfb 虚拟显示器中用合成词库启动 WordReminderGUI，按脚本切换标签页、实时搜索输入和复习，
+统计每个操作期间主循环的最长阻塞时间
+
+用法:
+    python benchmarks/gui_benchmark.py --size 10k
+    python benchmarks/gui_benchmark.py --size 10k --compare benchmarks/results/gui_old.json
+
+没有 DISPLAY 时自动启动 Xvfb；找不到 Xvfb 时跳过 (退出码 2)
+"""
+
+import argparse
+import datetime
+import json
+import logging
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BENCH_DIR)
+
+# 添加src目录到Python路径
+sys.path.insert(0, os.path.join(ROOT_DIR, 'src'))
+
+from synthetic_deck import get_deck
+from run_benchmarks import DECK_DIR, RESULTS_DIR, compare, git_commit, load_results
+from core.constants import Constants
+
+# 心跳间隔 (毫秒)，两次心跳之间超出该间隔的部分计为主循环阻塞
+HEARTBEAT_MS = 10
+
+# 超过该时长 (毫秒) 的阻塞计为一次卡顿 (约 3 帧)
+JANK_MS = 50
+
+# 对比结果时低于一帧 (毫秒) 的阻塞按一帧计算，避免微小抖动被报告为回退
+FRAME_MS = 16
+
+# 后台任务全部完成后再保持空闲该时长 (毫秒) 才视为操作结束
+QUIET_MS = 100
+
+# 模拟输入时两次按键的间隔 (毫秒)
+KEY_INTERVAL_MS = 120
+
+# 找不到显示器时的退出码
+EXIT_SKIPPED = 2
+
+
+def start_xvfb():
+    """启动 Xvfb 并设置 DISPLAY
+
+    Returns:
+        Xvfb 进程；已有显示器时返回 None
+
+    Raises:
+        FileNotFoundError: 没有显示器且未安装 Xvfb
+    """
+    if os.environ.get("DISPLAY"):
+        return None
+    xvfb = shutil.which("Xvfb")
+    if not xvfb:
+        raise FileNotFoundError("未找到 Xvfb")
+    read_fd, write_fd = os.pipe()
+    process = subprocess.Popen([xvfb, "-displayfd", str(write_fd), "-screen", "0", "1280x1024x24",
+                                "-nolisten", "tcp"], pass_fds=(write_fd,))
+    os.close(write_fd)
+    with os.fdopen(read_fd) as f:
+        display = f.readline().strip()
+    if not display:
+        process.terminate()
+        raise FileNotFoundError("Xvfb 启动失败")
+    os.environ["DISPLAY"] = f":{display}"
+    return process
+
+
+class StallMonitor:
+    """主循环阻塞监视器
+
+    每 HEARTBEAT_MS 毫秒排一次 after 回调，相邻两次心跳的间隔减去心跳间隔即为主循环被阻塞的时间
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.last_beat = None
+        self.stalls = None
+
+    def start(self):
+        self.last_beat = time.perf_counter()
+        self.root.after(HEARTBEAT_MS, self._beat)
+
+    def _beat(self):
+        now = time.perf_counter()
+        if self.stalls is not None:
+            self.stalls.append(max(0.0, now - self.last_beat - HEARTBEAT_MS / 1000))
+        self.last_beat = now
+        self.root.after(HEARTBEAT_MS, self._beat)
+
+    def begin(self):
+        """开始记录一个操作"""
+        self.stalls = []
+
+    def end(self) -> list:
+        """结束记录，返回期间每次心跳的阻塞时间 (秒)，包括尚未结束的当前间隔"""
+        stalls, self.stalls = self.stalls, None
+        stalls.append(max(0.0, time.perf_counter() - self.last_beat - HEARTBEAT_MS / 1000))
+        return stalls
+
+
+def _type_text(entry, text, on_key):
+    """逐个字符输入并触发按键回调，最后等待防抖搜索执行"""
+    entry.delete(0, "end")
+    for char in text:
+        entry.insert("end", char)
+        on_key()
+        yield KEY_INTERVAL_MS
+    yield Constants.DEBOUNCE_DELAY + HEARTBEAT_MS
+
+
+def _review_session(app, answers):
+    """切换到复习页，完成若干个单词后取消复习 (不弹出完成提示框)"""
+    app.select_tab("复习单词")
+    yield 0
+    review = app.review_tab_comp
+    review.start_review()
+    yield KEY_INTERVAL_MS
+    for _ in range(answers):
+        if not review.current_review_word:
+            break
+        review.review_feedback(True)
+        yield KEY_INTERVAL_MS
+    review.finish_review(aborted=True)
+
+
+def _search_typing(app, text):
+    """切换到搜索页，开启实时搜索后逐字输入"""
+    app.select_tab("搜索单词")
+    yield 0
+    search = app.search_tab_comp
+    search.realtime_search_var.set(True)
+    yield from _type_text(search.search_entry, text, search.on_search_key_release)
+
+
+def _single(func):
+    """把单步操作包装成脚本"""
+    def script(app):
+        func(app)
+        yield 0
+    return script
+
+
+def build_scenarios(search_text: str, review_answers: int):
+    """脚本化的操作列表: (名称, 脚本)
+
+    脚本是接收 app 的生成器函数，每次 yield 等待的毫秒数，期间主循环照常处理事件
+    """
+    scenarios = []
+    for title in ["查看单词", "搜索单词", "学习统计", "复习单词", "首页"]:
+        scenarios.append((f"tab.{title}", _single(lambda app, t=title: app.select_tab(t))))
+    scenarios += [
+        ("view.refresh_word_list", _single(lambda app: app.view_tab_comp.refresh_word_list())),
+        ("search.realtime_typing", lambda app: _search_typing(app, search_text)),
+        ("stats.show_statistics", _single(lambda app: app.stats_tab_comp.show_statistics())),
+        ("review.session", lambda app: _review_session(app, review_answers)),
+        ("home.update_statistics", _single(lambda app: app.home_tab_comp.update_statistics())),
+    ]
+    return scenarios
+
+
+class GuiBenchmark:
+    """在主循环中依次执行操作脚本并记录阻塞时间"""
+
+    def __init__(self, app, scenarios, repeat: int, settle_timeout: float):
+        self.app = app
+        self.root = app.root
+        self.scenarios = scenarios
+        self.repeat = repeat
+        self.settle_timeout = settle_timeout
+        self.monitor = StallMonitor(self.root)
+        self.queue = []
+        self.samples = {}
+        self.timeouts = {}
+
+    def run(self) -> dict:
+        """启动主循环执行全部操作，返回每个操作的统计"""
+        self.queue = [("startup", self._wait_startup)]
+        for _ in range(self.repeat):
+            self.queue.extend(self.scenarios)
+        self.monitor.start()
+        self.root.after(0, self._next)
+        self.root.mainloop()
+        return {name: self._summarize(name, runs) for name, runs in self.samples.items()}
+
+    def _wait_startup(self, app):
+        """启动阶段: 等待空闲时创建的标签页和缓存预热启动完成"""
+        from gui.main_window import TAB_SPECS
+        while not all(getattr(app, attr, None) for attr, _, _ in TAB_SPECS.values()) or not app.cache_warmer:
+            yield HEARTBEAT_MS
+        # 缓存预热会在后台访问网络，停止后各操作的结果才可重复
+        app.cache_warmer.stop()
+
+    def _next(self):
+        if not self.queue:
+            self.root.quit()
+            return
+        name, script = self.queue.pop(0)
+        self.monitor.begin()
+        started = time.perf_counter()
+        self._step(name, script(self.app), started)
+
+    def _step(self, name, steps, started):
+        try:
+            delay = next(steps)
+        except StopIteration:
+            self._settle(name, started, None)
+            return
+        self.root.after(delay, self._step, name, steps, started)
+
+    def _settle(self, name, started, quiet_since):
+        """等待后台任务完成且主循环保持空闲"""
+        now = time.perf_counter()
+        if now - started > self.settle_timeout:
+            self.timeouts[name] = self.timeouts.get(name, 0) + 1
+        elif self.app.check_async_operations():
+            self.root.after(HEARTBEAT_MS, self._settle, name, started, None)
+            return
+        elif quiet_since is None or (now - quiet_since) * 1000 < QUIET_MS:
+            self.root.after(HEARTBEAT_MS, self._settle, name, started, quiet_since or now)
+            return
+        stalls = self.monitor.end()
+        self.samples.setdefault(name, []).append((stalls, time.perf_counter() - started))
+        self.root.after(0, self._next)
+
+    def _summarize(self, name, runs) -> dict:
+        longest = [max(stalls) for stalls, _ in runs]
+        return {
+            'repeat': len(runs),
+            'median_stall_s': statistics.median(longest),
+            'max_stall_s': max(longest),
+            'janky_frames': sum(1 for stalls, _ in runs for s in stalls if s * 1000 >= JANK_MS) / len(runs),
+            'settle_s': statistics.median(elapsed for _, elapsed in runs),
+            'timeouts': self.timeouts.get(name, 0),
+        }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="图形界面卡顿基准测试")
+    parser.add_argument("--size", choices=["1k", "10k", "100k"], default="10k", help="词库规模 (默认 10k)")
+    parser.add_argument("--repeat", type=int, default=3, help="每个操作的执行次数")
+    parser.add_argument("--seed", type=int, default=42, help="合成词库的随机种子")
+    parser.add_argument("--search-text", default="abc", help="实时搜索时逐字输入的内容")
+    parser.add_argument("--review-answers", type=int, default=10, help="每次复习完成的单词数")
+    parser.add_argument("--settle-timeout", type=float, default=30.0, help="单个操作等待后台任务的最长秒数")
+    parser.add_argument("--output", help="结果文件路径 (默认 benchmarks/results/gui_<时间>_<提交>.json)")
+    parser.add_argument("--compare", metavar="JSON", help="与之前的结果对比最长阻塞时间")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+
+    try:
+        xvfb = start_xvfb()
+    except FileNotFoundError as e:
+        print(f"跳过图形界面基准测试: {e}，且没有可用的 DISPLAY")
+        return EXIT_SKIPPED
+
+    deck = get_deck(args.size, DECK_DIR, args.seed)
+    work_dir = tempfile.mkdtemp(prefix="gui_bench_")
+    cwd = os.getcwd()
+    try:
+        db_path = os.path.join(work_dir, "words.db")
+        shutil.copyfile(deck, db_path)
+        # 在临时目录中运行，使用默认配置 (不朗读) 且不改写用户的 data/config.json
+        os.chdir(work_dir)
+
+        import customtkinter as ctk
+        from gui.main_window import WordReminderGUI
+
+        root = ctk.CTk()
+        app = WordReminderGUI(root, db_path=db_path)
+        benchmark = GuiBenchmark(app, build_scenarios(args.search_text, args.review_answers),
+                                 args.repeat, args.settle_timeout)
+        results = benchmark.run()
+        app.task_runner.shutdown()
+        app.task_scheduler.shutdown()
+        root.destroy()
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(work_dir, ignore_errors=True)
+        if xvfb:
+            xvfb.terminate()
+            xvfb.wait()
+
+    print(f"{'操作':<26}  {'最长阻塞(ms)':>12}  {'最大(ms)':>9}  {'卡顿次数':>8}  {'完成(ms)':>9}")
+    for name, result in results.items():
+        flag = "  (等待超时)" if result['timeouts'] else ""
+        print(f"{name:<26}  {result['median_stall_s'] * 1000:>12.1f}  {result['max_stall_s'] * 1000:>9.1f}  "
+              f"{result['janky_frames']:>8.1f}  {result['settle_s'] * 1000:>9.1f}{flag}")
+
+    data = {
+        'meta': {
+            'commit': git_commit(),
+            'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'seed': args.seed,
+        },
+        'results': {args.size: results},
+    }
+    output = args.output
+    if not output:
+        stamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        output = os.path.join(RESULTS_DIR, f"gui_{stamp}_{data['meta']['commit']}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    print(f"结果已保存: {output}")
+
+    if args.compare:
+        return 1 if compare(load_results(args.compare), data, key='median_stall_s', floor=FRAME_MS / 1000) else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
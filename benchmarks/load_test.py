@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HTTP 服务压力测试
+用 asyncio 客户端模拟多个学习者同时访问 serve 模式的服务 (取复习队列、查单词、提交复习、看统计)，
+统计每个接口的延迟分位数和总吞吐量，最后打印服务端的请求指标和数据库线程池排队时间
+
+用法:
+    python benchmarks/load_test.py --size 10k --clients 8 --duration 10
+    python benchmarks/load_test.py --url http://127.0.0.1:8765 --clients 16
+
+不指定 --url 时在本进程中用合成词库的临时副本启动服务 (客户端和服务端共用一个进程，
+延迟中包含两者争用 GIL 的时间；测量服务端本身的延迟时看结尾打印的服务端指标)
+"""
+
+import argparse
+import asyncio
+import datetime
+import json
+import logging
+import os
+import platform
+import random
+import shutil
+import socket
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BENCH_DIR)
+
+# 添加src目录到Python路径
+sys.path.insert(0, os.path.join(ROOT_DIR, 'src'))
+
+from synthetic_deck import DECK_SIZES, get_deck
+from run_benchmarks import DECK_DIR, RESULTS_DIR, git_commit
+from core.constants import Constants
+from utils.metrics import format_metrics
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# 请求组合: (名称, 权重)，大致对应一次复习会话中的操作比例
+REQUEST_MIX = [
+    ("review.queue", 3),
+    ("words.get", 4),
+    ("review.submit", 4),
+    ("words.search", 2),
+    ("stats.overview", 1),
+]
+
+# 搜索使用的关键字
+SEARCH_KEYWORDS = ["ab", "理解", "tion", "环境", "qu"]
+
+# 缺少依赖时的退出码
+EXIT_SKIPPED = 2
+
+
+class InProcessServer:
+    """在后台线程中运行 uvicorn (数据库为合成词库的临时副本)"""
+
+    def __init__(self, db_path: str, db_workers: int):
+        import uvicorn
+        from server.app import create_app
+
+        with socket.socket() as sock:
+            sock.bind((Constants.SERVER_HOST, 0))
+            self.port = sock.getsockname()[1]
+        config = uvicorn.Config(create_app(db_path, db_workers=db_workers), host=Constants.SERVER_HOST,
+                                port=self.port, log_level="warning")
+        self.server = uvicorn.Server(config)
+        self.thread = threading.Thread(target=self.server.run, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://{Constants.SERVER_HOST}:{self.port}"
+
+    def __enter__(self):
+        self.thread.start()
+        while not self.server.started:
+            if not self.thread.is_alive():
+                raise RuntimeError("服务启动失败")
+            time.sleep(0.05)
+        return self
+
+    def __exit__(self, *exc):
+        self.server.should_exit = True
+        self.thread.join()
+
+
+async def _request(client, name: str, words: list, rng: random.Random):
+    """按名称发出一个请求"""
+    if name == "review.queue":
+        return await client.get("/review")
+    if name == "words.get":
+        return await client.get(f"/words/{rng.choice(words)}")
+    if name == "review.submit":
+        return await client.post("/review", json={'word': rng.choice(words),
+                                                  'quality': rng.randint(Constants.MIN_QUALITY, Constants.MAX_QUALITY)})
+    if name == "words.search":
+        return await client.get("/words", params={'keyword': rng.choice(SEARCH_KEYWORDS), 'columns': "word,meaning"})
+    return await client.get("/stats")
+
+
+async def _client(client, words: list, seed: int, deadline: float, samples: dict):
+    """单个客户端: 在截止时间前按权重连续发出请求"""
+    rng = random.Random(seed)
+    names = [name for name, _ in REQUEST_MIX]
+    weights = [weight for _, weight in REQUEST_MIX]
+    while time.perf_counter() < deadline:
+        name = rng.choices(names, weights)[0]
+        start = time.perf_counter()
+        try:
+            ok = (await _request(client, name, words, rng)).status_code < 400
+        except httpx.HTTPError:
+            ok = False
+        latencies, errors = samples.setdefault(name, ([], [0]))
+        latencies.append(time.perf_counter() - start)
+        if not ok:
+            errors[0] += 1
+
+
+def _percentile(values: list, q: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+async def run_load(url: str, clients: int, duration: float, seed: int) -> dict:
+    """启动多个客户端压测，返回每个接口的统计和服务端指标"""
+    limits = httpx.Limits(max_connections=clients)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=30) as client:
+        response = await client.get("/words", params={'columns': "word"})
+        response.raise_for_status()
+        words = [row['word'] for row in response.json()['words']]
+        if not words:
+            raise RuntimeError("词库为空，无法压测")
+
+        samples = {}
+        started = time.perf_counter()
+        deadline = started + duration
+        await asyncio.gather(*(_client(client, words, seed + i, deadline, samples) for i in range(clients)))
+        elapsed = time.perf_counter() - started
+        server = (await client.get("/metrics")).json()['metrics']
+
+    results = {}
+    for name, (latencies, errors) in sorted(samples.items()):
+        results[name] = {
+            'count': len(latencies),
+            'errors': errors[0],
+            'p50_s': statistics.median(latencies),
+            'p95_s': _percentile(latencies, 0.95),
+            'p99_s': _percentile(latencies, 0.99),
+        }
+    total = sum(r['count'] for r in results.values())
+    summary = {'requests': total, 'elapsed_s': elapsed, 'throughput_rps': total / elapsed}
+    return {'summary': summary, 'endpoints': results, 'server': server}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="HTTP 服务压力测试")
+    parser.add_argument("--url", help="已运行服务的地址 (默认在本进程中启动服务)")
+    parser.add_argument("--size", choices=list(DECK_SIZES), default="10k", help="本进程启动服务时的词库规模 (默认 10k)")
+    parser.add_argument("--seed", type=int, default=42, help="合成词库和请求序列的随机种子")
+    parser.add_argument("--clients", type=int, default=8, help="并发客户端数 (默认 8)")
+    parser.add_argument("--duration", type=float, default=10.0, help="压测时长 (秒)")
+    parser.add_argument("--db-workers", type=int, default=Constants.SERVER_DB_WORKERS, help="数据库线程池大小")
+    parser.add_argument("--output", help="结果文件路径 (默认 benchmarks/results/load_<时间>_<提交>.json)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    # 不逐条记录请求日志
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    if httpx is None:
+        print("跳过压力测试: 需要安装 httpx (pip install httpx)")
+        return EXIT_SKIPPED
+
+    if args.url:
+        data = asyncio.run(run_load(args.url, args.clients, args.duration, args.seed))
+    else:
+        try:
+            import uvicorn  # noqa: F401
+        except ImportError:
+            print("跳过压力测试: 需要安装 uvicorn 和 starlette (pip install uvicorn starlette)")
+            return EXIT_SKIPPED
+        deck = get_deck(args.size, DECK_DIR, args.seed)
+        work_dir = tempfile.mkdtemp(prefix="load_test_")
+        try:
+            db_path = os.path.join(work_dir, "words.db")
+            shutil.copyfile(deck, db_path)
+            with InProcessServer(db_path, args.db_workers) as server:
+                data = asyncio.run(run_load(server.url, args.clients, args.duration, args.seed))
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    summary = data['summary']
+    print(f"{'接口':<16}  {'次数':>7}  {'出错':>5}  {'p50(ms)':>9}  {'p95(ms)':>9}  {'p99(ms)':>9}")
+    for name, r in data['endpoints'].items():
+        print(f"{name:<16}  {r['count']:>7}  {r['errors']:>5}  {r['p50_s'] * 1000:>9.2f}  "
+              f"{r['p95_s'] * 1000:>9.2f}  {r['p99_s'] * 1000:>9.2f}")
+    print(f"\n{args.clients} 个客户端，{summary['elapsed_s']:.1f} 秒内完成 {summary['requests']} 个请求 "
+          f"({summary['throughput_rps']:.1f} 请求/秒)\n")
+
+    server = data.pop('server')
+    timers = {name: t for name, t in server.get('timers', {}).items()
+              if name.startswith("request.") or name.startswith("server.")}
+    counters = {name: c for name, c in server.get('counters', {}).items() if name.startswith("request.")}
+    print("服务端指标:")
+    print(format_metrics({'timers': timers, 'counters': counters}))
+
+    data['meta'] = {
+        'commit': git_commit(),
+        'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'url': args.url,
+        'size': None if args.url else args.size,
+        'clients': args.clients,
+        'db_workers': None if args.url else args.db_workers,
+    }
+    output = args.output
+    if not output:
+        stamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        output = os.path.join(RESULTS_DIR, f"load_{stamp}_{data['meta']['commit']}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    print(f"\n结果已保存: {output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+服务层性能基准测试
+在 1k/10k/100k/1M 规模的合成词库上测量常用服务调用的耗时，结果保存为 JSON 便于在提交之间对比
+
+用法:
+    python benchmarks/run_benchmarks.py --sizes 1k 10k
+    python benchmarks/run_benchmarks.py --compare benchmarks/results/old.json benchmarks/results/new.json
+"""
+
+import argparse
+import datetime
+import json
+import logging
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BENCH_DIR)
+
+# 添加src目录到Python路径
+sys.path.insert(0, os.path.join(ROOT_DIR, 'src'))
+
+from synthetic_deck import DECK_SIZES, get_deck
+from core.word_manager import WordManager
+from core.query_trace import query_context, query_tracer
+
+DECK_DIR = os.path.join(BENCH_DIR, ".decks")
+RESULTS_DIR = os.path.join(BENCH_DIR, "results")
+
+# 每轮批量导入的单词数
+IMPORT_BATCH = 1000
+
+# 对比时耗时增加超过该比例视为性能回退
+REGRESSION_THRESHOLD = 0.10
+
+
+class BenchmarkCase:
+    """一个基准测试用例
+
+    setup(manager, rng) 返回本轮调用所需的参数，不计入耗时；
+    run(manager, args) 是被测量的调用
+    """
+
+    def __init__(self, name, run, setup=None):
+        self.name = name
+        self.run = run
+        self.setup = setup or (lambda manager, rng: None)
+
+
+def _sample_word(manager, rng):
+    """随机选取一个已有单词 (按 id 直接查询，不经过被测的服务)"""
+    with manager.db.engine.connect() as conn:
+        count = conn.exec_driver_sql("SELECT MAX(id) FROM words").scalar() or 1
+        word = conn.exec_driver_sql("SELECT word FROM words WHERE id >= ? ORDER BY id LIMIT 1",
+                                    (rng.randint(1, count),)).scalar()
+    return word
+
+
+def _import_batch(manager, rng):
+    """生成一批新单词"""
+    base = rng.getrandbits(48)
+    return [(f"zzimport{base:x}{i}", "批量导入", f"Imported word {i}.", "") for i in range(IMPORT_BATCH)]
+
+
+def _bulk_import(manager, rows):
+    """逐个添加单词 (与界面和命令行的导入路径一致)"""
+    for word, meaning, example, phonetic in rows:
+        manager.add_word_direct(word, meaning, example, phonetic)
+
+
+CASES = [
+    BenchmarkCase("get_all_words", lambda m, _: m.get_all_words()),
+    BenchmarkCase("list_word_rows", lambda m, _: m.list_word_rows()),
+    BenchmarkCase("search_words", lambda m, _: m.search_words("ab")),
+    BenchmarkCase("get_words_for_review", lambda m, _: m.get_words_for_review()),
+    BenchmarkCase("update_review_status", lambda m, word: m.update_review_status(word, 4), _sample_word),
+    BenchmarkCase("get_overview_stats", lambda m, _: m.get_statistics()),
+    BenchmarkCase("get_recent_activity", lambda m, _: m.get_recent_activity(30)),
+    BenchmarkCase("bulk_import", _bulk_import, _import_batch),
+]
+
+
+def run_case(manager, case: BenchmarkCase, repeat: int, seed: int) -> dict:
+    """执行一个用例 (先预热一次)，返回耗时和查询数统计"""
+    rng = random.Random(seed)
+    case.run(manager, case.setup(manager, rng))
+
+    timings = []
+    query_tracer.reset()
+    for _ in range(repeat):
+        args = case.setup(manager, rng)
+        with query_context(f"bench.{case.name}"):
+            start = time.perf_counter()
+            case.run(manager, args)
+            timings.append(time.perf_counter() - start)
+    operation = query_tracer.snapshot()['operations'].get(f"bench.{case.name}", {})
+    return {
+        'repeat': repeat,
+        'min_s': min(timings),
+        'median_s': statistics.median(timings),
+        'mean_s': statistics.fmean(timings),
+        'max_s': max(timings),
+        'queries_per_call': operation.get('avg_queries', 0.0),
+    }
+
+
+def run_size(size_name: str, repeat: int, seed: int, cases) -> dict:
+    """在一个规模的词库副本上执行所有用例 (部分用例会写入数据，不修改缓存的词库)"""
+    deck = get_deck(size_name, DECK_DIR, seed)
+    results = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_path = os.path.join(temp_dir, "words.db")
+        shutil.copyfile(deck, db_path)
+        manager = WordManager(db_path=db_path)
+        try:
+            for case in cases:
+                result = run_case(manager, case, repeat, seed)
+                results[case.name] = result
+                print(f"  {size_name:>4}  {case.name:<22} median {result['median_s'] * 1000:>10.2f}ms  "
+                      f"min {result['min_s'] * 1000:>10.2f}ms  queries {result['queries_per_call']:.1f}")
+        finally:
+            manager.db.engine.dispose()
+    return results
+
+
+def git_commit() -> str:
+    """当前提交的哈希 (工作区有改动时加 -dirty)"""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_DIR,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=ROOT_DIR,
+                               capture_output=True, text=True, check=True).stdout.strip()
+        return commit + ("-dirty" if dirty else "")
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(base: dict, new: dict, threshold: float = REGRESSION_THRESHOLD, key: str = 'median_s',
+            floor: float = 0.0) -> bool:
+    """打印两次结果的中位数对比
+
+    Args:
+        base: 基准结果
+        new: 当前结果
+        threshold: 视为回退的增幅
+        key: 对比的指标 (秒)
+        floor: 计算比例时指标的下限 (秒)，低于下限的波动不视为回退
+
+    Returns:
+        是否存在性能回退
+    """
+    print(f"基准: {base['meta'].get('commit')}  对比: {new['meta'].get('commit')}")
+    print(f"{'规模':>6}  {'用例':<22}  {'基准(ms)':>10}  {'当前(ms)':>10}  {'比例':>7}")
+    regressed = False
+    for size_name, cases in new['results'].items():
+        for name, result in cases.items():
+            old = base['results'].get(size_name, {}).get(name)
+            if not old:
+                continue
+            old_value, new_value = max(old[key], floor), max(result[key], floor)
+            ratio = new_value / old_value if old_value else float('inf')
+            flag = ""
+            if ratio > 1 + threshold:
+                flag = "  <- 回退"
+                regressed = True
+            elif ratio < 1 - threshold:
+                flag = "  <- 提升"
+            print(f"{size_name:>6}  {name:<22}  {old[key] * 1000:>10.2f}  "
+                  f"{result[key] * 1000:>10.2f}  {ratio:>6.2f}x{flag}")
+    return regressed
+
+
+def load_results(path: str) -> dict:
+    """读取结果文件"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="服务层性能基准测试")
+    parser.add_argument("--sizes", nargs="+", choices=list(DECK_SIZES), default=["1k", "10k"],
+                        help="词库规模 (默认 1k 10k)")
+    parser.add_argument("--cases", nargs="+", choices=[case.name for case in CASES],
+                        help="只运行指定用例")
+    parser.add_argument("--repeat", type=int, default=5, help="每个用例的测量次数")
+    parser.add_argument("--seed", type=int, default=42, help="合成词库的随机种子")
+    parser.add_argument("--output", help="结果文件路径 (默认 benchmarks/results/<时间>_<提交>.json)")
+    parser.add_argument("--compare", nargs="+", metavar="JSON",
+                        help="对比结果: 给出一个文件时与本次运行对比，给出两个文件时只对比文件")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+
+    if args.compare and len(args.compare) >= 2:
+        return 1 if compare(load_results(args.compare[0]), load_results(args.compare[1])) else 0
+
+    cases = [case for case in CASES if not args.cases or case.name in args.cases]
+    data = {
+        'meta': {
+            'commit': git_commit(),
+            'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'seed': args.seed,
+        },
+        'results': {},
+    }
+    for size_name in args.sizes:
+        data['results'][size_name] = run_size(size_name, args.repeat, args.seed, cases)
+
+    output = args.output
+    if not output:
+        stamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        output = os.path.join(RESULTS_DIR, f"{stamp}_{data['meta']['commit']}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    print(f"结果已保存: {output}")
+
+    if args.compare:
+        return 1 if compare(load_results(args.compare[0]), data) else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
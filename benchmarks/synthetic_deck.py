@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+合成词库生成器
+按固定随机种子生成指定规模的单词和复习历史，用于性能基准测试
+"""
+
+import os
+import random
+import sqlite3
+import string
+import sys
+import datetime
+
+# 添加src目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from core.database import Database
+
+# 与 SQLAlchemy 在 SQLite 中保存 DateTime 的格式一致
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+
+# 基准测试使用的词库规模
+DECK_SIZES = {"1k": 1_000, "10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+
+MEANINGS = ["苹果", "快速的", "理解", "环境", "重要的", "发展", "经验", "问题", "机会", "影响",
+            "结构", "过程", "关系", "能力", "资源", "目标", "方法", "结果", "条件", "价值"]
+CATEGORIES = ["默认", "CET4", "CET6", "考研", "托福"]
+
+# 每次批量写入的行数
+BATCH_SIZE = 10_000
+
+
+def _make_word(rng: random.Random, index: int) -> str:
+    """生成不重复的伪单词: 随机字母 + 序号的字母编码"""
+    stem = "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 7)))
+    suffix = ""
+    n = index
+    while True:
+        n, r = divmod(n, 26)
+        suffix += string.ascii_lowercase[r]
+        if n == 0:
+            break
+    return stem + suffix
+
+
+def _generate_rows(size: int, seed: int, now: datetime.datetime):
+    """产出 (单词行, 复习历史行列表)"""
+    rng = random.Random(seed)
+    for index in range(size):
+        word = _make_word(rng, index)
+        added = now - datetime.timedelta(days=rng.randint(0, 365), seconds=rng.randint(0, 86399))
+        reviewed = rng.random() < 0.6
+        review_count = rng.randint(1, 8) if reviewed else 0
+        history = []
+        last_review = None
+        if reviewed:
+            span = max((now - added).days, 1)
+            dates = sorted(added + datetime.timedelta(days=rng.randint(0, span), seconds=rng.randint(0, 86399))
+                           for _ in range(review_count))
+            dates = [min(d, now) for d in dates]
+            history = [(d.strftime(DATETIME_FORMAT), rng.randint(0, 5)) for d in dates]
+            last_review = dates[-1]
+        interval = rng.choice([0, 1, 2, 4, 7, 15, 30]) if reviewed else 0
+        next_review = (last_review or added) + datetime.timedelta(days=interval, hours=rng.randint(-48, 48))
+        meaning = "，".join(rng.sample(MEANINGS, rng.randint(1, 3)))
+        row = (
+            word, f"/{word}/", meaning, f"This is an example sentence for {word}.",
+            rng.choice(CATEGORIES), added.strftime(DATETIME_FORMAT),
+            last_review.strftime(DATETIME_FORMAT) if last_review else None,
+            next_review.strftime(DATETIME_FORMAT), review_count,
+            rng.randint(1, 5) if reviewed else 0, round(rng.uniform(1.3, 2.8), 2), interval,
+        )
+        yield row, history
+
+
+def deck_anchor(day: datetime.date = None) -> datetime.datetime:
+    """生成数据的基准时间 (当天中午)，最近活动、到期预测等查询才能命中数据"""
+    day = day or datetime.date.today()
+    return datetime.datetime.combine(day, datetime.time(12))
+
+
+def generate_deck(db_path: str, size: int, seed: int = 42, anchor: datetime.datetime = None) -> str:
+    """生成合成词库
+
+    通过 Database 创建表结构 (与应用一致)，再用 sqlite3 批量写入数据，
+    最后执行数据库迁移 (回填复习日志等)，与升级后的已有词库一致
+
+    Args:
+        db_path: 数据库文件路径 (已存在时覆盖)
+        size: 单词数
+        seed: 随机种子，相同种子和基准时间生成相同的数据
+        anchor: 基准时间，添加和复习时间分布在它之前的一年内 (默认当天中午)
+
+    Returns:
+        数据库文件路径
+    """
+    if os.path.exists(db_path):
+        os.remove(db_path)
+    os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+    database = Database(db_path, migrate=False)
+    database.engine.dispose()
+
+    now = anchor or deck_anchor()
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute("PRAGMA journal_mode=OFF")
+        conn.execute("PRAGMA synchronous=OFF")
+        words, histories = [], []
+        word_id = 0
+        for row, history in _generate_rows(size, seed, now):
+            word_id += 1
+            words.append((word_id,) + row)
+            histories.extend((word_id, date, quality) for date, quality in history)
+            if len(words) >= BATCH_SIZE:
+                _flush(conn, words, histories)
+        _flush(conn, words, histories)
+        conn.commit()
+    finally:
+        conn.close()
+
+    database = Database(db_path)
+    database.engine.dispose()
+    return db_path
+
+
+def _flush(conn, words, histories):
+    """批量写入并清空缓冲"""
+    conn.executemany(
+        "INSERT INTO words (id, word, phonetic, meaning, example, category, added_date, last_review, "
+        "next_review, review_count, mastery_level, easiness_factor, interval) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", words)
+    conn.executemany("INSERT INTO review_history (word_id, review_date, quality) VALUES (?, ?, ?)", histories)
+    words.clear()
+    histories.clear()
+
+
+def get_deck(size_name: str, deck_dir: str, seed: int = 42) -> str:
+    """获取指定规模的词库文件，不存在时生成 (按规模、种子和基准日期缓存)"""
+    anchor = deck_anchor()
+    path = os.path.join(deck_dir, f"deck_{size_name}_{seed}_{anchor:%Y%m%d}.db")
+    if not os.path.exists(path):
+        print(f"正在生成 {size_name} 词库: {path}")
+        generate_deck(path + ".part", DECK_SIZES[size_name], seed, anchor)
+        os.replace(path + ".part", path)
+    return path
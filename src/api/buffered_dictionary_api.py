@@ -11,9 +11,15 @@ import os
 import threading
 import time
 from collections import deque
-from typing import Dict, Optional, List
+from concurrent.futures import Future
+from typing import Container, Dict, Optional, List
 from .dictionary_api import DictionaryAPI
+from .offline_pack import OfflineDictionaryPack
+from .vocabulary_index import get_vocabulary_index
 from core.constants import Constants
+from core.exceptions import TaskRejectedError
+from core.task_scheduler import get_task_scheduler
+from utils.decorators import counted, timed
 
 # 配置日志
 logging.basicConfig(level=logging.INFO)
@@ -23,18 +29,23 @@ logger = logging.getLogger(__name__)
 class BufferedDictionaryAPI:
     """带缓存的字典API客户端"""
     
-    def __init__(self, cache_file: str = "data/dictionary_cache.json", max_cache_size: int = 1000):
+    def __init__(self, cache_file: str = "data/dictionary_cache.json", max_cache_size: int = 1000,
+                 pack_file: str = "data/dictionary_pack.db"):
         """初始化缓冲字典API客户端
         
         Args:
             cache_file: 缓存文件路径
             max_cache_size: 最大缓存大小
+            pack_file: 离线词典包路径，存在时优先于网络查询
         """
         self.dictionary_api = DictionaryAPI()
         self.cache_file = cache_file
         self.max_cache_size = max_cache_size
         self.cache = {}
         self.cache_lock = threading.Lock()
+        # 缓存写盘在 io 队列中执行，已有待执行的保存时不再重复提交
+        self._save_lock = threading.Lock()
+        self._save_pending = False
         
         # API请求限流
         self.request_times = deque(maxlen=10)  # 记录最近10次请求时间
@@ -44,6 +55,12 @@ class BufferedDictionaryAPI:
         # 加载缓存
         self._load_cache()
         
+        # 加载离线词典包 (由 build-pack 命令生成)
+        self.offline_pack = OfflineDictionaryPack.open(pack_file)
+        
+        # 最近一次前台查询时间 (后台预热据此让路)
+        self.last_foreground_request = 0.0
+        
         # 预加载队列
         self.preload_queue = []
         self.preload_thread = None
@@ -53,6 +70,7 @@ class BufferedDictionaryAPI:
         self.stats = {
             'cache_hits': 0,
             'cache_misses': 0,
+            'pack_hits': 0,
             'total_requests': 0
         }
     
@@ -73,14 +91,32 @@ class BufferedDictionaryAPI:
     
     def _save_cache(self):
         """保存缓存到文件"""
+        with self._save_lock:
+            self._save_pending = False
+            try:
+                with self.cache_lock:
+                    cache_copy = dict(self.cache)
+                with open(self.cache_file, 'w', encoding='utf-8') as f:
+                    json.dump(cache_copy, f, ensure_ascii=False, indent=2)
+                logger.info("缓存已保存")
+            except Exception as e:
+                logger.error(f"保存缓存失败: {e}")
+    
+    def _schedule_save(self):
+        """异步保存缓存，调用方不能持有 cache_lock"""
+        if self._save_pending:
+            return
+        self._save_pending = True
         try:
-            with self.cache_lock:
-                cache_copy = dict(self.cache)
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_copy, f, ensure_ascii=False, indent=2)
-            logger.info("缓存已保存")
-        except Exception as e:
-            logger.error(f"保存缓存失败: {e}")
+            get_task_scheduler().submit('io', self._save_cache)
+        except TaskRejectedError:
+            # 调度器已关闭 (如程序退出中)，直接保存
+            self._save_cache()
+    
+    def flush(self):
+        """如有未写盘的缓存修改则立即保存"""
+        if self._save_pending:
+            self._save_cache()
     
     def _clean_cache(self):
         """清理缓存，保留最近使用的单词"""
@@ -101,144 +137,204 @@ class BufferedDictionaryAPI:
                 time.sleep(sleep_time)
             self.request_times.append(time.time())
     
-    def get_word_info(self, word: str) -> Optional[Dict]:
+    @timed("api")
+    def get_word_info(self, word: str, translate: bool = False, background: bool = False) -> Optional[Dict]:
         """获取单词信息（带缓存和限流）
         
         Args:
             word: 要查询的单词
+            translate: 是否同步获取中文释义，默认只返回英文结果
+            background: 是否为后台预加载请求 (不计入前台活动)
             
         Returns:
             包含单词信息的字典，如果查询失败则返回None
         """
+        if not background:
+            self.last_foreground_request = time.monotonic()
         self.stats['total_requests'] += 1
         
         # 检查缓存
         cache_key = word.lower()
+        word_info = None
         with self.cache_lock:
             if cache_key in self.cache:
                 # 更新访问时间
                 self.cache[cache_key]['last_accessed'] = time.time()
                 self.stats['cache_hits'] += 1
                 logger.info(f"缓存命中: {word}")
-                return self.cache[cache_key]['data']
+                word_info = self.cache[cache_key]['data']
         
-        # 缓存未命中，从API获取（限流检查）
-        self.stats['cache_misses'] += 1
-        logger.info(f"缓存未命中，从API获取: {word}")
+        if word_info is None:
+            word_info = self._get_from_pack(cache_key)
         
-        # 限流检查
-        self._rate_limit_check()
+        if word_info is None:
+            # 缓存未命中，从API获取（限流检查）
+            self.stats['cache_misses'] += 1
+            logger.info(f"缓存未命中，从API获取: {word}")
+            
+            # 限流检查
+            self._rate_limit_check()
+            
+            word_info = self.dictionary_api.get_word_info(word)
+            
+            if word_info:
+                # 保存到缓存
+                with self.cache_lock:
+                    self.cache[cache_key] = {
+                        'data': word_info,
+                        'last_accessed': time.time(),
+                        'cached_at': time.time()
+                    }
+                    self._clean_cache()
+                # 异步保存缓存
+                self._schedule_save()
         
-        word_info = self.dictionary_api.get_word_info(word)
+        if word_info and translate:
+            self.translate_meanings(word_info)
         
-        if word_info:
-            # 保存到缓存
-            with self.cache_lock:
+        return word_info
+    
+    @counted("api")
+    def is_cached(self, word: str) -> bool:
+        """单词是否已在缓存或离线词典包中"""
+        cache_key = word.lower()
+        with self.cache_lock:
+            if cache_key in self.cache:
+                return True
+        return bool(self.offline_pack) and cache_key in self.offline_pack
+    
+    def _get_from_pack(self, cache_key: str) -> Optional[Dict]:
+        """从离线词典包查询"""
+        if not self.offline_pack:
+            return None
+        try:
+            word_info = self.offline_pack.get(cache_key)
+        except Exception as e:
+            logger.error(f"查询离线词典包失败: {e}")
+            return None
+        if word_info is not None:
+            self.stats['pack_hits'] += 1
+            logger.info(f"离线词典包命中: {cache_key}")
+        return word_info
+    
+    @timed("api")
+    def translate_meanings(self, word_info: Dict) -> List[Dict]:
+        """获取中文释义（已缓存则直接返回，否则翻译后写回缓存）
+        
+        Args:
+            word_info: get_word_info 返回的单词信息字典
+            
+        Returns:
+            中文释义列表
+        """
+        if word_info.get('chinese_meanings'):
+            return word_info['chinese_meanings']
+        
+        chinese_meanings = self.dictionary_api.translate_meanings(word_info)
+        self._store_translation(word_info, chinese_meanings)
+        return chinese_meanings
+    
+    def translate_meanings_async(self, word_info: Dict) -> Future:
+        """在后台线程中获取中文释义
+        
+        Args:
+            word_info: get_word_info 返回的单词信息字典
+            
+        Returns:
+            Future，结果为中文释义列表
+        """
+        if word_info.get('chinese_meanings'):
+            future = Future()
+            future.set_result(word_info['chinese_meanings'])
+            return future
+        
+        def on_done(f):
+            if not f.cancelled() and f.exception() is None:
+                self._store_translation(word_info, f.result())
+        
+        future = self.dictionary_api.translate_meanings_async(word_info)
+        future.add_done_callback(on_done)
+        return future
+    
+    def _store_translation(self, word_info: Dict, chinese_meanings: List[Dict]):
+        """将翻译结果写回缓存"""
+        if not chinese_meanings:
+            return
+        cache_key = word_info.get('word', '').lower()
+        with self.cache_lock:
+            if cache_key in self.cache:
+                self.cache[cache_key]['data']['chinese_meanings'] = chinese_meanings
+            else:
+                # 来自离线词典包的条目，翻译后加入缓存以便持久化
                 self.cache[cache_key] = {
                     'data': word_info,
                     'last_accessed': time.time(),
                     'cached_at': time.time()
                 }
                 self._clean_cache()
-                # 异步保存缓存
-                threading.Thread(target=self._save_cache, daemon=True).start()
-        
-        return word_info
+        self._schedule_save()
     
-    def get_random_words_info(self, count: int = 10, vocabulary_level: str = "cet6") -> List[Dict]:
+    @timed("api")
+    def get_random_words_info(self, count: int = 10, vocabulary_level: str = "cet6", translate: bool = False,
+                              exclude: Optional[Container[str]] = None) -> List[Dict]:
         """获取随机单词的信息列表（带缓存优化）
         
         Args:
             count: 要获取的随机单词数量
             vocabulary_level: 词汇级别
+            translate: 是否同时获取中文释义
+            exclude: 需要排除的单词 (如已在词库中的单词)
             
         Returns:
             包含单词信息的字典列表
         """
-        import random
-        
-        # 根据词汇级别选择对应的词汇文件
-        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-        vocabulary_files = {
-            "cet4": os.path.join(base_dir, "data", "cet4_words.txt"),
-            "cet6": os.path.join(base_dir, "data", "cet6_words.txt"), 
-            "gre": os.path.join(base_dir, "data", "gre_words.txt")
-        }
-        
-        # 默认词汇级别为cet6
-        if vocabulary_level not in vocabulary_files:
-            logger.warning(f"未知的词汇级别: {vocabulary_level}，使用默认级别: cet6")
-            vocabulary_level = "cet6"
-        
-        vocabulary_file = vocabulary_files[vocabulary_level]
+        # 从共享的词库索引中随机选择指定数量的单词
+        selected_words = get_vocabulary_index().sample(vocabulary_level, count, exclude)
+        return self.get_words_info(selected_words, translate=translate)
+    
+    @timed("api")
+    def get_words_info(self, words: List[str], translate: bool = False) -> List[Dict]:
+        """批量获取单词信息（先查缓存和离线词典包，其余依次请求）
+
+        调用方已在后台任务 (network 队列) 中执行，这里不再为每次调用创建线程池；
+        网络请求本来就按限流间隔依次发出
         
-        try:
-            # 尝试读取指定级别的词汇文件
-            with open(vocabulary_file, 'r', encoding='utf-8') as f:
-                vocabulary_words = [line.strip() for line in f.readlines() if line.strip()]
-            logger.info(f"成功加载 {vocabulary_level.upper()} 词汇，共 {len(vocabulary_words)} 个单词")
-            
-        except FileNotFoundError:
-            # 如果找不到指定级别的词汇文件，尝试使用其他级别的文件作为备选
-            logger.warning(f"未找到 {vocabulary_level.upper()} 词汇文件: {vocabulary_file}")
-            
-            # 备选方案：按优先级尝试其他词汇文件
-            fallback_levels = ["cet6", "cet4", "gre"]
-            vocabulary_words = None
-            
-            for level in fallback_levels:
-                if level != vocabulary_level:
-                    fallback_file = vocabulary_files[level]
-                    try:
-                        with open(fallback_file, 'r', encoding='utf-8') as f:
-                            vocabulary_words = [line.strip() for line in f.readlines() if line.strip()]
-                        logger.info(f"使用备选词汇级别: {level.upper()}，共 {len(vocabulary_words)} 个单词")
-                        break
-                    except FileNotFoundError:
-                        continue
+        Args:
+            words: 要查询的单词列表
+            translate: 是否同时获取中文释义
             
-            # 如果所有词汇文件都找不到，使用默认词汇列表
-            if vocabulary_words is None:
-                logger.warning("未找到任何词汇文件，使用默认词汇列表")
-                vocabulary_words = [
-                    "ability", "able", "about", "above", "accept", "according", "account", "across", "act", "action"
-                ]
-        
-        # 随机选择指定数量的单词
-        selected_words = random.sample(vocabulary_words, min(count, len(vocabulary_words)))
-        
+        Returns:
+            包含单词信息的字典列表 (查询失败的单词不包含在内)
+        """
         # 优化：先检查缓存中已有的单词
         cached_words = []
         uncached_words = []
         
-        for word in selected_words:
+        for word in words:
             cache_key = word.lower()
             with self.cache_lock:
-                if cache_key in self.cache:
-                    self.cache[cache_key]['last_accessed'] = time.time()
-                    cached_words.append(self.cache[cache_key]['data'])
-                else:
-                    uncached_words.append(word)
+                cached = self.cache.get(cache_key)
+                if cached:
+                    cached['last_accessed'] = time.time()
+                    cached_words.append(cached['data'])
+                    continue
+            pack_info = self._get_from_pack(cache_key)
+            if pack_info is not None:
+                cached_words.append(pack_info)
+            else:
+                uncached_words.append(word)
         
-        # 并行获取未缓存的单词信息
-        word_infos = cached_words.copy()
+        if translate:
+            for word_info in cached_words:
+                self.translate_meanings(word_info)
         
-        if uncached_words:
+        word_infos = cached_words.copy()
+        if len(uncached_words) > 1:
             logger.info(f"需要从API获取 {len(uncached_words)} 个单词的信息")
-            
-            # 使用线程池并行获取
-            import concurrent.futures
-            
-            def fetch_word_info(word):
-                return self.get_word_info(word)
-            
-            with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
-                future_to_word = {executor.submit(fetch_word_info, word): word for word in uncached_words}
-                
-                for future in concurrent.futures.as_completed(future_to_word):
-                    word_info = future.result()
-                    if word_info:
-                        word_infos.append(word_info)
+        for word in uncached_words:
+            word_info = self.get_word_info(word, translate=translate)
+            if word_info:
+                word_infos.append(word_info)
         
         return word_infos
     
@@ -272,15 +368,13 @@ class BufferedDictionaryAPI:
         while self.preload_running and self.preload_queue:
             word = self.preload_queue.pop(0)
             
-            # 检查是否已在缓存中
-            cache_key = word.lower()
-            with self.cache_lock:
-                if cache_key in self.cache:
-                    continue
+            # 检查是否已在缓存或离线词典包中
+            if self.is_cached(word):
+                continue
             
             # 预加载单词信息
             try:
-                self.get_word_info(word)
+                self.get_word_info(word, background=True)
                 time.sleep(0.1)  # 避免过于频繁的请求
             except Exception as e:
                 logger.error(f"预加载单词 '{word}' 时发生错误: {e}")
@@ -293,7 +387,8 @@ class BufferedDictionaryAPI:
         """
         stats = self.stats.copy()
         stats['cache_size'] = len(self.cache)
-        stats['cache_hit_rate'] = (stats['cache_hits'] / stats['total_requests'] * 100 
+        stats['pack_size'] = len(self.offline_pack) if self.offline_pack else 0
+        stats['cache_hit_rate'] = ((stats['cache_hits'] + stats['pack_hits']) / stats['total_requests'] * 100 
                                   if stats['total_requests'] > 0 else 0)
         return stats
     
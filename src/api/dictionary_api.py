@@ -10,7 +10,11 @@ import json
 import logging
 import time
 import os
-from typing import Dict, Optional, List
+from concurrent.futures import Future
+from typing import Container, Dict, Optional, List
+from .vocabulary_index import get_vocabulary_index
+from core.task_scheduler import get_task_scheduler
+from utils.decorators import timed
 
 # 导入翻译API
 try:
@@ -40,11 +44,15 @@ class DictionaryAPI:
         else:
             self.translation_api = None
     
-    def get_word_info(self, word: str) -> Optional[Dict]:
+    @timed("http")
+    def get_word_info(self, word: str, translate: bool = False) -> Optional[Dict]:
         """获取单词信息
         
+        默认只返回英文结果，中文释义通过 translate_meanings 按需获取
+        
         Args:
             word: 要查询的单词
+            translate: 是否同步获取中文释义
             
         Returns:
             包含单词信息的字典，如果查询失败则返回None
@@ -62,6 +70,8 @@ class DictionaryAPI:
                     data = response.json()
                     result = self._parse_response(data[0])
                     logger.info(f"成功获取单词 '{word}' 的信息")
+                    if translate:
+                        self.translate_meanings(result)
                     return result
                 if response.status_code == 404:
                     logger.warning(f"未找到单词 '{word}' 的定义")
@@ -100,14 +110,14 @@ class DictionaryAPI:
             data: API返回的原始数据
             
         Returns:
-            解析后的单词信息字典
+            解析后的单词信息字典（中文释义留空，由 translate_meanings 填充）
         """
         word_info = {
             "word": data.get("word", ""),
             "phonetic": "",
             "meanings": [],
             "examples": [],
-            "chinese_meanings": []  # 添加中文释义字段
+            "chinese_meanings": []  # 中文释义字段，按需翻译
         }
         
         # 获取音标
@@ -138,121 +148,92 @@ class DictionaryAPI:
                     if example:
                         word_info["examples"].append(example)
         
-        # 尝试获取中文释义
-        if self.translation_api and word_info["meanings"]:
+        return word_info
+    
+    @timed("api")
+    def translate_meanings(self, word_info: Dict) -> List[Dict]:
+        """翻译前几个英文释义，结果写回 word_info["chinese_meanings"]
+        
+        Args:
+            word_info: get_word_info 返回的单词信息字典
+            
+        Returns:
+            中文释义列表，翻译不可用或失败时返回空列表
+        """
+        if word_info.get("chinese_meanings"):
+            return word_info["chinese_meanings"]
+        
+        chinese_meanings = []
+        if self.translation_api and word_info.get("meanings"):
             try:
                 # 翻译前几个释义
-                for i, meaning_info in enumerate(word_info["meanings"][:3]):
+                for meaning_info in word_info["meanings"][:3]:
                     english_definition = meaning_info["definition"]
                     chinese_translation = self.translation_api.translate_to_chinese(english_definition)
                     if chinese_translation:
-                        word_info["chinese_meanings"].append({
+                        chinese_meanings.append({
                             "part_of_speech": meaning_info["part_of_speech"],
                             "definition": chinese_translation
                         })
             except Exception as e:
                 logger.error(f"翻译释义时发生错误: {e}")
         
-        return word_info
+        word_info["chinese_meanings"] = chinese_meanings
+        return chinese_meanings
+    
+    def translate_meanings_async(self, word_info: Dict) -> Future:
+        """在后台任务调度器的 network 队列中翻译释义
+        
+        Args:
+            word_info: get_word_info 返回的单词信息字典
+            
+        Returns:
+            Future，结果为中文释义列表
+            
+        Raises:
+            TaskRejectedError: 队列已满或调度器已关闭
+        """
+        return get_task_scheduler().submit('network', self.translate_meanings, word_info)
     
-    def get_random_words_info(self, count: int = 10, vocabulary_level: str = "cet6") -> List[Dict]:
+    @timed("api")
+    def get_random_words_info(self, count: int = 10, vocabulary_level: str = "cet6", translate: bool = False,
+                              exclude: Optional[Container[str]] = None) -> List[Dict]:
         """
         获取随机单词的信息列表
         
         Args:
             count: 要获取的随机单词数量
             vocabulary_level: 词汇级别，可选值: "cet4", "cet6", "gre"
+            translate: 是否同时获取中文释义
+            exclude: 需要排除的单词 (如已在词库中的单词)
             
         Returns:
             包含单词信息的字典列表
         """
-        import random
-        
-        # 根据词汇级别选择对应的词汇文件
-        base_dir = os.path.dirname(os.path.dirname(__file__))
-        vocabulary_files = {
-            "cet4": os.path.join(base_dir, "data", "cet4_words.txt"),
-            "cet6": os.path.join(base_dir, "data", "cet6_words.txt"),
-            "gre": os.path.join(base_dir, "data", "gre_words.txt")
-        }
-        
-        # 默认词汇级别为cet6
-        if vocabulary_level not in vocabulary_files:
-            logger.warning(f"未知的词汇级别: {vocabulary_level}，使用默认级别: cet6")
-            vocabulary_level = "cet6"
-        
-        vocabulary_file = vocabulary_files[vocabulary_level]
+        # 从共享的词库索引中随机选择指定数量的单词
+        selected_words = get_vocabulary_index().sample(vocabulary_level, count, exclude)
+        return self.get_words_info(selected_words, translate=translate)
+    
+    @timed("api")
+    def get_words_info(self, words: List[str], translate: bool = False) -> List[Dict]:
+        """
+        批量获取单词信息
         
-        try:
-            # 尝试读取指定级别的词汇文件
-            with open(vocabulary_file, 'r', encoding='utf-8') as f:
-                vocabulary_words = [line.strip() for line in f.readlines() if line.strip()]
-            logger.info(f"成功加载 {vocabulary_level.upper()} 词汇，共 {len(vocabulary_words)} 个单词")
-            
-        except FileNotFoundError:
-            # 如果找不到指定级别的词汇文件，尝试使用其他级别的文件作为备选
-            logger.warning(f"未找到 {vocabulary_level.upper()} 词汇文件: {vocabulary_file}")
-            
-            # 备选方案：按优先级尝试其他词汇文件
-            fallback_levels = ["cet6", "cet4", "gre"]
-            vocabulary_words = None
-            
-            for level in fallback_levels:
-                if level != vocabulary_level:
-                    fallback_file = vocabulary_files[level]
-                    try:
-                        with open(fallback_file, 'r', encoding='utf-8') as f:
-                            vocabulary_words = [line.strip() for line in f.readlines() if line.strip()]
-                        logger.info(f"使用备选词汇级别: {level.upper()}，共 {len(vocabulary_words)} 个单词")
-                        break
-                    except FileNotFoundError:
-                        continue
+        Args:
+            words: 要查询的单词列表
+            translate: 是否同时获取中文释义
             
-            # 如果所有词汇文件都找不到，使用默认词汇列表
-            if vocabulary_words is None:
-                logger.warning("未找到任何词汇文件，使用默认词汇列表")
-                vocabulary_words = [
-                    "ability", "able", "about", "above", "accept", "according", "account", "across", "act", "action",
-                    "activity", "actually", "add", "address", "administration", "admit", "adult", "affect", "after",
-                    "again", "against", "age", "agency", "agent", "ago", "agree", "agreement", "ahead", "air",
-                    "all", "allow", "almost", "alone", "along", "already", "also", "although", "always", "American",
-                    "among", "amount", "analysis", "and", "animal", "another", "answer", "any", "anyone", "anything",
-                    "appear", "apply", "approach", "area", "argue", "arm", "around", "arrive", "art", "article",
-                    "artist", "as", "ask", "assume", "at", "attack", "attention", "attorney", "audience", "author",
-                    "authority", "available", "avoid", "away", "baby", "back", "bad", "bag", "ball", "bank",
-                    "bar", "base", "be", "beat", "beautiful", "because", "become", "bed", "before", "begin",
-                    "behavior", "behind", "believe", "benefit", "best", "better", "between", "beyond", "big", "bill",
-                    "billion", "bit", "black", "blood", "blue", "board", "body", "book", "born", "both",
-                    "box", "boy", "break", "bring", "brother", "budget", "build", "building", "business", "but",
-                    "buy", "by", "call", "camera", "campaign", "can", "cancer", "candidate", "capital", "car",
-                    "card", "care", "career", "carry", "case", "catch", "cause", "cell", "center", "central",
-                    "century", "certain", "certainly", "chair", "challenge", "chance", "change", "character", "charge", "check",
-                    "child", "choice", "choose", "church", "citizen", "city", "civil", "claim", "class", "clear",
-                    "clearly", "close", "coach", "cold", "collection", "college", "color", "come", "commercial", "common",
-                    "community", "company", "compare", "computer", "concern", "condition", "conference", "Congress", "consider", "consumer",
-                    "contain", "continue", "control", "cost", "could", "country", "couple", "course", "court", "cover",
-                    "create", "crime", "cultural", "culture", "cup", "current", "customer", "cut", "dark", "data",
-                    "daughter", "day", "dead", "deal", "death", "debate", "decade", "decide", "decision", "deep",
-                    "defense", "degree", "Democrat", "democratic", "describe", "design", "despite", "detail", "determine", "develop",
-                    "development", "die", "difference", "different", "difficult", "dinner", "direction", "director", "discover", "discuss",
-                    "discussion", "disease", "do", "doctor", "dog", "door", "down", "draw", "dream", "drive",
-                    "drop", "drug", "during", "each", "early", "east", "easy", "eat", "economic", "economy",
-                    "edge", "education", "effect", "effort", "eight", "either", "election", "else", "employee", "end"
-                ]
-        
-        # 随机选择指定数量的单词
-        selected_words = random.sample(vocabulary_words, min(count, len(vocabulary_words)))
-        
-        # 获取每个单词的详细信息
+        Returns:
+            包含单词信息的字典列表 (查询失败的单词不包含在内)
+        """
         word_infos = []
-        for word in selected_words:
-            word_info = self.get_word_info(word)
+        for word in words:
+            word_info = self.get_word_info(word, translate=translate)
             if word_info:
                 word_infos.append(word_info)
         
         return word_infos
 
-
 def demo():
     """演示函数"""
     api = DictionaryAPI()
@@ -260,7 +241,7 @@ def demo():
     # 测试查询单词
     word = "hello"
     print(f"查询单词: {word}")
-    info = api.get_word_info(word)
+    info = api.get_word_info(word, translate=True)
     
     if info:
         print(f"单词: {info['word']}")
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+离线词典包模块
+将词典缓存编译为压缩、带索引的 SQLite 文件，供无网络时直接查询
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Dict, Iterable, Optional
+from utils.decorators import timed
+
+logger = logging.getLogger(__name__)
+
+PACK_FORMAT_VERSION = 1
+
+
+class OfflineDictionaryPack:
+    """只读离线词典包
+
+    每个单词一行 (WITHOUT ROWID 表，按单词主键聚簇)，
+    释义数据以 zlib 压缩后的 JSON 存储
+    """
+
+    def __init__(self, pack_file: str):
+        """打开离线词典包
+
+        Args:
+            pack_file: 词典包文件路径
+        """
+        self.pack_file = pack_file
+        self._lock = threading.Lock()
+        # 只读打开，允许预加载线程等后台线程共享同一连接
+        self._conn = sqlite3.connect(f"file:{pack_file}?mode=ro", uri=True, check_same_thread=False)
+        self._size = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        logger.info(f"成功加载离线词典包，共 {self._size} 个单词")
+
+    @classmethod
+    def open(cls, pack_file: str) -> Optional["OfflineDictionaryPack"]:
+        """打开词典包，文件不存在或损坏时返回 None"""
+        if not pack_file or not os.path.exists(pack_file):
+            return None
+        try:
+            return cls(pack_file)
+        except sqlite3.Error as e:
+            logger.error(f"加载离线词典包失败: {e}")
+            return None
+
+    @timed("api")
+    def get(self, word: str) -> Optional[Dict]:
+        """查询单词信息
+
+        Args:
+            word: 要查询的单词
+
+        Returns:
+            单词信息字典，未收录时返回 None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM entries WHERE word = ?", (word.lower(),)
+            ).fetchone()
+        if row is None:
+            return None
+        return json.loads(zlib.decompress(row[0]).decode('utf-8'))
+
+    def __contains__(self, word: str) -> bool:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM entries WHERE word = ?", (word.lower(),)
+            ).fetchone()
+        return row is not None
+
+    def __len__(self) -> int:
+        return self._size
+
+    def close(self):
+        """关闭词典包"""
+        with self._lock:
+            self._conn.close()
+
+
+def _iter_cache_entries(cache_file: str) -> Iterable:
+    """读取缓存转储文件，产出 (单词, 单词信息) 对"""
+    with open(cache_file, 'r', encoding='utf-8') as f:
+        cache = json.load(f)
+    for word, entry in cache.items():
+        # 兼容 BufferedDictionaryAPI 的缓存格式 {'data': ..., 'last_accessed': ...}
+        data = entry.get('data') if isinstance(entry, dict) and 'data' in entry else entry
+        if data:
+            yield word.lower(), data
+
+
+def build_pack(cache_files: Iterable[str], pack_file: str, merge: bool = True) -> int:
+    """从缓存转储编译离线词典包
+
+    Args:
+        cache_files: 缓存转储文件列表 (dictionary_cache.json 格式)
+        pack_file: 输出的词典包文件路径
+        merge: 是否保留已有词典包中的条目
+
+    Returns:
+        词典包中的单词总数
+    """
+    entries = {}
+
+    if merge:
+        existing = OfflineDictionaryPack.open(pack_file)
+        if existing:
+            with existing._lock:
+                rows = existing._conn.execute("SELECT word, data FROM entries").fetchall()
+            existing.close()
+            entries.update(rows)
+
+    for cache_file in cache_files:
+        count = 0
+        for word, data in _iter_cache_entries(cache_file):
+            payload = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+            entries[word] = zlib.compress(payload, 9)
+            count += 1
+        logger.info(f"从 {cache_file} 读取 {count} 个单词")
+
+    # 先写入临时文件，完成后原子替换，避免读取到写了一半的词典包
+    os.makedirs(os.path.dirname(os.path.abspath(pack_file)), exist_ok=True)
+    tmp_file = pack_file + ".tmp"
+    if os.path.exists(tmp_file):
+        os.remove(tmp_file)
+
+    conn = sqlite3.connect(tmp_file)
+    try:
+        conn.execute("CREATE TABLE entries (word TEXT PRIMARY KEY, data BLOB NOT NULL) WITHOUT ROWID")
+        conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT) WITHOUT ROWID")
+        conn.executemany("INSERT INTO entries (word, data) VALUES (?, ?)", sorted(entries.items()))
+        conn.executemany("INSERT INTO meta (key, value) VALUES (?, ?)", [
+            ("format_version", str(PACK_FORMAT_VERSION)),
+            ("built_at", time.strftime("%Y-%m-%d %H:%M:%S")),
+            ("word_count", str(len(entries))),
+        ])
+        conn.commit()
+        conn.execute("VACUUM")
+    finally:
+        conn.close()
+
+    os.replace(tmp_file, pack_file)
+    logger.info(f"离线词典包已生成: {pack_file}，共 {len(entries)} 个单词")
+    return len(entries)
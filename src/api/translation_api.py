@@ -8,6 +8,7 @@
 import logging
 from typing import Optional
 from deep_translator import GoogleTranslator
+from utils.decorators import timed
 
 # 配置日志
 logging.basicConfig(level=logging.INFO)
@@ -27,6 +28,7 @@ class TranslationAPI:
             logger.error(f"翻译API客户端初始化失败: {e}")
             self.translator = None
     
+    @timed("http")
     def translate_to_chinese(self, text: str) -> Optional[str]:
         """将英文翻译为中文
         
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+词库索引模块
+每个词汇级别只读取一次词库文件，提供随机抽样和成员查询
+"""
+
+import bisect
+import logging
+import os
+import random
+import threading
+from typing import Container, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 找不到任何词库文件时使用的默认词汇列表
+DEFAULT_WORDS = [
+    "ability", "able", "about", "above", "accept", "according", "account", "across", "act", "action",
+    "activity", "actually", "add", "address", "administration", "admit", "adult", "affect", "after",
+    "again", "against", "age", "agency", "agent", "ago", "agree", "agreement", "ahead", "air",
+    "all", "allow", "almost", "alone", "along", "already", "also", "although", "always", "american",
+    "among", "amount", "analysis", "and", "animal", "another", "answer", "any", "anyone", "anything",
+    "appear", "apply", "approach", "area", "argue", "arm", "around", "arrive", "art", "article",
+    "artist", "as", "ask", "assume", "at", "attack", "attention", "attorney", "audience", "author",
+    "authority", "available", "avoid", "away", "baby", "back", "bad", "bag", "ball", "bank",
+    "bar", "base", "be", "beat", "beautiful", "because", "become", "bed", "before", "begin",
+    "behavior", "behind", "believe", "benefit", "best", "better", "between", "beyond", "big", "bill",
+    "billion", "bit", "black", "blood", "blue", "board", "body", "book", "born", "both",
+    "box", "boy", "break", "bring", "brother", "budget", "build", "building", "business", "but",
+    "buy", "by", "call", "camera", "campaign", "can", "cancer", "candidate", "capital", "car",
+    "card", "care", "career", "carry", "case", "catch", "cause", "cell", "center", "central",
+    "century", "certain", "certainly", "chair", "challenge", "chance", "change", "character", "charge", "check",
+    "child", "choice", "choose", "church", "citizen", "city", "civil", "claim", "class", "clear",
+    "clearly", "close", "coach", "cold", "collection", "college", "color", "come", "commercial", "common",
+    "community", "company", "compare", "computer", "concern", "condition", "conference", "congress", "consider", "consumer",
+    "contain", "continue", "control", "cost", "could", "country", "couple", "course", "court", "cover",
+    "create", "crime", "cultural", "culture", "cup", "current", "customer", "cut", "dark", "data",
+    "daughter", "day", "dead", "deal", "death", "debate", "decade", "decide", "decision", "deep",
+    "defense", "degree", "democrat", "democratic", "describe", "design", "despite", "detail", "determine", "develop",
+    "development", "die", "difference", "different", "difficult", "dinner", "direction", "director", "discover", "discuss",
+    "discussion", "disease", "do", "doctor", "dog", "door", "down", "draw", "dream", "drive",
+    "drop", "drug", "during", "each", "early", "east", "easy", "eat", "economic", "economy",
+    "edge", "education", "effect", "effort", "eight", "either", "election", "else", "employee", "end"
+]
+
+
+class VocabularyLevel:
+    """单个级别的词库
+
+    单词统一转为小写、去重并排序后存入元组：
+    按下标随机抽样为 O(1)，成员查询通过二分查找完成
+    """
+
+    def __init__(self, name: str, words):
+        self.name = name
+        self.words: Tuple[str, ...] = tuple(sorted({w.strip().lower() for w in words if w.strip()}))
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def __contains__(self, word: str) -> bool:
+        return self.index_of(word) is not None
+
+    def index_of(self, word: str) -> Optional[int]:
+        """返回单词在词库中的下标，未收录时返回 None"""
+        word = word.lower()
+        i = bisect.bisect_left(self.words, word)
+        if i < len(self.words) and self.words[i] == word:
+            return i
+        return None
+
+    def sample(self, count: int, exclude: Optional[Container[str]] = None) -> List[str]:
+        """随机抽取单词
+
+        Args:
+            count: 要抽取的单词数量
+            exclude: 需要排除的单词 (如已在词库中的单词)，支持 in 查询即可
+
+        Returns:
+            不重复的随机单词列表
+        """
+        total = len(self.words)
+        count = min(count, total)
+        if count <= 0:
+            return []
+        if not exclude:
+            return random.sample(self.words, count)
+
+        # 拒绝采样：随机取下标，跳过已排除的单词，期望 O(k) 次尝试
+        result = []
+        tried = set()
+        max_attempts = 8 * count + 64
+        attempts = 0
+        while len(result) < count and attempts < max_attempts and len(tried) < total:
+            attempts += 1
+            i = random.randrange(total)
+            if i in tried:
+                continue
+            tried.add(i)
+            if self.words[i] not in exclude:
+                result.append(self.words[i])
+
+        if len(result) < count and len(tried) < total:
+            # 排除比例过高时退化为线性扫描剩余单词
+            remaining = [w for i, w in enumerate(self.words) if i not in tried and w not in exclude]
+            result.extend(random.sample(remaining, min(count - len(result), len(remaining))))
+        return result
+
+
+class VocabularyIndex:
+    """词库索引 (各级别按需加载，加载后常驻内存)"""
+
+    LEVEL_FILES = {
+        "cet4": "cet4_words.txt",
+        "cet6": "cet6_words.txt",
+        "gre": "gre_words.txt"
+    }
+    DEFAULT_LEVEL = "cet6"
+    FALLBACK_LEVELS = ["cet6", "cet4", "gre"]
+
+    def __init__(self, data_dir: str = None):
+        """初始化词库索引
+
+        Args:
+            data_dir: 词库文件所在目录，默认为项目根目录下的 data 文件夹
+        """
+        if data_dir is None:
+            base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+            data_dir = os.path.join(base_dir, "data")
+        self.data_dir = data_dir
+        self._levels: Dict[str, VocabularyLevel] = {}
+        self._lock = threading.Lock()
+
+    def _load_file(self, level: str) -> Optional[VocabularyLevel]:
+        """读取指定级别的词库文件，文件不存在时返回 None"""
+        path = os.path.join(self.data_dir, self.LEVEL_FILES[level])
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                vocabulary = VocabularyLevel(level, f)
+        except FileNotFoundError:
+            logger.warning(f"未找到 {level.upper()} 词汇文件: {path}")
+            return None
+        logger.info(f"成功加载 {level.upper()} 词汇，共 {len(vocabulary)} 个单词")
+        return vocabulary
+
+    def get_level(self, level: str) -> VocabularyLevel:
+        """获取指定级别的词库 (首次访问时加载)
+
+        未知级别使用默认级别；词库文件缺失时按优先级使用其他级别，
+        全部缺失时使用内置的默认词汇列表
+        """
+        if level not in self.LEVEL_FILES:
+            logger.warning(f"未知的词汇级别: {level}，使用默认级别: {self.DEFAULT_LEVEL}")
+            level = self.DEFAULT_LEVEL
+
+        vocabulary = self._levels.get(level)
+        if vocabulary is not None:
+            return vocabulary
+
+        with self._lock:
+            if level in self._levels:
+                return self._levels[level]
+
+            vocabulary = self._load_file(level)
+            if vocabulary is None:
+                for fallback in self.FALLBACK_LEVELS:
+                    if fallback != level:
+                        vocabulary = self._levels.get(fallback) or self._load_file(fallback)
+                        if vocabulary is not None:
+                            logger.info(f"使用备选词汇级别: {fallback.upper()}")
+                            break
+            if vocabulary is None:
+                logger.warning("未找到任何词汇文件，使用默认词汇列表")
+                vocabulary = VocabularyLevel(level, DEFAULT_WORDS)
+
+            self._levels[level] = vocabulary
+            return vocabulary
+
+    def sample(self, level: str, count: int, exclude: Optional[Container[str]] = None) -> List[str]:
+        """从指定级别随机抽取单词"""
+        return self.get_level(level).sample(count, exclude)
+
+    def contains(self, level: str, word: str) -> bool:
+        """判断单词是否属于指定级别"""
+        return word in self.get_level(level)
+
+
+class DeckVocabulary:
+    """词库中已有单词在各级别词表中的成员位图
+
+    位图按级别首次使用时构建，之后随单词增删增量更新，
+    用于只从尚未加入词库的单词中抽样
+    """
+
+    # 未加入词库的单词占比低于该值时，改为扫描位图而不是拒绝采样
+    DENSE_THRESHOLD = 0.25
+
+    def __init__(self, index: VocabularyIndex, deck_words=()):
+        """初始化
+
+        Args:
+            index: 词库索引
+            deck_words: 当前词库中的所有单词
+        """
+        self.index = index
+        self._deck = {w.lower() for w in deck_words}
+        self._levels: Dict[str, VocabularyLevel] = {}
+        self._bitmaps: Dict[str, bytearray] = {}
+        self._unseen: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, word: str) -> bool:
+        return word.lower() in self._deck
+
+    def __len__(self) -> int:
+        return len(self._deck)
+
+    def _get_bitmap(self, level: VocabularyLevel) -> bytearray:
+        """获取 (必要时构建) 指定级别的成员位图，调用方需持有锁"""
+        bitmap = self._bitmaps.get(level.name)
+        if bitmap is None:
+            bitmap = bytearray(len(level))
+            for word in self._deck:
+                i = level.index_of(word)
+                if i is not None:
+                    bitmap[i] = 1
+            self._levels[level.name] = level
+            self._bitmaps[level.name] = bitmap
+            self._unseen[level.name] = len(level) - sum(bitmap)
+        return bitmap
+
+    def _set_member(self, word: str, member: bool):
+        """更新所有已构建位图中该单词的标记，调用方需持有锁"""
+        for name, bitmap in self._bitmaps.items():
+            i = self._levels[name].index_of(word)
+            if i is not None and bitmap[i] != member:
+                bitmap[i] = 1 if member else 0
+                self._unseen[name] += -1 if member else 1
+
+    def add(self, word: str):
+        """单词加入词库"""
+        word = word.lower()
+        with self._lock:
+            if word not in self._deck:
+                self._deck.add(word)
+                self._set_member(word, True)
+
+    def discard(self, word: str):
+        """单词从词库中删除"""
+        word = word.lower()
+        with self._lock:
+            if word in self._deck:
+                self._deck.discard(word)
+                self._set_member(word, False)
+
+    def reset(self, deck_words=()):
+        """用新的单词集合替换词库 (如清空数据后)"""
+        with self._lock:
+            self._deck = {w.lower() for w in deck_words}
+            self._levels.clear()
+            self._bitmaps.clear()
+            self._unseen.clear()
+
+    def unseen_count(self, level: str) -> int:
+        """指定级别中尚未加入词库的单词数"""
+        vocabulary = self.index.get_level(level)
+        with self._lock:
+            self._get_bitmap(vocabulary)
+            return self._unseen[vocabulary.name]
+
+    def sample_unseen(self, level: str, count: int) -> List[str]:
+        """从指定级别中尚未加入词库的单词里均匀抽样
+
+        未加入比例不低于 DENSE_THRESHOLD 时使用拒绝采样，期望 O(k)；
+        否则扫描位图取出剩余单词后抽样
+
+        Args:
+            level: 词汇级别
+            count: 要抽取的单词数量
+
+        Returns:
+            不重复的随机单词列表
+        """
+        vocabulary = self.index.get_level(level)
+        with self._lock:
+            bitmap = self._get_bitmap(vocabulary)
+            unseen = self._unseen[vocabulary.name]
+            total = len(vocabulary)
+            count = min(count, unseen)
+            if count <= 0:
+                return []
+
+            if unseen >= total * self.DENSE_THRESHOLD:
+                chosen = set()
+                while len(chosen) < count:
+                    i = random.randrange(total)
+                    if not bitmap[i]:
+                        chosen.add(i)
+            else:
+                chosen = random.sample([i for i in range(total) if not bitmap[i]], count)
+            return [vocabulary.words[i] for i in chosen]
+
+
+_default_index = None
+_default_index_lock = threading.Lock()
+
+
+def get_vocabulary_index() -> VocabularyIndex:
+    """获取进程内共享的词库索引"""
+    global _default_index
+    if _default_index is None:
+        with _default_index_lock:
+            if _default_index is None:
+                _default_index = VocabularyIndex()
+    return _default_index
@@ -7,13 +7,19 @@
 
 import sys
 import os
+import argparse
 
 # 将src目录添加到Python路径中
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# 最先导入，使启动耗时从这里开始计算
+from utils.profiling import startup_profiler
 from core.word_manager import WordManager
 from core.scheduler import Scheduler
+from core.constants import Constants
 from utils.common import show_menu, get_user_choice, init_logging
+from utils.metrics import metrics, load_metrics, format_metrics
+from core.query_trace import query_tracer, format_query_stats
 
 def interactive_add_word(word_manager: WordManager):
     """交互式添加单词"""
@@ -49,14 +55,161 @@ def interactive_add_word(word_manager: WordManager):
     else:
         print(f"添加失败 (单词可能已存在)")
 
-def main():
-    """主函数"""
-    init_logging()
+def build_pack_command(args) -> int:
+    """从词典缓存编译离线词典包"""
+    from api.offline_pack import build_pack
+    
+    missing = [f for f in args.cache if not os.path.exists(f)]
+    if missing:
+        print(f"缓存文件不存在: {', '.join(missing)}")
+        return 1
+    
+    count = build_pack(args.cache, args.output, merge=not args.no_merge)
+    print(f"离线词典包已生成: {args.output} (共 {count} 个单词)")
+    return 0
+
+def print_statistics(word_manager: WordManager):
+    """输出学习统计"""
+    stats = word_manager.get_statistics()
+    print(f"\n--- 统计信息 ---")
+    print(f"总单词数: {stats['total_words']}")
+    print(f"已复习数: {stats['reviewed_words']}")
+    print(f"掌握数: {stats['mastered_words']}")
+
+def stats_command(args) -> int:
+    """输出学习统计，--perf 时同时输出性能指标"""
+    print_statistics(WordManager(deck=args.deck))
+    if args.perf:
+        print("\n--- 性能指标 (本次运行) ---")
+        print(format_metrics(metrics.snapshot()))
+        print("\n--- SQL 查询 (本次运行) ---")
+        print(format_query_stats(query_tracer.snapshot()))
+        last_run = load_metrics()
+        if last_run:
+            print("\n--- 性能指标 (上次运行) ---")
+            print(format_metrics(last_run))
+    return 0
+
+def migrate_command(args) -> int:
+    """执行数据库迁移并显示进度，--status 时只列出迁移状态"""
+    from core.database import Database
+    from core import migrations
+    
+    db = Database(args.db, migrate=False)
+    if not args.status:
+        def report(name, done, total):
+            print(f"\r{name}: {done}/{total} ({done / total * 100:.0f}%)", end="", flush=True)
+        executed = db.migrate(batch_size=args.batch_size, progress=report)
+        print(f"\n已执行 {len(executed)} 个迁移" if executed else "没有需要执行的迁移")
+    applied = set(migrations.applied_versions(db))
+    for migration in migrations.MIGRATIONS:
+        state = "已执行" if migration.version in applied else "未执行"
+        print(f"{migration.version:>4}  {migration.name:<30} {state}")
+    return 0
+
+def review_log_command(args) -> int:
+    """紧凑复习日志: 从 review_history 迁移、压缩或查看占用空间"""
+    from core.database import Database
+    from core import review_log
+    
+    db = Database(args.db)
+    if args.action == "migrate":
+        def report(done, total):
+            print(f"\r已迁移 {done}/{total} ({done / total * 100:.0f}%)", end="", flush=True)
+        inserted = review_log.migrate_from_history(db, batch_size=args.batch_size, progress=report)
+        print(f"\n新写入 {inserted} 条记录")
+    elif args.action == "compact":
+        removed = review_log.compact(db)
+        print(f"已删除 {removed} 条已删除单词的复习记录")
+    for name, value in review_log.table_stats(db).items():
+        print(f"{name}: {value}")
+    return 0
+
+def index_advisor_command(args) -> int:
+    """执行服务层查询，输出每条语句的查询计划和全表扫描、临时排序"""
+    from core.index_advisor import advise, format_report
+    
+    print(format_report(advise(WordManager(db_path=args.db, deck=args.deck))))
+    return 0
+
+def serve_command(args) -> int:
+    """启动本地 HTTP 服务 (需要 starlette 和 uvicorn)"""
+    try:
+        import uvicorn
+        from server.app import create_app
+    except ImportError as e:
+        print(f"HTTP 服务需要安装 starlette 和 uvicorn: {e}")
+        return 1
+    
+    try:
+        uvicorn.run(create_app(args.db, db_workers=args.db_workers), host=args.host, port=args.port)
+    finally:
+        # 保存本次运行的性能指标，可用 stats --perf 查看
+        metrics.dump()
+    return 0
+
+def decks_command(args) -> int:
+    """列出所有词库及其单词数"""
+    for deck in WordManager(db_path=args.db).list_decks():
+        print(f"{deck['id']:>4}  {deck['name']:<20} {deck['word_count']} 个单词")
+    return 0
+
+def parse_args(argv=None):
+    """解析命令行参数"""
+    parser = argparse.ArgumentParser(description="单词记忆助手 (CLI)")
+    parser.add_argument("--profile-startup", action="store_true", help="输出启动耗时分析报告")
+    parser.add_argument("--deck", help=f"词库名称，不存在时创建 (默认 {Constants.DEFAULT_DECK_NAME})")
+    subparsers = parser.add_subparsers(dest="command")
+    
+    pack_parser = subparsers.add_parser("build-pack", help="从词典缓存编译离线词典包")
+    pack_parser.add_argument("--cache", nargs="+", default=["data/dictionary_cache.json"],
+                             help="词典缓存转储文件 (可指定多个)")
+    pack_parser.add_argument("--output", default="data/dictionary_pack.db", help="输出的词典包路径")
+    pack_parser.add_argument("--no-merge", action="store_true", help="不保留已有词典包中的条目")
+    
+    stats_parser = subparsers.add_parser("stats", help="输出学习统计")
+    stats_parser.add_argument("--perf", action="store_true", help="同时输出性能指标 (含上次运行保存的指标)")
+    
+    migrate_parser = subparsers.add_parser("migrate", help="执行数据库迁移 (打开数据库时也会自动执行)")
+    migrate_parser.add_argument("--db", help="数据库路径 (默认 data/words.db)")
+    migrate_parser.add_argument("--batch-size", type=int, default=Constants.MIGRATION_BATCH_SIZE,
+                                help="回填数据时每批提交的行数")
+    migrate_parser.add_argument("--status", action="store_true", help="只列出迁移状态")
+    
+    log_parser = subparsers.add_parser("review-log", help="紧凑复习日志的迁移和压缩")
+    log_parser.add_argument("action", choices=["migrate", "compact", "stats"],
+                            help="migrate: 从 review_history 复制; compact: 删除无效记录并整理文件; stats: 查看占用空间")
+    log_parser.add_argument("--db", help="数据库路径 (默认 data/words.db)")
+    log_parser.add_argument("--batch-size", type=int, default=Constants.MIGRATION_BATCH_SIZE,
+                            help="迁移时每批提交的行数")
+    
+    advisor_parser = subparsers.add_parser("index-advisor", help="分析服务层查询的查询计划")
+    advisor_parser.add_argument("--db", help="数据库路径 (默认 data/words.db)")
+    
+    serve_parser = subparsers.add_parser("serve", help="启动本地 HTTP 服务 (JSON API)")
+    serve_parser.add_argument("--db", help="数据库路径 (默认 data/words.db)")
+    serve_parser.add_argument("--host", default=Constants.SERVER_HOST, help="监听地址")
+    serve_parser.add_argument("--port", type=int, default=Constants.SERVER_PORT, help="监听端口")
+    serve_parser.add_argument("--db-workers", type=int, default=Constants.SERVER_DB_WORKERS,
+                              help="数据库线程池大小")
+    
+    decks_parser = subparsers.add_parser("decks", help="列出所有词库")
+    decks_parser.add_argument("--db", help="数据库路径 (默认 data/words.db)")
     
+    return parser.parse_args(argv)
+
+def run_interactive(deck: str = None):
+    """交互式菜单"""
     # 初始化
-    word_manager = WordManager()
+    word_manager = WordManager(deck=deck)
     scheduler = Scheduler(word_manager)
     
+    if startup_profiler.enabled:
+        # 菜单显示前打开数据库，报告中可以看到首屏所需的全部开销
+        word_manager.get_statistics()
+        startup_profiler.mark("菜单就绪")
+        startup_profiler.print_report()
+    
     while True:
         show_menu()
         choice = get_user_choice()
@@ -65,10 +218,10 @@ def main():
             interactive_add_word(word_manager)
         elif choice == '2':
             # 查看单词
-            words = word_manager.get_all_words()
+            words = word_manager.list_word_rows(("word", "meaning"))
             print("\n--- 单词列表 ---")
             for w in words:
-                print(f"{w['word']:<15} {w['meaning'][:30]}")
+                print(f"{w.word:<15} {(w.meaning or '')[:30]}")
         elif choice == '3':
             scheduler.review_words()
         elif choice == '4':
@@ -83,14 +236,38 @@ def main():
             else:
                 print("未找到单词")
         elif choice == '6':
-            stats = word_manager.get_statistics()
-            print(f"\n--- 统计信息 ---")
-            print(f"总单词数: {stats['total_words']}")
-            print(f"已复习数: {stats['reviewed_words']}")
-            print(f"掌握数: {stats['mastered_words']}")
+            print_statistics(word_manager)
         elif choice == '0':
+            # 保存本次运行的性能指标，可用 stats --perf 查看
+            metrics.dump()
             print("再见！")
             break
 
+def main(argv=None):
+    """主函数"""
+    args = parse_args(argv)
+    if args.profile_startup:
+        startup_profiler.enable()
+        startup_profiler.mark("模块导入完成")
+    init_logging()
+    
+    if args.command == "build-pack":
+        return build_pack_command(args)
+    if args.command == "stats":
+        return stats_command(args)
+    if args.command == "migrate":
+        return migrate_command(args)
+    if args.command == "review-log":
+        return review_log_command(args)
+    if args.command == "index-advisor":
+        return index_advisor_command(args)
+    if args.command == "decks":
+        return decks_command(args)
+    if args.command == "serve":
+        return serve_command(args)
+    
+    run_interactive(args.deck)
+    return 0
+
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
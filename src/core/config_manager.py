@@ -23,7 +23,8 @@ class ConfigManager:
             "reminder_enabled": True,
             "reminder_time": "09:00",
             "auto_backup": True,
-            "backup_interval_days": 7
+            "backup_interval_days": 7,
+            "chart_image_cache": True
         }
         self.config = self.load_config()
 
@@ -24,10 +24,26 @@ class Constants:
     CACHE_SIZE = 1000
     API_RATE_LIMIT = 0.5  # 秒
     REVIEW_LIMIT = 100  # 每次复习的最大单词数
+    WARMUP_DAYS = 3  # 缓存预热覆盖未来几天到期的单词
+    WARMUP_VOCABULARY_COUNT = 50  # 缓存预热的默认词汇级别单词数
+    WARMUP_IDLE_SECONDS = 2.0  # 前台查询后暂停预热的时间 (秒)
+    TTS_CACHE_MAX_BYTES = 50 * 1024 * 1024  # 语音缓存上限 (字节)
+    TTS_PRERENDER_LIMIT = 50  # 每次复习预合成语音的最大单词数
     
     # 数据库相关
     DB_POOL_SIZE = 5
     DB_MAX_OVERFLOW = 10
+    SLOW_QUERY_MS = 100  # 超过该耗时 (毫秒) 的 SQL 写入慢查询日志
+    N_PLUS_ONE_THRESHOLD = 10  # 同一语句连续执行达到该次数时警告可能的 N+1 查询
+    COMPACT_REVIEW_LOG = True  # 统计从紧凑复习日志读取 (打开数据库时的迁移已从 review_history 回填)
+    MIGRATION_BATCH_SIZE = 10000  # 数据库迁移回填数据时每批提交的行数
+    DEFAULT_DECK_ID = 1  # 默认词库 (分词库之前的数据都属于它)
+    DEFAULT_DECK_NAME = "default"
+    
+    # HTTP 服务相关 (main.py serve)
+    SERVER_HOST = "127.0.0.1"
+    SERVER_PORT = 8765
+    SERVER_DB_WORKERS = 4  # 数据库线程池大小，不超过 DB_POOL_SIZE
     
     # 时间相关
     DEFAULT_REVIEW_INTERVALS = [1, 2, 4, 7, 15, 30]  # 天
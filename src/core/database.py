@@ -6,17 +6,26 @@
 """
 
 import os
+import logging
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, scoped_session
 from sqlalchemy.pool import QueuePool
 from .models import Base
 from .constants import Constants
+from .query_trace import query_tracer
+
+logger = logging.getLogger(__name__)
 
 class Database:
     """数据库管理类"""
     
-    def __init__(self, db_path=None):
-        """初始化数据库"""
+    def __init__(self, db_path=None, migrate=True):
+        """初始化数据库
+
+        Args:
+            db_path: 数据库文件路径 (默认 data/words.db)
+            migrate: 是否执行尚未执行的迁移 (为 False 时由调用方执行 migrate，如需显示进度)
+        """
         if db_path is None:
             # 默认存储在项目根目录的 data 文件夹下
             base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -33,11 +42,55 @@ class Database:
             max_overflow=Constants.DB_MAX_OVERFLOW,
             pool_pre_ping=True  # 自动重连
         )
+        # 记录每条 SQL 的执行耗时、所属操作的查询数和慢查询
+        query_tracer.install(self.engine)
+        
         self.session_factory = sessionmaker(bind=self.engine)
         self.Session = scoped_session(self.session_factory)
         
-        # 创建所有表
+        # 创建所有表，再执行迁移 (给已有表加列、回填数据)
         Base.metadata.create_all(self.engine)
+        if migrate:
+            self.migrate()
+    
+    def migrate(self, batch_size=None, progress=None):
+        """执行尚未执行的迁移并补建索引
+
+        Args:
+            batch_size: 回填时每批提交的行数
+            progress: 进度回调 progress(迁移名称, 已处理行数, 总行数)
+
+        Returns:
+            本次执行的迁移版本号
+        """
+        from .migrations import run_migrations
+        executed = run_migrations(self, batch_size=batch_size, progress=progress)
+        # 索引在迁移之后创建，可以建在迁移新加的列上
+        created = self.ensure_indexes()
+        if executed or created:
+            # 更新查询规划器的统计信息: 没有统计时 SQLite 假设 deck_id 的选择性很高，
+            # 只有一个词库时也会走索引再逐行回表，比直接扫描表慢
+            with self.engine.begin() as conn:
+                conn.exec_driver_sql("ANALYZE")
+        return executed
+    
+    def ensure_indexes(self):
+        """补建模型中定义、但已有数据库中还没有的索引 (create_all 只为新建的表建索引)
+
+        Returns:
+            新建的索引名称
+        """
+        with self.engine.connect() as conn:
+            existing = set(conn.exec_driver_sql(
+                "SELECT name FROM sqlite_master WHERE type = 'index'").scalars())
+        created = []
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                if index.name not in existing:
+                    logger.info(f"正在创建索引 {index.name}")
+                    index.create(self.engine)
+                    created.append(index.name)
+        return created
     
     def get_session(self):
         """获取一个新的 Session"""
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+词库列式快照模块
+把 words 表中分析所需的列加载为 NumPy 数组，根据单词变更事件增量刷新，提供向量化的统计查询
+"""
+
+import datetime
+import logging
+import threading
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+from sqlalchemy import Integer, cast, func, select
+
+from .constants import Constants
+from .models import Word
+
+logger = logging.getLogger(__name__)
+
+# next_review 为空时的占位值
+NO_DATE = np.iinfo(np.int64).min
+
+SECONDS_PER_DAY = 86400
+
+# 掌握程度的取值范围 0-5
+MASTERY_LEVELS = 6
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+
+
+def to_epoch(value: datetime.datetime) -> int:
+    """把 (不带时区的) 时间转为秒数，与 SQLite strftime('%s') 的结果一致"""
+    return int((value - _EPOCH).total_seconds())
+
+
+def _day_number(value: datetime.date) -> int:
+    """日期距 1970-01-01 的天数"""
+    return (value - _EPOCH.date()).days
+
+
+class DeckSnapshot:
+    """一个词库的列式快照
+
+    列: id、easiness_factor、interval、review_count、mastery_level、next_review (秒) 和分类编码，
+    行按 id 升序排列。首次查询时全量加载，之后根据 on_word_change 收到的事件只重新读取变化的单词；
+    查询结果均为 Python 内置类型
+    """
+
+    def __init__(self, db, deck_id: int = Constants.DEFAULT_DECK_ID):
+        self.db = db
+        self.deck_id = deck_id
+        self._lock = threading.RLock()
+        self._loaded = False
+        # 待刷新的单词和是否需要检查删除
+        self._dirty = set()
+        self._check_deleted = False
+
+        self.ids = np.empty(0, dtype=np.int64)
+        self.easiness = np.empty(0, dtype=np.float64)
+        self.interval = np.empty(0, dtype=np.int32)
+        self.review_count = np.empty(0, dtype=np.int32)
+        self.mastery = np.empty(0, dtype=np.int8)
+        self.next_review = np.empty(0, dtype=np.int64)
+        self.category_codes = np.empty(0, dtype=np.int32)
+        self.categories: List[str] = []
+        self._category_index: Dict[str, int] = {}
+
+    # ------------------------------------------------------------------
+    # 加载与增量刷新
+    # ------------------------------------------------------------------
+
+    def on_word_change(self, event: str, word_text: str = None):
+        """单词变更事件 (尚未加载时无需处理)"""
+        with self._lock:
+            if not self._loaded:
+                return
+            if event == "words_cleared":
+                self._loaded = False
+                self._dirty.clear()
+                self._check_deleted = False
+            elif event == "word_deleted":
+                self._check_deleted = True
+            elif word_text:
+                self._dirty.add(word_text)
+
+    def refresh(self):
+        """丢弃快照，下次查询时全量加载"""
+        with self._lock:
+            self._loaded = False
+
+    def _select(self):
+        """快照各列的查询语句 (空值在 SQL 中替换为默认值)"""
+        return select(
+            Word.id,
+            func.coalesce(Word.easiness_factor, 2.5),
+            func.coalesce(Word.interval, 0),
+            func.coalesce(Word.review_count, 0),
+            func.coalesce(Word.mastery_level, 0),
+            func.coalesce(cast(func.strftime('%s', Word.next_review), Integer), NO_DATE),
+            func.coalesce(Word.category, ''),
+        ).where(Word.deck_id == self.deck_id)
+
+    def _columns(self, rows) -> Tuple:
+        """把查询结果转为各列数组"""
+        if not rows:
+            return (np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64), np.empty(0, dtype=np.int32),
+                    np.empty(0, dtype=np.int32), np.empty(0, dtype=np.int8), np.empty(0, dtype=np.int64),
+                    np.empty(0, dtype=np.int32))
+        ids, easiness, interval, review_count, mastery, next_review, categories = zip(*rows)
+        return (
+            np.array(ids, dtype=np.int64),
+            np.array(easiness, dtype=np.float64),
+            np.array(interval, dtype=np.int32),
+            np.array(review_count, dtype=np.int32),
+            np.array(mastery, dtype=np.int8),
+            np.array(next_review, dtype=np.int64),
+            np.array([self._category_code(c) for c in categories], dtype=np.int32),
+        )
+
+    def _category_code(self, category: str) -> int:
+        code = self._category_index.get(category)
+        if code is None:
+            code = self._category_index[category] = len(self.categories)
+            self.categories.append(category)
+        return code
+
+    def _set_columns(self, columns: Tuple):
+        (self.ids, self.easiness, self.interval, self.review_count,
+         self.mastery, self.next_review, self.category_codes) = columns
+
+    def _load(self):
+        """全量加载"""
+        self.categories = []
+        self._category_index = {}
+        session = self.db.get_session()
+        try:
+            rows = session.execute(self._select().order_by(Word.id)).all()
+        finally:
+            session.close()
+        self._set_columns(self._columns(rows))
+        self._loaded = True
+        self._dirty.clear()
+        self._check_deleted = False
+        logger.debug(f"词库快照已加载: {len(self.ids)} 个单词")
+
+    def _apply_changes(self):
+        """只重新读取有变化的单词，并移除已删除的单词"""
+        dirty, self._dirty = self._dirty, set()
+        check_deleted, self._check_deleted = self._check_deleted, False
+        session = self.db.get_session()
+        try:
+            rows = session.execute(self._select().where(Word.word.in_(dirty))).all() if dirty else []
+            live_ids = session.execute(
+                select(Word.id).where(Word.deck_id == self.deck_id)).scalars().all() if check_deleted else None
+        finally:
+            session.close()
+
+        if live_ids is not None:
+            keep = np.isin(self.ids, np.array(live_ids, dtype=np.int64))
+            if not keep.all():
+                self._set_columns(tuple(column[keep] for column in self._current_columns()))
+
+        if not rows:
+            return
+        changed = self._columns(rows)
+        existing = np.isin(changed[0], self.ids)
+
+        # 已有的行原地更新
+        if existing.any():
+            positions = np.searchsorted(self.ids, changed[0][existing])
+            for column, values in zip(self._current_columns(), changed):
+                column[positions] = values[existing]
+
+        # 新增的行按 id 插入，保持升序
+        added = ~existing
+        if added.any():
+            merged = tuple(np.concatenate((column, values[added]))
+                           for column, values in zip(self._current_columns(), changed))
+            order = np.argsort(merged[0], kind='stable')
+            self._set_columns(tuple(column[order] for column in merged))
+
+    def _current_columns(self) -> Tuple:
+        return (self.ids, self.easiness, self.interval, self.review_count,
+                self.mastery, self.next_review, self.category_codes)
+
+    def _ensure_current(self):
+        """按需加载或增量刷新 (调用方持有锁)"""
+        if not self._loaded:
+            self._load()
+        elif self._dirty or self._check_deleted:
+            self._apply_changes()
+
+    # ------------------------------------------------------------------
+    # 向量化查询
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._ensure_current()
+            return len(self.ids)
+
+    def overview(self) -> Dict:
+        """单词总数、已复习数、已掌握数 (掌握程度 >= 4) 和平均掌握程度"""
+        with self._lock:
+            self._ensure_current()
+            total = len(self.ids)
+            return {
+                "total_words": total,
+                "reviewed_words": int(np.count_nonzero(self.review_count > 0)),
+                "mastered_words": int(np.count_nonzero(self.mastery >= 4)),
+                "avg_mastery": float(self.mastery.mean()) if total else 0.0,
+            }
+
+    def mastery_histogram(self) -> List[int]:
+        """各掌握程度 (0-5) 的单词数"""
+        with self._lock:
+            self._ensure_current()
+            levels = np.clip(self.mastery, 0, MASTERY_LEVELS - 1)
+            return np.bincount(levels, minlength=MASTERY_LEVELS).tolist()
+
+    def due_counts_by_day(self, days: int = 7, today: datetime.date = None) -> Dict[str, int]:
+        """从今天起每天到期的单词数
+
+        Returns:
+            {日期 (YYYY-MM-DD): 单词数}
+        """
+        today = today or datetime.date.today()
+        start = _day_number(today)
+        with self._lock:
+            self._ensure_current()
+            scheduled = self.next_review[self.next_review != NO_DATE] // SECONDS_PER_DAY - start
+            counts = np.bincount(scheduled[(scheduled >= 0) & (scheduled < days)], minlength=days)
+        return {(today + datetime.timedelta(days=i)).isoformat(): int(counts[i]) for i in range(days)}
+
+    def overdue_count(self, now: datetime.datetime = None) -> int:
+        """已到期 (或从未安排复习) 的单词数"""
+        cutoff = to_epoch(now or datetime.datetime.now())
+        with self._lock:
+            self._ensure_current()
+            return int(np.count_nonzero(self.next_review <= cutoff))
+
+    def ef_distribution(self, bins: int = 10) -> Tuple[List[int], List[float]]:
+        """难度系数 (EF) 的分布
+
+        Returns:
+            (各区间的单词数, 区间边界)
+        """
+        with self._lock:
+            self._ensure_current()
+            if not len(self.easiness):
+                return [0] * bins, []
+            counts, edges = np.histogram(self.easiness, bins=bins)
+        return counts.tolist(), edges.tolist()
+
+    def category_counts(self) -> Dict[str, int]:
+        """各分类的单词数"""
+        with self._lock:
+            self._ensure_current()
+            counts = np.bincount(self.category_codes, minlength=len(self.categories))
+            return {self.categories[code]: int(count) for code, count in enumerate(counts) if count}
+
+    def word_metrics(self, words: Iterable[str]) -> Dict[str, Dict]:
+        """一组单词的复习参数 (一次查询 id，其余从快照读取)
+
+        Returns:
+            {单词: {'review_count', 'interval', 'easiness_factor', 'mastery_level'}}，不存在的单词不包含在内
+        """
+        words = {w.lower() for w in words}
+        if not words:
+            return {}
+        session = self.db.get_session()
+        try:
+            pairs = session.execute(select(Word.word, Word.id).where(
+                Word.deck_id == self.deck_id, Word.word.in_(words))).all()
+        finally:
+            session.close()
+        with self._lock:
+            self._ensure_current()
+            if not pairs or not len(self.ids):
+                return {}
+            ids = np.array([word_id for _, word_id in pairs], dtype=np.int64)
+            positions = np.minimum(np.searchsorted(self.ids, ids), len(self.ids) - 1)
+            found = self.ids[positions] == ids
+            return {
+                word: {
+                    'review_count': int(self.review_count[pos]),
+                    'interval': int(self.interval[pos]),
+                    'easiness_factor': float(self.easiness[pos]),
+                    'mastery_level': int(self.mastery[pos]),
+                }
+                for (word, _), pos, ok in zip(pairs, positions, found) if ok
+            }
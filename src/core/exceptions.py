@@ -30,3 +30,7 @@ class NotFoundError(WordHelperException):
     """资源未找到错误"""
     pass
 
+
+class TaskRejectedError(WordHelperException):
+    """后台任务被拒绝 (队列已满或调度器已关闭)"""
+    pass
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+索引顾问模块
+执行一遍服务层的只读查询并记录发出的 SQL，对每条语句运行 EXPLAIN QUERY PLAN，
+找出全表扫描和临时排序
+"""
+
+import logging
+import re
+from contextlib import contextmanager
+from typing import Dict, List
+
+from sqlalchemy import event
+
+from .query_trace import statement_shape
+
+logger = logging.getLogger(__name__)
+
+# 查询计划中需要关注的模式
+_FULL_SCAN = "全表扫描"
+_TEMP_BTREE = "临时B树排序"
+
+_WHERE = re.compile(r"\bWHERE\b", re.IGNORECASE)
+
+
+@contextmanager
+def capture_statements(engine):
+    """记录期间执行的 SQL 语句 (按语句形状去重，保留第一次的参数)
+
+    Yields:
+        {语句形状: (语句, 参数)}，退出时填充完毕
+    """
+    captured: Dict[str, tuple] = {}
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            captured.setdefault(statement_shape(statement), (statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield captured
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def run_service_workload(manager) -> List[str]:
+    """执行服务层的只读查询 (不修改数据)
+
+    Returns:
+        执行失败的调用说明
+    """
+    from services.stats_service import StatsService
+
+    sample = manager.list_word_rows(("word",))[:1]
+    word = sample[0].word if sample else "example"
+    # 不带快照的统计服务，覆盖直接查询数据库的统计路径
+    sql_stats = StatsService(manager.db, deck_id=manager.deck_id)
+
+    calls = [
+        ("get_all_words", manager.get_all_words),
+        ("list_word_rows", manager.list_word_rows),
+        ("search_words", lambda: manager.search_words(word[:2])),
+        ("get_word", lambda: manager.get_word(word)),
+        ("get_words_for_review", manager.get_words_for_review),
+        ("get_future_review_stats", manager.get_future_review_stats),
+        ("get_overview_stats", sql_stats.get_overview_stats),
+        ("get_recent_activity", lambda: sql_stats.get_recent_activity(30)),
+        ("deck_snapshot", manager.deck_snapshot.refresh),
+        ("deck_snapshot.load", manager.deck_snapshot.overview),
+    ]
+    failures = []
+    for name, call in calls:
+        try:
+            call()
+        except Exception as e:
+            logger.error(f"索引顾问执行 {name} 失败: {e}")
+            failures.append(f"{name}: {e}")
+    return failures
+
+
+def explain(engine, statements: Dict[str, tuple]) -> List[Dict]:
+    """对每条语句运行 EXPLAIN QUERY PLAN
+
+    Returns:
+        [{'statement': 语句形状, 'plan': [计划行], 'warnings': [问题]}]，有问题的语句排在前面
+    """
+    report = []
+    with engine.connect() as conn:
+        for shape, (statement, parameters) in statements.items():
+            try:
+                rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+            except Exception as e:
+                report.append({'statement': shape, 'plan': [f"无法分析: {e}"], 'warnings': []})
+                continue
+            plan = [row[-1] for row in rows]
+            filtered = _WHERE.search(statement) is not None
+            report.append({'statement': shape, 'plan': plan, 'warnings': plan_warnings(plan, filtered)})
+    report.sort(key=lambda item: not item['warnings'])
+    return report
+
+
+def plan_warnings(plan: List[str], filtered: bool = True) -> List[str]:
+    """从查询计划中找出全表扫描和临时排序
+
+    Args:
+        plan: 查询计划行
+        filtered: 语句是否带 WHERE 条件 (不带条件的语句本来就要读取整张表，不算全表扫描)
+    """
+    warnings = []
+    for line in plan:
+        if filtered and line.startswith("SCAN ") and " USING " not in line:
+            warnings.append(f"{_FULL_SCAN}: {line}")
+        elif "USE TEMP B-TREE" in line:
+            warnings.append(f"{_TEMP_BTREE}: {line}")
+    return warnings
+
+
+def advise(manager) -> List[Dict]:
+    """执行服务层查询并分析每条语句的查询计划"""
+    engine = manager.db.engine
+    with capture_statements(engine) as captured:
+        run_service_workload(manager)
+    return explain(engine, captured)
+
+
+def format_report(report: List[Dict]) -> str:
+    """把分析结果格式化为文本"""
+    lines = []
+    flagged = sum(1 for item in report if item['warnings'])
+    lines.append(f"共分析 {len(report)} 条语句，其中 {flagged} 条存在全表扫描或临时排序")
+    for item in report:
+        lines.append("")
+        lines.append(("[!] " if item['warnings'] else "[ok] ") + item['statement'])
+        for warning in item['warnings']:
+            lines.append(f"    - {warning}")
+        for line in item['plan']:
+            lines.append(f"      {line}")
+    return "\n".join(lines)
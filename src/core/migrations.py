@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+数据库迁移模块
+按版本号顺序执行结构变更和数据回填，已执行的版本记录在 schema_migrations 表中。
+新表和模型中声明的索引由 create_all 和 Database.ensure_indexes 创建，
+迁移负责它们做不到的事: 给已有表加列、回填数据
+"""
+
+import datetime
+import logging
+from typing import Callable, List, NamedTuple, Optional
+
+from .constants import Constants
+
+logger = logging.getLogger(__name__)
+
+# 进度回调: progress(迁移名称, 已处理行数, 总行数)
+ProgressCallback = Callable[[str, int, int], None]
+
+
+class Migration(NamedTuple):
+    """一个迁移版本
+
+    upgrade(ctx) 必须可以重复执行: 中途中断时版本不会被记录，下次打开数据库时从头重跑
+    """
+    version: int
+    name: str
+    upgrade: Callable[["MigrationContext"], None]
+
+
+def backfill(db, table: str, statement: str, batch_size: int,
+             progress: Optional[Callable[[int, int], None]] = None) -> int:
+    """按 rowid 范围分批执行回填语句，每批单独提交，避免长时间持有写锁
+
+    Args:
+        db: 数据库
+        table: 按其 rowid 分批的表
+        statement: 回填语句，用 ? 占位符接收本批的 rowid 范围 (下界不含、上界含)，如
+            "UPDATE t SET c = 1 WHERE rowid > ? AND rowid <= ?"
+        batch_size: 每批的 rowid 跨度
+        progress: 进度回调 progress(已处理行数, 总行数)
+
+    Returns:
+        受影响的行数
+    """
+    with db.engine.connect() as conn:
+        total, max_id = conn.exec_driver_sql(f"SELECT COUNT(*), MAX(rowid) FROM {table}").one()
+    if not total:
+        return 0
+
+    affected = 0
+    done = 0
+    last_id = 0
+    while last_id < max_id:
+        upper = last_id + batch_size
+        with db.engine.begin() as conn:
+            result = conn.exec_driver_sql(statement, (last_id, upper))
+            affected += max(result.rowcount, 0)
+            done += conn.exec_driver_sql(
+                f"SELECT COUNT(*) FROM {table} WHERE rowid > ? AND rowid <= ?", (last_id, upper)).scalar()
+        last_id = upper
+        if progress:
+            progress(done, total)
+    return affected
+
+
+class MigrationContext:
+    """传给迁移函数的上下文，提供加列、删除索引和分批回填"""
+
+    def __init__(self, db, migration: Migration, batch_size: int, progress: Optional[ProgressCallback]):
+        self.db = db
+        self.migration = migration
+        self.batch_size = batch_size
+        self._progress = progress
+
+    def execute(self, statement: str, parameters=()):
+        """在单独的事务中执行一条语句"""
+        with self.db.engine.begin() as conn:
+            return conn.exec_driver_sql(statement, parameters)
+
+    def has_column(self, table: str, column: str) -> bool:
+        with self.db.engine.connect() as conn:
+            return any(row[1] == column for row in conn.exec_driver_sql(f"PRAGMA table_info({table})"))
+
+    def add_column(self, table: str, column: str, ddl: str):
+        """给已有表加列 (列已存在时跳过)
+
+        Args:
+            table: 表名
+            column: 列名
+            ddl: 列定义，如 "INTEGER NOT NULL DEFAULT 1"
+        """
+        if not self.has_column(table, column):
+            self.execute(f"ALTER TABLE {table} ADD COLUMN {column} {ddl}")
+
+    def drop_index(self, name: str):
+        """删除不再使用的索引 (不存在时跳过)"""
+        self.execute(f"DROP INDEX IF EXISTS {name}")
+
+    def backfill(self, table: str, statement: str) -> int:
+        """分批执行回填语句 (见 backfill)，返回受影响的行数"""
+        return backfill(self.db, table, statement, self.batch_size, self.progress)
+
+    def progress(self, done: int, total: int):
+        """报告进度"""
+        if self._progress:
+            self._progress(self.migration.name, done, total)
+        else:
+            logger.info(f"迁移 {self.migration.name}: {done}/{total}")
+
+
+# ----------------------------------------------------------------------
+# 迁移版本 (只能追加，已发布的版本不能修改)
+# ----------------------------------------------------------------------
+
+def _backfill_review_log(ctx: MigrationContext):
+    """把 review_history 复制到紧凑复习日志"""
+    from . import review_log
+    review_log.migrate_from_history(ctx.db, batch_size=ctx.batch_size, progress=ctx.progress)
+
+
+def _partition_by_deck(ctx: MigrationContext):
+    """单词和复习历史按词库划分
+
+    已有数据都属于默认词库，由列默认值填充，不需要回填。
+    单词的全局唯一索引和不带 deck_id 的索引删除，迁移后由 ensure_indexes 建立以 deck_id 开头的索引；
+    复习日志的主键改为以 deck_id 开头，WITHOUT ROWID 表不能修改主键，按新结构重建。
+    最后总是从 review_history 回填一次: 分词库之前的数据库打开时 create_all 已经按新结构建好了复习日志，
+    不会走重建分支 (回填是 INSERT OR IGNORE，重复执行不会产生重复记录)
+    """
+    from . import review_log
+    from .models import ReviewLog
+    ctx.execute("INSERT OR IGNORE INTO decks (id, name, created_date) VALUES (?, ?, ?)",
+                (Constants.DEFAULT_DECK_ID, Constants.DEFAULT_DECK_NAME, datetime.datetime.now().isoformat(" ")))
+    default = f"INTEGER NOT NULL DEFAULT {Constants.DEFAULT_DECK_ID}"
+    ctx.add_column("words", "deck_id", default)
+    ctx.add_column("review_history", "deck_id", default)
+    for name in ("ix_words_word", "ix_words_added_date", "ix_words_next_review", "ix_words_review_count",
+                 "ix_words_mastery_level", "ix_words_review_queue", "ix_words_added_day", "ix_words_due_day",
+                 "ix_review_history_review_date", "ix_review_history_review_day"):
+        ctx.drop_index(name)
+    if not ctx.has_column("review_log", "deck_id"):
+        ctx.execute("DROP TABLE IF EXISTS review_log")
+        ReviewLog.__table__.create(ctx.db.engine)
+    review_log.migrate_from_history(ctx.db, batch_size=ctx.batch_size, progress=ctx.progress)
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(1, "backfill_review_log", _backfill_review_log),
+    Migration(2, "partition_by_deck", _partition_by_deck),
+]
+
+
+# ----------------------------------------------------------------------
+# 执行
+# ----------------------------------------------------------------------
+
+def _ensure_version_table(db):
+    with db.engine.begin() as conn:
+        conn.exec_driver_sql(
+            "CREATE TABLE IF NOT EXISTS schema_migrations ("
+            "version INTEGER PRIMARY KEY, name TEXT NOT NULL, applied_at TEXT NOT NULL)")
+
+
+def applied_versions(db) -> List[int]:
+    """已执行的迁移版本"""
+    _ensure_version_table(db)
+    with db.engine.connect() as conn:
+        return list(conn.exec_driver_sql("SELECT version FROM schema_migrations ORDER BY version").scalars())
+
+
+def pending_migrations(db, migrations: List[Migration] = None) -> List[Migration]:
+    """尚未执行的迁移 (按版本号排序)"""
+    applied = set(applied_versions(db))
+    return sorted((m for m in (migrations or MIGRATIONS) if m.version not in applied), key=lambda m: m.version)
+
+
+def run_migrations(db, migrations: List[Migration] = None, batch_size: int = None,
+                   progress: Optional[ProgressCallback] = None) -> List[int]:
+    """按版本号执行尚未执行的迁移
+
+    Args:
+        db: 数据库
+        migrations: 迁移列表 (默认 MIGRATIONS)
+        batch_size: 回填时每批提交的行数
+        progress: 进度回调，为空时写入日志
+
+    Returns:
+        本次执行的版本号
+    """
+    batch_size = batch_size or Constants.MIGRATION_BATCH_SIZE
+    executed = []
+    for migration in pending_migrations(db, migrations):
+        logger.info(f"正在执行数据库迁移 {migration.version}: {migration.name}")
+        migration.upgrade(MigrationContext(db, migration, batch_size, progress))
+        with db.engine.begin() as conn:
+            conn.exec_driver_sql(
+                "INSERT OR IGNORE INTO schema_migrations (version, name, applied_at) VALUES (?, ?, ?)",
+                (migration.version, migration.name, datetime.datetime.now().isoformat(timespec="seconds")))
+        executed.append(migration.version)
+    return executed
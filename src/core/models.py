@@ -5,29 +5,40 @@
 定义数据库表结构
 """
 
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Text, Index, func
 from sqlalchemy.orm import relationship, declarative_base
 import datetime
+from .constants import Constants
 
 Base = declarative_base()
 
+class Deck(Base):
+    """词库模型 (每个学习者一个或多个词库，单词和复习记录按词库划分)"""
+    __tablename__ = 'decks'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    name = Column(String(100), unique=True, nullable=False)
+    created_date = Column(DateTime, default=datetime.datetime.now)
+
 class Word(Base):
-    """单词模型"""
+    """单词模型 (同一词库内单词唯一)"""
     __tablename__ = 'words'
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    word = Column(String(100), unique=True, nullable=False, index=True)
+    deck_id = Column(Integer, ForeignKey('decks.id'), nullable=False,
+                     default=Constants.DEFAULT_DECK_ID, server_default=str(Constants.DEFAULT_DECK_ID))
+    word = Column(String(100), nullable=False)
     phonetic = Column(String(100))
     meaning = Column(Text)
     example = Column(Text)
     category = Column(String(100))  # 单词分类
-    added_date = Column(DateTime, default=datetime.datetime.now, index=True)  # 添加索引用于时间范围查询
+    added_date = Column(DateTime, default=datetime.datetime.now)
     
     # 复习相关
     last_review = Column(DateTime)
-    next_review = Column(DateTime, index=True)
-    review_count = Column(Integer, default=0, index=True)  # 添加索引用于统计查询
-    mastery_level = Column(Integer, default=0, index=True)  # 添加索引用于筛选 0-5
+    next_review = Column(DateTime)
+    review_count = Column(Integer, default=0)
+    mastery_level = Column(Integer, default=0)  # 0-5
     
     # SM-2 算法参数
     easiness_factor = Column(Float, default=2.5)
@@ -59,7 +70,36 @@ class ReviewHistory(Base):
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     word_id = Column(Integer, ForeignKey('words.id'), nullable=False, index=True)  # 添加索引
-    review_date = Column(DateTime, default=datetime.datetime.now, index=True)  # 添加索引用于时间查询
+    deck_id = Column(Integer, ForeignKey('decks.id'), nullable=False,
+                     default=Constants.DEFAULT_DECK_ID, server_default=str(Constants.DEFAULT_DECK_ID))
+    review_date = Column(DateTime, default=datetime.datetime.now)
     quality = Column(Integer)  # 用户选择的掌握程度 (0-5)
     
     word_ref = relationship("Word", back_populates="history")
+
+class ReviewLog(Base):
+    """紧凑复习日志 (只追加)
+
+    WITHOUT ROWID 表，按 (词库, 复习时间, 单词id) 主键聚簇存储，没有自增 id 和二级索引，
+    按时间顺序扫描一个词库的记录时直接读取主键 B 树
+    """
+    __tablename__ = 'review_log'
+    __table_args__ = {'sqlite_with_rowid': False}
+
+    deck_id = Column(Integer, primary_key=True, autoincrement=False)
+    reviewed_at = Column(Integer, primary_key=True, autoincrement=False)  # 毫秒时间戳
+    word_id = Column(Integer, primary_key=True, autoincrement=False)
+    quality = Column(Integer, nullable=False)
+
+
+# 按查询形状建立的索引 (在 Database 初始化时补建到已有数据库)
+# 所有查询都限定在一个词库内，索引都以 deck_id 开头
+Index('ix_words_deck_word', Word.deck_id, Word.word, unique=True)  # 按单词查找，同一词库内唯一
+# 复习队列按到期时间读取单词，覆盖索引避免回表
+Index('ix_words_deck_due', Word.deck_id, Word.next_review, Word.word)
+Index('ix_words_deck_review_count', Word.deck_id, Word.review_count)  # 已复习数
+Index('ix_words_deck_mastery', Word.deck_id, Word.mastery_level)  # 已掌握数、平均掌握程度
+# 按天分组的统计查询使用 date(...) 表达式，查询条件写成相同的表达式才能命中
+Index('ix_words_deck_added_day', Word.deck_id, func.date(Word.added_date))  # 每日新增
+Index('ix_words_deck_due_day', Word.deck_id, func.date(Word.next_review))  # 未来几天的复习量
+Index('ix_review_history_deck_day', ReviewHistory.deck_id, func.date(ReviewHistory.review_date))  # 连续打卡、每日复习数
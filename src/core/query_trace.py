@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SQL 查询追踪模块
+记录每条语句的耗时，按逻辑操作统计查询次数，写入慢查询日志并检测 N+1 查询
+"""
+
+import contextvars
+import logging
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from logging.handlers import RotatingFileHandler
+from typing import Dict, List
+
+from sqlalchemy import event
+
+from utils.common import get_log_dir
+from utils.metrics import metrics
+from .constants import Constants
+
+logger = logging.getLogger(__name__)
+
+# 慢查询单独写入 logs/slow_query.log，不进入 app.log
+slow_query_logger = logging.getLogger("slow_query")
+
+# 同一语句两次执行间隔超过该时间 (秒) 时不再视为同一个循环
+REPEAT_WINDOW_SECONDS = 0.5
+
+# 未标记操作的查询归入该名称
+UNTAGGED = "(未标记)"
+
+_WHITESPACE = re.compile(r"\s+")
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+
+# 当前线程 (或协程) 正在执行的逻辑操作
+_current_operation = contextvars.ContextVar("query_operation", default=None)
+
+
+def statement_shape(statement: str) -> str:
+    """归一化 SQL 语句: 合并空白、去掉字面量，并把 IN (?, ?, ...) 折叠为 IN (?)"""
+    shape = _WHITESPACE.sub(" ", statement).strip()
+    shape = _STRING.sub("?", shape)
+    shape = _NUMBER.sub("?", shape)
+    return _PLACEHOLDER_LIST.sub("(?)", shape)
+
+
+class OperationTrace:
+    """一次逻辑操作 (如一次统计页刷新) 期间的查询记录"""
+
+    def __init__(self, tag: str):
+        self.tag = tag
+        self.queries = 0
+        self.seconds = 0.0
+        self.last_shape = None
+        self.last_time = 0.0
+        self.repeat = 0
+
+
+class QueryTracer:
+    """SQL 查询追踪器
+
+    通过 SQLAlchemy 的 before/after_cursor_execute 事件记录：
+    - 每种语句 (归一化后) 的执行次数和耗时
+    - 每个逻辑操作 (operation 标记) 发出的查询数
+    - 超过阈值的慢查询 (写入 logs/slow_query.log)
+    - 同一语句在短时间内连续执行多次 (可能的 N+1 查询)
+    """
+
+    def __init__(self, slow_query_ms: float = Constants.SLOW_QUERY_MS,
+                 n_plus_one_threshold: int = Constants.N_PLUS_ONE_THRESHOLD):
+        self.slow_query_ms = slow_query_ms
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self._lock = threading.Lock()
+        # 语句 -> [次数, 总耗时, 最大耗时]
+        self._statements: Dict[str, List] = {}
+        # 操作 -> [执行次数, 查询总数, 单次最多查询数, 查询总耗时]
+        self._operations: Dict[str, List] = {}
+        # 未标记操作的查询按线程记录，用于 N+1 检测
+        self._local = threading.local()
+        self._slow_log_ready = False
+
+    def install(self, engine):
+        """在数据库引擎上注册事件监听"""
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+        event.listen(engine, "handle_error", self._handle_error)
+
+    @contextmanager
+    def operation(self, tag: str):
+        """标记一个逻辑操作，期间的查询都计入该操作 (嵌套时计入最外层)"""
+        if _current_operation.get() is not None:
+            yield
+            return
+        trace = OperationTrace(tag)
+        token = _current_operation.set(trace)
+        try:
+            yield
+        finally:
+            _current_operation.reset(token)
+            self._finish_operation(trace)
+
+    def _finish_operation(self, trace: OperationTrace):
+        """操作结束时汇总查询次数"""
+        if not trace.queries:
+            return
+        with self._lock:
+            stats = self._operations.setdefault(trace.tag, [0, 0, 0, 0.0])
+            stats[0] += 1
+            stats[1] += trace.queries
+            stats[2] = max(stats[2], trace.queries)
+            stats[3] += trace.seconds
+        logger.debug(f"操作 {trace.tag} 执行了 {trace.queries} 条查询 ({trace.seconds * 1000:.1f}ms)")
+
+    def _current_trace(self) -> OperationTrace:
+        """当前操作的记录，未标记时使用本线程的记录"""
+        trace = _current_operation.get()
+        if trace is None:
+            trace = getattr(self._local, 'trace', None)
+            if trace is None:
+                trace = self._local.trace = OperationTrace(UNTAGGED)
+        return trace
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('query_start', []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        now = time.perf_counter()
+        elapsed = now - conn.info['query_start'].pop()
+        metrics.observe("db.query", elapsed)
+        shape = statement_shape(statement)
+        trace = self._current_trace()
+
+        with self._lock:
+            stats = self._statements.setdefault(shape, [0, 0.0, 0.0])
+            stats[0] += 1
+            stats[1] += elapsed
+            stats[2] = max(stats[2], elapsed)
+            if trace.tag == UNTAGGED:
+                # 未标记的查询没有操作边界，直接累计
+                untagged = self._operations.setdefault(UNTAGGED, [0, 0, 0, 0.0])
+                untagged[1] += 1
+                untagged[3] += elapsed
+
+        trace.queries += 1
+        trace.seconds += elapsed
+        self._check_repeat(trace, shape, now)
+
+        if elapsed * 1000 >= self.slow_query_ms:
+            self._log_slow_query(trace.tag, elapsed, statement, parameters)
+
+    def _handle_error(self, context):
+        starts = context.connection.info.get('query_start') if context.connection is not None else None
+        if starts:
+            metrics.observe("db.query", time.perf_counter() - starts.pop(), error=True)
+
+    def _check_repeat(self, trace: OperationTrace, shape: str, now: float):
+        """同一语句连续执行达到阈值时警告 (每轮循环只警告一次)"""
+        if shape == trace.last_shape and now - trace.last_time <= REPEAT_WINDOW_SECONDS:
+            trace.repeat += 1
+        else:
+            trace.last_shape = shape
+            trace.repeat = 1
+        trace.last_time = now
+        if trace.repeat == self.n_plus_one_threshold:
+            metrics.increment("db.n_plus_one")
+            logger.warning(f"可能的 N+1 查询: 操作 {trace.tag} 中同一语句连续执行了 "
+                           f"{self.n_plus_one_threshold} 次: {shape}")
+
+    def _log_slow_query(self, tag: str, elapsed: float, statement: str, parameters):
+        """写入慢查询日志"""
+        if not self._slow_log_ready:
+            with self._lock:
+                if not self._slow_log_ready:
+                    handler = RotatingFileHandler(os.path.join(get_log_dir(), "slow_query.log"),
+                                                  maxBytes=1024 * 1024, backupCount=3, encoding="utf-8")
+                    handler.setFormatter(logging.Formatter("%(asctime)s %(message)s", "%Y-%m-%d %H:%M:%S"))
+                    slow_query_logger.addHandler(handler)
+                    slow_query_logger.setLevel(logging.INFO)
+                    slow_query_logger.propagate = False
+                    self._slow_log_ready = True
+        params = repr(parameters)
+        if len(params) > 200:
+            params = params[:200] + "..."
+        slow_query_logger.info(f"{elapsed * 1000:.1f}ms [{tag}] {_WHITESPACE.sub(' ', statement).strip()} {params}")
+
+    def snapshot(self, top: int = 20) -> Dict:
+        """导出查询统计
+
+        Returns:
+            {'operations': {操作: 统计}, 'statements': [按总耗时排序的前 top 条语句]}
+        """
+        with self._lock:
+            operations = {
+                tag: {
+                    'calls': calls,
+                    'queries': queries,
+                    'avg_queries': queries / calls if calls else 0.0,
+                    'max_queries': max_queries,
+                    'total_ms': seconds * 1000,
+                }
+                for tag, (calls, queries, max_queries, seconds) in sorted(self._operations.items())
+            }
+            statements = sorted(self._statements.items(), key=lambda item: item[1][1], reverse=True)[:top]
+        return {
+            'operations': operations,
+            'statements': [
+                {'statement': shape, 'count': count, 'total_ms': total * 1000,
+                 'avg_ms': total / count * 1000, 'max_ms': max_elapsed * 1000}
+                for shape, (count, total, max_elapsed) in statements
+            ],
+        }
+
+    def reset(self):
+        """清空统计"""
+        with self._lock:
+            self._statements.clear()
+            self._operations.clear()
+
+
+def format_query_stats(snapshot: Dict) -> str:
+    """把查询统计格式化为文本"""
+    lines = []
+    operations = snapshot.get('operations', {})
+    if operations:
+        lines.append(f"{'操作':<40}  {'次数':>6}  {'查询数':>7}  {'平均':>7}  {'最多':>5}  {'耗时(ms)':>9}")
+        for tag, op in operations.items():
+            calls = op['calls'] if tag != UNTAGGED else '-'
+            avg = f"{op['avg_queries']:.1f}" if tag != UNTAGGED else '-'
+            lines.append(f"{tag:<40}  {calls:>6}  {op['queries']:>7}  {avg:>7}  "
+                         f"{op['max_queries']:>5}  {op['total_ms']:>9.1f}")
+    statements = snapshot.get('statements', [])
+    if statements:
+        if lines:
+            lines.append("")
+        lines.append(f"{'次数':>7}  {'平均(ms)':>9}  {'最大(ms)':>9}  语句")
+        for st in statements:
+            text = st['statement'] if len(st['statement']) <= 120 else st['statement'][:117] + "..."
+            lines.append(f"{st['count']:>7}  {st['avg_ms']:>9.2f}  {st['max_ms']:>9.2f}  {text}")
+    return "\n".join(lines) if lines else "暂无查询数据"
+
+
+# 进程内共享的查询追踪器
+query_tracer = QueryTracer()
+
+
+def query_context(tag: str):
+    """标记一个逻辑操作，统计期间发出的查询数，如 with query_context("stats.refresh"): ..."""
+    return query_tracer.operation(tag)
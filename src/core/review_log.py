@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+紧凑复习日志模块
+review_log 表的追加、顺序扫描、按天汇总，以及从 review_history 迁移和压缩
+"""
+
+import datetime
+import logging
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.dialects.sqlite import insert
+
+from .constants import Constants
+from .migrations import backfill
+from .models import ReviewLog
+
+logger = logging.getLogger(__name__)
+
+MS_PER_DAY = 86400 * 1000
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+
+# review_history.review_date (文本 "YYYY-MM-DD HH:MM:SS.ffffff") 转为毫秒时间戳，
+# 与 to_millis 一样截断到毫秒，双写的记录迁移时能按主键去重
+_HISTORY_MILLIS = ("CAST(strftime('%s', substr(review_date, 1, 19)) AS INTEGER) * 1000 "
+                   "+ CAST(substr(review_date, 21, 3) AS INTEGER)")
+
+
+def to_millis(value: datetime.datetime) -> int:
+    """把不带时区的时间转为毫秒时间戳 (按本地时间存储，不做时区换算)"""
+    delta = value - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1000 + delta.microseconds // 1000
+
+
+def from_millis(value: int) -> datetime.datetime:
+    """毫秒时间戳转回不带时区的时间"""
+    return _EPOCH + datetime.timedelta(milliseconds=value)
+
+
+def day_of(value: int) -> datetime.date:
+    """毫秒时间戳所在的日期"""
+    return _EPOCH.date() + datetime.timedelta(days=value // MS_PER_DAY)
+
+
+def append(session, deck_id: int, word_id: int, quality: int, when: datetime.datetime = None):
+    """在当前事务中追加一条复习记录 (由调用方提交，同一单词同一毫秒的重复记录忽略)"""
+    session.execute(insert(ReviewLog).values(
+        deck_id=deck_id, reviewed_at=to_millis(when or datetime.datetime.now()), word_id=word_id, quality=quality
+    ).on_conflict_do_nothing())
+
+
+def scan(db, deck_id: int, since: datetime.datetime = None,
+         batch_size: int = 10000) -> Iterator[List[Tuple[int, int, int]]]:
+    """按时间顺序分批读取一个词库的复习记录 (用于统计和复习算法训练)
+
+    Args:
+        db: 数据库
+        deck_id: 词库
+        since: 只读取该时间之后的记录
+        batch_size: 每批的行数
+
+    Yields:
+        [(毫秒时间戳, 单词id, 评分), ...]
+    """
+    start = to_millis(since) if since else 0
+    with db.engine.connect() as conn:
+        cursor = conn.exec_driver_sql(
+            "SELECT reviewed_at, word_id, quality FROM review_log "
+            "WHERE deck_id = ? AND reviewed_at >= ? ORDER BY reviewed_at",
+            (deck_id, start))
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            yield [tuple(row) for row in rows]
+
+
+def daily_counts(session, start: datetime.date, deck_id: int) -> Dict[str, int]:
+    """词库从 start 起每天的复习次数 (主键范围扫描，按整数天分组)
+
+    Returns:
+        {日期 (YYYY-MM-DD): 次数}，没有复习的日期不包含在内
+    """
+    start_ms = to_millis(datetime.datetime.combine(start, datetime.time()))
+    rows = session.execute(
+        text("SELECT reviewed_at / :day AS day, COUNT(*) FROM review_log "
+             "WHERE deck_id = :deck AND reviewed_at >= :start GROUP BY day"),
+        {"day": MS_PER_DAY, "start": start_ms, "deck": deck_id}).all()
+    return {day_of(day * MS_PER_DAY).isoformat(): count for day, count in rows}
+
+
+def review_dates(session, deck_id: int) -> List[datetime.date]:
+    """词库中有复习记录的日期 (从近到远)"""
+    rows = session.execute(
+        text("SELECT DISTINCT reviewed_at / :day AS day FROM review_log WHERE deck_id = :deck ORDER BY day DESC"),
+        {"day": MS_PER_DAY, "deck": deck_id}).all()
+    return [day_of(day * MS_PER_DAY) for day, in rows]
+
+
+def migrate_from_history(db, batch_size: int = 10000,
+                         progress: Optional[Callable[[int, int], None]] = None) -> int:
+    """把 review_history 中的记录复制到 review_log (按 id 分批提交，可重复执行)
+
+    同一单词在同一毫秒内的重复记录只保留一条；review_history 还没有 deck_id 列 (分词库之前的数据库) 时
+    记录都属于默认词库
+
+    Args:
+        db: 数据库
+        batch_size: 每批复制的行数
+        progress: 进度回调 progress(已处理行数, 总行数)
+
+    Returns:
+        新写入的记录数
+    """
+    with db.engine.connect() as conn:
+        columns = {row[1] for row in conn.exec_driver_sql("PRAGMA table_info(review_history)")}
+    deck_id = "deck_id" if "deck_id" in columns else str(Constants.DEFAULT_DECK_ID)
+    inserted = backfill(
+        db, "review_history",
+        f"INSERT OR IGNORE INTO review_log (deck_id, reviewed_at, word_id, quality) "
+        f"SELECT {deck_id}, {_HISTORY_MILLIS}, word_id, COALESCE(quality, 0) FROM review_history "
+        f"WHERE id > ? AND id <= ? AND review_date IS NOT NULL",
+        batch_size, progress)
+    logger.info(f"复习日志迁移完成: 新写入 {inserted} 条")
+    return inserted
+
+
+def compact(db) -> int:
+    """删除已删除单词的复习记录并整理数据库文件
+
+    删除单词时日志已一并删除，这里清理的是旧版本留下的记录: 按 (词库, 单词 id) 在 words 中找不到的记录
+    (单词 id 已被同一词库的新单词重用的记录无法识别)
+
+    Returns:
+        删除的记录数
+    """
+    with db.engine.begin() as conn:
+        removed = conn.exec_driver_sql(
+            "DELETE FROM review_log WHERE NOT EXISTS (SELECT 1 FROM words "
+            "WHERE words.id = review_log.word_id AND words.deck_id = review_log.deck_id)").rowcount
+    with db.engine.connect() as conn:
+        conn.exec_driver_sql("VACUUM")
+    logger.info(f"复习日志压缩完成: 删除 {removed} 条无效记录")
+    return removed
+
+
+def table_stats(db) -> Dict[str, int]:
+    """review_history 和 review_log 的行数与占用空间 (字节，需要 SQLite 的 dbstat 模块)"""
+    stats = {}
+    with db.engine.connect() as conn:
+        for table in ("review_history", "review_log"):
+            stats[f"{table}_rows"] = conn.exec_driver_sql(f"SELECT COUNT(*) FROM {table}").scalar()
+        try:
+            rows = conn.exec_driver_sql(
+                "SELECT name, SUM(pgsize) FROM dbstat GROUP BY name").all()
+        except Exception:
+            rows = []
+        sizes = dict(rows)
+        history_indexes = [name for name in sizes if name.startswith("ix_review_history")]
+        if sizes:
+            stats["review_history_bytes"] = sizes.get("review_history", 0) + sum(sizes[n] for n in history_indexes)
+            stats["review_log_bytes"] = sizes.get("review_log", 0)
+    return stats
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+后台任务调度模块
+按用途划分的固定大小线程池 (io、network、tts)，替代各处临时创建的线程
+"""
+
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict
+
+from core.exceptions import TaskRejectedError
+
+logger = logging.getLogger(__name__)
+
+
+class TaskScheduler:
+    """后台任务调度器
+
+    每个命名队列对应一个线程池，并限制排队中的任务数：
+    队列已满或调度器已关闭时 submit 抛出 TaskRejectedError，由调用方决定丢弃或提示
+    """
+
+    # 队列名: (线程数, 最大排队任务数)
+    DEFAULT_QUEUES = {
+        'io': (2, 32),
+        'network': (4, 64),
+        'tts': (1, 4),
+    }
+
+    def __init__(self, queues: Dict[str, tuple] = None):
+        """初始化
+
+        Args:
+            queues: 队列配置 {队列名: (线程数, 最大排队任务数)}，默认为 DEFAULT_QUEUES
+        """
+        self._limits = dict(queues or self.DEFAULT_QUEUES)
+        self._executors = {
+            name: ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"task-{name}")
+            for name, (workers, _) in self._limits.items()
+        }
+        self._pending = {name: 0 for name in self._limits}
+        self._rejected = {name: 0 for name in self._limits}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def submit(self, queue_name: str, func: Callable, *args, **kwargs) -> Future:
+        """提交任务到指定队列
+
+        Args:
+            queue_name: 队列名 (io、network、tts)
+            func: 要执行的函数
+
+        Returns:
+            Future
+
+        Raises:
+            TaskRejectedError: 队列已满或调度器已关闭
+        """
+        if queue_name not in self._executors:
+            raise ValueError(f"未知的任务队列: {queue_name}")
+
+        with self._lock:
+            if self._closed:
+                raise TaskRejectedError("任务调度器已关闭")
+            if self._pending[queue_name] >= self._limits[queue_name][1]:
+                self._rejected[queue_name] += 1
+                raise TaskRejectedError(f"任务队列 '{queue_name}' 已满")
+            self._pending[queue_name] += 1
+            future = self._executors[queue_name].submit(func, *args, **kwargs)
+
+        future.add_done_callback(lambda f: self._on_done(queue_name))
+        return future
+
+    def _on_done(self, queue_name: str):
+        with self._lock:
+            self._pending[queue_name] -= 1
+
+    def pending(self, queue_name: str) -> int:
+        """指定队列中尚未完成的任务数"""
+        with self._lock:
+            return self._pending[queue_name]
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """各队列的线程数、未完成任务数和被拒绝任务数"""
+        with self._lock:
+            return {
+                name: {
+                    'workers': workers,
+                    'max_pending': max_pending,
+                    'pending': self._pending[name],
+                    'rejected': self._rejected[name]
+                }
+                for name, (workers, max_pending) in self._limits.items()
+            }
+
+    def shutdown(self, wait: bool = False):
+        """关闭调度器，取消尚未开始的任务
+
+        Args:
+            wait: 是否等待正在执行的任务结束
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        for executor in self._executors.values():
+            executor.shutdown(wait=wait, cancel_futures=True)
+        logger.info("后台任务调度器已关闭")
+
+
+_default_scheduler = None
+_default_scheduler_lock = threading.Lock()
+
+
+def get_task_scheduler() -> TaskScheduler:
+    """获取进程内共享的任务调度器"""
+    global _default_scheduler
+    if _default_scheduler is None:
+        with _default_scheduler_lock:
+            if _default_scheduler is None:
+                _default_scheduler = TaskScheduler()
+    return _default_scheduler
@@ -6,38 +6,140 @@
 """
 
 import logging
-from typing import Dict, List, Optional
+import threading
+from typing import Dict, List, Optional, Sequence
 
+from .constants import Constants
 from .database import Database
+from .word_rows import LIST_COLUMNS
+from services.deck_service import DeckService
 from services.word_service import WordService
 from services.review_service import ReviewService
 from services.stats_service import StatsService
 from services.dictionary_service import DictionaryService
 from services.tts_service import TTSService
+from utils.profiling import startup_profiler
 
 logger = logging.getLogger(__name__)
 
+
+class _LazyService:
+    """延迟构建的服务属性
+
+    首次访问时调用工厂函数创建实例并写入实例字典，之后直接命中实例属性；
+    也可以直接赋值替换 (如注入共享的词典API)
+    """
+
+    def __init__(self, factory):
+        self.factory = factory
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        with obj._service_lock:
+            if self.name not in obj.__dict__:
+                with startup_profiler.phase(f"构建 {self.name}"):
+                    obj.__dict__[self.name] = self.factory(obj)
+            return obj.__dict__[self.name]
+
+
 class WordManager:
-    """单词管理器 (Facade)"""
+    """单词管理器 (Facade)
+
+    数据库和各个服务在首次使用时才创建，未用到的服务 (如 CLI 中的语音) 不产生开销。
+    每个管理器限定在一个词库内；同一数据库中其他词库的管理器用 for_deck 创建，
+    共用数据库连接池、词典API (及其缓存) 和语音服务
+    """
+    
+    def __init__(self, db_path: str = None, deck: str = None):
+        """初始化单词管理器 (服务按需创建)
+
+        Args:
+            db_path: 数据库文件路径 (默认 data/words.db)
+            deck: 词库名称，不存在时创建 (默认词库为 Constants.DEFAULT_DECK_NAME)
+        """
+        self.db_path = db_path
+        self.deck_name = deck or Constants.DEFAULT_DECK_NAME
+        # 共用资源的管理器 (for_deck 创建的管理器指向最初的管理器)
+        self._root = None
+        self._service_lock = threading.RLock()
+    
+    db = _LazyService(lambda self: self._root.db if self._root else Database(self.db_path))
+    deck_service = _LazyService(lambda self: DeckService(self.db))
+    stats_service = _LazyService(
+        lambda self: StatsService(self.db, snapshot=lambda: self.deck_snapshot, deck_id=self.deck_id))
+    tts_service = _LazyService(lambda self: self._root.tts_service if self._root else TTSService())
+    
+    @_LazyService
+    def deck_id(self):
+        if self.deck_name == Constants.DEFAULT_DECK_NAME:
+            return Constants.DEFAULT_DECK_ID
+        return self.deck_service.get_or_create_deck(self.deck_name)
     
-    def __init__(self, db_path: str = None):
-        """初始化单词管理器，并注入具体服务"""
-        self.db = Database(db_path)
-        
-        # 实例化各个服务
-        self.word_service = WordService(self.db)
-        self.review_service = ReviewService(self.db)
-        self.stats_service = StatsService(self.db)
-        self.dict_service = DictionaryService(self.db)
-        self.tts_service = TTSService()
-        
-        # 为了兼容旧代码，保留 dictionary_api 引用
-        self.dictionary_api = self.dict_service.dictionary_api
+    @_LazyService
+    def dict_service(self):
+        # 词典API在所有词库间共用，词库成员位图每个词库一份
+        shared_api = self._root.dictionary_api if self._root else None
+        return DictionaryService(self.db, self.deck_id, dictionary_api=shared_api)
+    
+    @_LazyService
+    def word_service(self):
+        service = WordService(self.db, self.deck_id)
+        # 单词增删时同步随机选词使用的词库成员位图和词库快照
+        service.add_listener(self._on_word_change)
+        return service
+    
+    @_LazyService
+    def review_service(self):
+        service = ReviewService(self.db, self.deck_id)
+        # 复习后刷新词库快照中该单词的复习参数
+        service.add_listener(self._on_word_change)
+        return service
+    
+    @_LazyService
+    def deck_snapshot(self):
+        # 分析用的列式快照 (首次使用时才导入 NumPy)
+        from .deck_snapshot import DeckSnapshot
+        return DeckSnapshot(self.db, self.deck_id)
+    
+    @_LazyService
+    def dictionary_api(self):
+        # 与词典服务共用同一个实例，避免重复加载缓存
+        return self.dict_service.dictionary_api
+    
+    def for_deck(self, deck: str) -> "WordManager":
+        """同一数据库中另一个词库的管理器 (共用数据库连接池、词典API和语音服务)"""
+        manager = WordManager(self.db_path, deck)
+        manager._root = self._root or self
+        return manager
+    
+    def list_decks(self) -> List[Dict]:
+        """委托给 DeckService，返回所有词库及其单词数"""
+        return self.deck_service.list_decks()
+    
+    def _on_word_change(self, event: str, word_text: str = None):
+        """转发单词变更事件 (词典服务或快照尚未创建时无需处理)"""
+        if 'dict_service' in self.__dict__:
+            self.dict_service.on_word_change(event, word_text)
+        if 'deck_snapshot' in self.__dict__:
+            self.deck_snapshot.on_word_change(event, word_text)
     
     def speak(self, text: str):
         """语音播放"""
         self.tts_service.speak(text)
     
+    def warm_up_speech(self):
+        """在后台提前初始化 TTS 引擎"""
+        self.tts_service.warm_up()
+    
+    def prerender_speech(self, texts: List[str]):
+        """后台预合成即将播放的语音"""
+        return self.tts_service.prerender(texts)
+    
     def add_word_direct(self, word_text: str, meaning: str, example: str = "", phonetic: str = "") -> bool:
         """委托给 WordService"""
         return self.word_service.add_word(word_text, meaning, example, phonetic)
@@ -58,6 +160,10 @@ class WordManager:
         """委托给 WordService"""
         return self.word_service.get_all_words()
 
+    def list_word_rows(self, columns: Sequence[str] = LIST_COLUMNS, keyword: str = None) -> List[tuple]:
+        """委托给 WordService，返回只包含指定列的轻量级行记录"""
+        return self.word_service.list_rows(columns, keyword)
+
     def search_words(self, keyword: str) -> List[Dict]:
         """委托给 WordService"""
         return self.word_service.search_words(keyword)
@@ -83,6 +189,14 @@ class WordManager:
         """委托给 ReviewService"""
         return self.review_service.get_future_review_stats(days)
 
+    def get_word_metrics(self, words: List[str]) -> Dict[str, Dict]:
+        """委托给 StatsService，批量获取单词的复习参数"""
+        return self.stats_service.get_word_metrics(words)
+
+    def get_random_new_words(self, count: int = 1, vocabulary_level: str = "cet6", translate: bool = False) -> List[Dict]:
+        """委托给 DictionaryService，只返回尚未加入词库的单词"""
+        return self.dict_service.get_random_new_words(count, vocabulary_level, translate)
+
     def clear_all_words(self) -> bool:
         """委托给 WordService"""
         return self.word_service.clear_all_words()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+单词行记录模块
+列表视图使用的轻量级记录: 只包含查询的列，日期保留为 datetime，显示时才格式化
+"""
+
+from collections import namedtuple
+from functools import lru_cache
+from typing import Tuple
+
+from .models import Word
+
+# 列表视图默认查询的列 (与查看单词页的表格一致)
+LIST_COLUMNS = ("word", "meaning", "category", "added_date", "review_count", "next_review")
+
+# 导出使用的列 (与 Word.to_dict() 的字段和顺序一致)
+EXPORT_COLUMNS = ("word", "phonetic", "meaning", "example", "category", "added_date", "last_review",
+                  "next_review", "review_count", "mastery_level", "easiness_factor", "interval")
+
+# 日期列
+DATE_COLUMNS = frozenset(("added_date", "last_review", "next_review"))
+
+# 列表中显示日期的格式
+DATE_FORMAT = "%Y-%m-%d"
+
+# 与 Word.to_dict() 一致的完整时间格式
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+class _WordRowMixin:
+    """行记录的公共方法 (与 namedtuple 组合，不增加实例属性)"""
+
+    __slots__ = ()
+
+    def date(self, column: str, fmt: str = DATE_FORMAT) -> str:
+        """格式化日期列，值为空时返回空字符串"""
+        value = getattr(self, column)
+        return value.strftime(fmt) if value else ''
+
+    def to_dict(self) -> dict:
+        """转为字典，日期格式与 Word.to_dict() 一致 (用于导出)"""
+        return {
+            name: (self.date(name, DATETIME_FORMAT) or None) if name in DATE_COLUMNS else value
+            for name, value in zip(self._fields, self)
+        }
+
+
+@lru_cache(maxsize=None)
+def word_row_type(columns: Tuple[str, ...]):
+    """获取指定列组合的行记录类型 (按列组合缓存)
+
+    Args:
+        columns: 列名元组，须为 words 表的列
+
+    Returns:
+        namedtuple 子类，字段与列名相同
+
+    Raises:
+        ValueError: 列名为空或不存在
+    """
+    unknown = [name for name in columns if name not in Word.__table__.columns]
+    if not columns or unknown:
+        raise ValueError(f"无效的列: {unknown or columns}")
+    return type("WordRow", (_WordRowMixin, namedtuple("WordRow", columns)), {"__slots__": ()})
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+图表图片缓存模块
+保存渲染好的统计图表 PNG，数据、主题和尺寸都未变化时直接显示图片，无需加载 matplotlib
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from typing import Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class ChartImageCache:
+    """统计图表 PNG 缓存
+
+    缓存键为 (图表名, 数据哈希, 主题, 像素尺寸) 的哈希值；
+    文件数超过上限时按修改时间删除最旧的文件
+    """
+
+    SUFFIX = ".png"
+
+    def __init__(self, cache_dir: str, max_entries: int = 32):
+        """初始化
+
+        Args:
+            cache_dir: 缓存目录
+            max_entries: 最多保存的图片数
+        """
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(chart: str, data_digest: str, theme: str, size: Tuple[int, int]) -> str:
+        """根据图表数据、主题和尺寸计算缓存键"""
+        content = f"{chart}\0{data_digest}\0{theme}\0{size[0]}x{size[1]}"
+        return hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + self.SUFFIX)
+
+    def get(self, key: str) -> Optional[str]:
+        """查找缓存的图片，命中时返回路径"""
+        path = self._path(key)
+        try:
+            if os.path.getsize(path) > 0:
+                os.utime(path)
+                return path
+        except OSError:
+            pass
+        return None
+
+    def put(self, key: str, figure) -> Optional[str]:
+        """把 matplotlib Figure 保存为 PNG，返回文件路径"""
+        path = self._path(key)
+        part_path = path + ".part"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            figure.savefig(part_path, format='png', facecolor=figure.get_facecolor())
+            os.replace(part_path, path)
+        except Exception as e:
+            logger.warning(f"保存图表缓存失败: {e}")
+            return None
+        self._evict()
+        return path
+
+    def _evict(self):
+        """删除超出数量上限的最旧文件"""
+        with self._lock:
+            try:
+                files = [os.path.join(self.cache_dir, name) for name in os.listdir(self.cache_dir)
+                         if name.endswith(self.SUFFIX)]
+                files.sort(key=os.path.getmtime)
+            except OSError:
+                return
+            for path in files[:max(len(files) - self.max_entries, 0)]:
+                try:
+                    os.remove(path)
+                except OSError as e:
+                    logger.warning(f"删除图表缓存文件失败: {e}")
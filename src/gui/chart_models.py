@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+统计图表数据模型
+在后台线程中查询并汇总统计数据，生成不可变的图表模型交给界面绘制
+"""
+
+import datetime
+import hashlib
+from typing import NamedTuple, Tuple
+from utils.decorators import timed
+
+# 热力图显示的周数
+HEATMAP_WEEKS = 25
+
+
+class TrendChartModel(NamedTuple):
+    """学习趋势图: 每天的新增单词数和复习次数"""
+    days: int
+    dates: Tuple[str, ...]
+    new_counts: Tuple[int, ...]
+    review_counts: Tuple[int, ...]
+
+
+class ForecastChartModel(NamedTuple):
+    """复习预警图: 未来每天预计复习的单词数"""
+    dates: Tuple[str, ...]
+    counts: Tuple[int, ...]
+
+
+class HeatmapChartModel(NamedTuple):
+    """学习热力图: 7 行 (周一到周日) x weeks 列的活跃度"""
+    weeks: int
+    data: Tuple[Tuple[int, ...], ...]
+
+
+class StatsModels(NamedTuple):
+    """统计页所需的全部数据"""
+    stats: Tuple[Tuple[str, object], ...]
+    review_count: int
+    trend: TrendChartModel
+    forecast: ForecastChartModel
+    heatmap: HeatmapChartModel
+
+    def overview(self) -> dict:
+        """概览统计 (字典副本)"""
+        return dict(self.stats)
+
+
+def model_digest(model) -> str:
+    """计算图表模型的内容哈希，数据不变时哈希不变"""
+    return hashlib.sha1(repr(model).encode('utf-8')).hexdigest()
+
+
+def build_trend_model(activity: dict, days: int) -> TrendChartModel:
+    """根据最近学习记录生成趋势图模型"""
+    daily_stats = activity.get('daily_stats', {})
+    dates = tuple(sorted(daily_stats.keys()))
+    return TrendChartModel(
+        days=days,
+        dates=dates,
+        new_counts=tuple(daily_stats[d].get('new', 0) for d in dates),
+        review_counts=tuple(daily_stats[d].get('review', 0) for d in dates),
+    )
+
+
+def build_forecast_model(future_stats: dict) -> ForecastChartModel:
+    """根据未来复习统计生成预警图模型"""
+    dates = tuple(sorted(future_stats.keys()))
+    return ForecastChartModel(dates=dates, counts=tuple(future_stats[d] for d in dates))
+
+
+def build_heatmap_model(activity: dict, weeks: int = HEATMAP_WEEKS,
+                        today: datetime.date = None) -> HeatmapChartModel:
+    """把最近 weeks 周的学习记录按 (星期, 周) 汇总成热力图模型"""
+    days_to_show = weeks * 7
+    today = today or datetime.date.today()
+    end_date = today + datetime.timedelta(days=(6 - today.weekday()))
+    start_date = end_date - datetime.timedelta(days=days_to_show - 1)
+
+    data = [[0] * weeks for _ in range(7)]
+    for date_str, stats in activity.get('daily_stats', {}).items():
+        try:
+            cur_date = datetime.datetime.strptime(date_str, '%Y-%m-%d').date()
+        except (TypeError, ValueError):
+            continue
+        if start_date <= cur_date <= end_date:
+            diff = (cur_date - start_date).days
+            data[diff % 7][diff // 7] += stats.get('new', 0) + stats.get('review', 0)
+    return HeatmapChartModel(weeks=weeks, data=tuple(tuple(row) for row in data))
+
+
+@timed("ui")
+def build_stats_models(word_manager, trend_days: int) -> StatsModels:
+    """查询统计页所需的全部数据 (在后台线程中调用)
+
+    Args:
+        word_manager: 单词管理器
+        trend_days: 趋势图显示的天数
+
+    Returns:
+        统计页数据模型
+    """
+    stats = word_manager.get_statistics()
+    review_count = len(word_manager.get_words_for_review())
+    trend_activity = word_manager.get_recent_activity(days=trend_days)
+    heatmap_days = HEATMAP_WEEKS * 7
+    if heatmap_days == trend_days:
+        heatmap_activity = trend_activity
+    else:
+        heatmap_activity = word_manager.get_recent_activity(days=heatmap_days)
+
+    return StatsModels(
+        stats=tuple(sorted(stats.items())),
+        review_count=review_count,
+        trend=build_trend_model(trend_activity, trend_days),
+        forecast=build_forecast_model(word_manager.get_future_review_stats(days=7)),
+        heatmap=build_heatmap_model(heatmap_activity),
+    )
@@ -12,26 +12,53 @@ import sys
 import os
 import logging
 import time
-import threading
+import argparse
+import importlib
 
 logger = logging.getLogger(__name__)
 
 # 添加src目录到Python路径
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# 最先导入，使启动耗时从这里开始计算
+from utils.profiling import startup_profiler
 from core.word_manager import WordManager
 from core.scheduler import Scheduler
 from core.config_manager import ConfigManager
 from api.buffered_dictionary_api import BufferedDictionaryAPI
+from services.cache_warmer import CacheWarmer
+from gui.task_runner import TkTaskRunner
+from core.task_scheduler import get_task_scheduler
 from utils.common import init_logging
-from gui.tabs import HomeTab, AddTab, ViewTab, ReviewTab, SearchTab, StatsTab, SettingsTab
+from utils.metrics import metrics
+from gui.tabs.home_tab import HomeTab
+
+# 标签页: 标题 -> (组件属性名, gui.tabs 下的模块名, 类名)
+# 首页在启动时创建，其余标签页的模块 (及 matplotlib 等依赖) 在首次切换到该页时才导入
+TAB_SPECS = {
+    "首页": ("home_tab_comp", "home_tab", "HomeTab"),
+    "添加单词": ("add_tab_comp", "add_tab", "AddTab"),
+    "查看单词": ("view_tab_comp", "view_tab", "ViewTab"),
+    "复习单词": ("review_tab_comp", "review_tab", "ReviewTab"),
+    "搜索单词": ("search_tab_comp", "search_tab", "SearchTab"),
+    "学习统计": ("stats_tab_comp", "stats_tab", "StatsTab"),
+    "系统设置": ("settings_tab_comp", "settings_tab", "SettingsTab"),
+}
+
+# 首次绘制后在空闲时间依次创建的标签页 (常用的在前)
+IDLE_TAB_ORDER = ["复习单词", "添加单词", "查看单词", "搜索单词", "系统设置", "学习统计"]
 
 
 class WordReminderGUI:
     """单词记忆助手图形界面"""
     
-    def __init__(self, root):
-        """初始化GUI"""
+    def __init__(self, root, db_path=None):
+        """初始化GUI
+
+        Args:
+            root: 主窗口
+            db_path: 数据库文件路径 (默认使用 data/words.db)
+        """
         self.root = root
         
         # 初始化配置管理器
@@ -53,29 +80,37 @@ class WordReminderGUI:
         self.setup_styles()
         
         # 初始化数据管理器
-        self.word_manager = WordManager()
+        self.word_manager = WordManager(db_path=db_path)
         self.scheduler = Scheduler(self.word_manager)
         
-        # 初始化缓冲字典API
-        self.buffered_dictionary_api = BufferedDictionaryAPI()
-        self.word_manager.dictionary_api = self.buffered_dictionary_api
+        # 缓冲字典API与词典服务共用同一个实例 (只加载一次缓存)
+        self.buffered_dictionary_api = self.word_manager.dictionary_api
+        if not isinstance(self.buffered_dictionary_api, BufferedDictionaryAPI):
+            self.buffered_dictionary_api = BufferedDictionaryAPI()
+            self.word_manager.dictionary_api = self.buffered_dictionary_api
+            self.word_manager.dict_service.dictionary_api = self.buffered_dictionary_api
+        self.cache_warmer = None
         
         # 性能优化相关变量
         self.last_refresh_time = 0
         self.refresh_cooldown = 1.0  # 刷新冷却时间（秒）
-        self.async_operations = []
         
-        # 创建界面
-        self.create_widgets()
+        # 后台任务统一交给共享的调度器，结果经 task_runner 交回主线程
+        self.task_scheduler = get_task_scheduler()
+        self.task_runner = TkTaskRunner(self.root, self.task_scheduler)
         
-        # 加载数据
-        self.refresh_word_list()
+        # 创建界面
+        with startup_profiler.phase("创建界面组件"):
+            self.create_widgets()
         
         # 绑定关闭事件
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
         
         # 绑定键盘快捷键
         self.root.bind('<Control-f>', lambda event: self.focus_search_entry())
+        # 隐藏的性能指标面板
+        self.root.bind('<Control-P>', lambda event: self.show_metrics_panel())
+        self.metrics_panel = None
         
         # 检查词典API状态
         self.check_dictionary_api_status()
@@ -83,8 +118,24 @@ class WordReminderGUI:
         # 初始化加载指示器
         self.loading_window = None
         
-        # 启动后台预加载
-        self.start_background_preloading()
+        # 启动时只创建首页；单词列表在切换到查看单词页时加载，
+        # 其余标签页、缓存预热和 TTS 引擎在首次绘制完成后的空闲时间逐步准备
+        self.run_when_idle(self._build_idle_tabs, list(IDLE_TAB_ORDER))
+    
+    def run_when_idle(self, func, *args):
+        """在主循环处理完已排队的事件和界面绘制后执行"""
+        self.root.after(0, lambda: self.root.after_idle(func, *args))
+    
+    def _build_idle_tabs(self, titles):
+        """每次空闲时创建一个标签页，全部完成后启动后台任务"""
+        if titles:
+            self.ensure_tab(titles.pop(0))
+            self.run_when_idle(self._build_idle_tabs, titles)
+            return
+        with startup_profiler.phase("启动缓存预热"):
+            self.start_background_preloading()
+        # 在后台初始化 TTS 引擎，避免首次朗读时等待
+        self.word_manager.warm_up_speech()
     
     def setup_styles(self):
         """设置界面样式"""
@@ -153,8 +204,8 @@ class WordReminderGUI:
             container.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
             
             # 添加消息和进度条
-            label = ctk.CTkLabel(container, text=message, font=('Arial', 14))
-            label.pack(pady=(10, 15))
+            self.loading_label = ctk.CTkLabel(container, text=message, font=('Arial', 14))
+            self.loading_label.pack(pady=(10, 15))
             
             self.loading_progress = ctk.CTkProgressBar(container, mode='indeterminate')
             self.loading_progress.pack(padx=20, pady=10, fill=tk.X)
@@ -162,6 +213,8 @@ class WordReminderGUI:
             
             # 更新界面
             self.loading_window.update_idletasks()
+        else:
+            self.loading_label.configure(text=message)
         
         # 更新状态栏
         self.status_bar.configure(text=message)
@@ -178,12 +231,16 @@ class WordReminderGUI:
         self.check_dictionary_api_status()
     
     def start_background_preloading(self):
-        """启动后台预加载"""
-        # 获取当前词库中的单词列表用于预加载
-        all_words = self.word_manager.get_all_words()
-        if all_words:
-            words_to_preload = [w['word'] for w in all_words[:50]]  # 预加载前50个单词
-            self.buffered_dictionary_api.start_preloading(words_to_preload)
+        """启动后台缓存预热 (按复习到期顺序，其次为默认词汇级别)"""
+        self.cache_warmer = CacheWarmer(self.buffered_dictionary_api, self.word_manager, self.config_manager)
+        
+        def on_error(e):
+            logger.error(f"缓存预热排队失败: {e}")
+            self.cache_warmer.start()
+        
+        # 查询复习队列的耗时与词库大小有关，放到 io 队列中执行
+        self.async_operation(self.cache_warmer.schedule,
+                             on_success=lambda _: self.cache_warmer.start(), on_error=on_error)
     
     def refresh_word_list_optimized(self):
         """优化后的刷新单词列表方法，避免频繁刷新"""
@@ -195,23 +252,14 @@ class WordReminderGUI:
         self.last_refresh_time = current_time
         self.refresh_word_list()
     
-    def async_operation(self, func, *args, **kwargs):
-        """异步执行操作"""
-        def wrapper():
-            try:
-                func(*args, **kwargs)
-            except Exception as e:
-                logger.error(f"异步操作执行失败: {e}")
-        
-        thread = threading.Thread(target=wrapper, daemon=True)
-        thread.start()
-        self.async_operations.append(thread)
+    def async_operation(self, func, *args, on_success=None, on_error=None, **kwargs):
+        """异步执行操作 (io 队列)，回调在主线程中执行"""
+        return self.task_runner.submit(func, *args, on_success=on_success, on_error=on_error,
+                                       queue_name='io', **kwargs)
     
     def check_async_operations(self):
-        """检查异步操作状态"""
-        # 清理已完成的操作
-        self.async_operations = [op for op in self.async_operations if op.is_alive()]
-        return len(self.async_operations)
+        """检查异步操作状态 (尚未完成的任务数)"""
+        return self.task_runner.pending_count()
     
     def get_performance_stats(self):
         """获取性能统计信息"""
@@ -224,7 +272,10 @@ class WordReminderGUI:
                 'cache_size': cache_stats['cache_size'],
                 'total_requests': cache_stats['total_requests'],
                 'async_operations': async_ops,
-                'word_count': self.word_manager.get_statistics().get('total_words', 0)
+                'task_queues': self.task_scheduler.get_stats(),
+                'warmup_progress': self.cache_warmer.get_progress() if self.cache_warmer else {},
+                'word_count': self.word_manager.get_statistics().get('total_words', 0),
+                'metrics': metrics.snapshot()
             }
             return stats
         return {}
@@ -264,28 +315,46 @@ class WordReminderGUI:
         # 绑定标签页切换事件以添加过渡效果
         self.tabview.configure(command=self.on_tab_change)
         
-        # 初始化标签页组件
+        # 初始化首页，其余标签页在首次切换时创建
         self.home_tab_comp = HomeTab(self.home_tab, self)
-        self.add_tab_comp = AddTab(self.add_tab, self)
-        self.view_tab_comp = ViewTab(self.view_tab, self)
-        self.review_tab_comp = ReviewTab(self.review_tab, self)
-        self.search_tab_comp = SearchTab(self.search_tab, self)
-        self.stats_tab_comp = StatsTab(self.stats_tab, self)
-        self.settings_tab_comp = SettingsTab(self.settings_tab, self)
-    
+
+    def ensure_tab(self, title):
+        """获取标签页组件，首次使用时导入模块并创建
+
+        Args:
+            title: 标签页标题
+
+        Returns:
+            标签页组件
+        """
+        attr, module_name, class_name = TAB_SPECS[title]
+        component = getattr(self, attr, None)
+        if component is None:
+            with startup_profiler.phase(f"创建标签页 {title}"):
+                module = importlib.import_module(f"gui.tabs.{module_name}")
+                component = getattr(module, class_name)(self.tabview.tab(title), self)
+            setattr(self, attr, component)
+        return component
+
+    def select_tab(self, title):
+        """切换到指定标签页 (tabview.set 不会触发切换回调)"""
+        self.tabview.set(title)
+        self.on_tab_change()
+
     def on_tab_change(self):
         """处理标签页切换"""
         current_tab = self.tabview.get()
+        component = self.ensure_tab(current_tab)
         
         # 刷新对应标签页的数据
-        if current_tab == "学习统计" and hasattr(self, 'stats_tab_comp'):
-            self.stats_tab_comp.show_statistics()
-        elif current_tab == "首页" and hasattr(self, 'home_tab_comp'):
-            self.home_tab_comp.update_statistics()
-        elif current_tab == "复习单词" and hasattr(self, 'review_tab_comp'):
-            self.review_tab_comp.update_review_count()
-        elif current_tab == "查看单词" and hasattr(self, 'view_tab_comp'):
-            self.view_tab_comp.refresh_word_list()
+        if current_tab == "学习统计":
+            component.show_statistics()
+        elif current_tab == "首页":
+            component.update_statistics()
+        elif current_tab == "复习单词":
+            component.update_review_count()
+        elif current_tab == "查看单词":
+            component.refresh_word_list()
 
     def refresh_word_list(self):
         """刷新单词列表 (委托给 ViewTab)"""
@@ -304,20 +373,52 @@ class WordReminderGUI:
 
     def focus_search_entry(self):
         """聚焦到搜索输入框 (委托给 SearchTab)"""
-        self.tabview.set("搜索单词")
-        if hasattr(self, 'search_tab_comp'):
-            self.search_tab_comp.search_entry.focus_set()
+        self.select_tab("搜索单词")
+        self.search_tab_comp.search_entry.focus_set()
+
+    def show_metrics_panel(self):
+        """打开性能指标面板 (已打开时置于最前)"""
+        if self.metrics_panel is not None and self.metrics_panel.winfo_exists():
+            self.metrics_panel.lift()
+            return
+        from gui.metrics_panel import MetricsPanel
+        self.metrics_panel = MetricsPanel(self)
 
     def on_closing(self):
         """处理窗口关闭"""
         if messagebox.askokcancel("退出", "确定要退出单词记忆助手吗？"):
+            if self.cache_warmer:
+                self.cache_warmer.stop()
+            self.task_runner.shutdown()
+            self.task_scheduler.shutdown()
+            self.buffered_dictionary_api.flush()
+            # 保存本次运行的性能指标，可用 "python src/cli/main.py stats --perf" 查看
+            metrics.dump()
             self.root.destroy()
 
 
-def main():
+def main(argv=None):
     """主函数"""
-    root = ctk.CTk()
-    app = WordReminderGUI(root)
+    parser = argparse.ArgumentParser(description="单词记忆助手 (GUI)")
+    parser.add_argument("--profile-startup", action="store_true", help="输出启动耗时分析报告")
+    args = parser.parse_args(argv)
+    
+    if args.profile_startup:
+        startup_profiler.enable()
+        startup_profiler.mark("模块导入完成")
+    
+    with startup_profiler.phase("创建主窗口"):
+        root = ctk.CTk()
+    with startup_profiler.phase("初始化界面"):
+        app = WordReminderGUI(root)
+    
+    if args.profile_startup:
+        def report_first_paint():
+            startup_profiler.mark("首次绘制完成")
+            startup_profiler.print_report()
+        # 进入主循环后，待界面绘制 (空闲任务) 完成再输出报告
+        root.after(0, lambda: root.after_idle(report_first_paint))
+    
     root.mainloop()
 
 
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+性能指标面板
+隐藏的调试窗口 (Ctrl+Shift+P 打开)，每秒刷新显示进程内的性能指标
+"""
+
+import tkinter as tk
+import customtkinter as ctk
+
+from core.query_trace import query_tracer, format_query_stats
+from utils.metrics import metrics, format_metrics
+
+
+class MetricsPanel(ctk.CTkToplevel):
+    """性能指标面板"""
+
+    REFRESH_MS = 1000
+
+    def __init__(self, parent_gui):
+        super().__init__(parent_gui.root)
+        self.parent_gui = parent_gui
+        self.title("性能指标")
+        self.geometry("900x500")
+
+        toolbar = ctk.CTkFrame(self, fg_color="transparent")
+        toolbar.pack(fill=tk.X, padx=10, pady=(10, 0))
+        ctk.CTkButton(toolbar, text="清空", width=80, command=self.reset).pack(side=tk.LEFT)
+        ctk.CTkButton(toolbar, text="保存", width=80, command=metrics.dump).pack(side=tk.LEFT, padx=5)
+
+        self.textbox = ctk.CTkTextbox(self, font=('Courier', 12), wrap=tk.NONE)
+        self.textbox.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self.refresh()
+
+    def refresh(self):
+        """刷新显示，窗口关闭后停止"""
+        if not self.winfo_exists():
+            return
+        lines = [format_metrics(metrics.snapshot()), "", "SQL 查询:", format_query_stats(query_tracer.snapshot())]
+        queues = self.parent_gui.task_scheduler.get_stats()
+        if queues:
+            lines.append("")
+            lines.append("后台队列:")
+            for name, stats in queues.items():
+                lines.append(f"  {name}: " + ", ".join(f"{k}={v}" for k, v in stats.items()))
+        self.textbox.configure(state="normal")
+        self.textbox.delete("1.0", tk.END)
+        self.textbox.insert(tk.END, "\n".join(lines))
+        self.textbox.configure(state="disabled")
+        self.after(self.REFRESH_MS, self.refresh)
+
+    def reset(self):
+        """清空已记录的指标和查询统计"""
+        metrics.reset()
+        query_tracer.reset()
+        self.refresh()
@@ -1,8 +1,29 @@
+"""
+标签页组件
+
+各标签页模块在首次访问时才导入 (PEP 562)，避免启动时加载 matplotlib 等较重的依赖
+"""
+
+import importlib
+
 from .base_tab import BaseTab
-from .home_tab import HomeTab
-from .add_tab import AddTab
-from .view_tab import ViewTab
-from .review_tab import ReviewTab
-from .search_tab import SearchTab
-from .stats_tab import StatsTab
-from .settings_tab import SettingsTab
+
+# 类名 -> 模块名
+_TAB_MODULES = {
+    'HomeTab': 'home_tab',
+    'AddTab': 'add_tab',
+    'ViewTab': 'view_tab',
+    'ReviewTab': 'review_tab',
+    'SearchTab': 'search_tab',
+    'StatsTab': 'stats_tab',
+    'SettingsTab': 'settings_tab',
+}
+
+__all__ = ['BaseTab'] + list(_TAB_MODULES)
+
+
+def __getattr__(name):
+    if name in _TAB_MODULES:
+        module = importlib.import_module(f".{_TAB_MODULES[name]}", __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,7 +4,6 @@
 import tkinter as tk
 from tkinter import messagebox
 import customtkinter as ctk
-import threading
 from .base_tab import BaseTab
 
 class AddTab(BaseTab):
@@ -278,58 +277,69 @@ class AddTab(BaseTab):
             if not messagebox.askyesno("确认", f"单词 '{word}' 已存在，是否更新？"):
                 return
         
-        # 尝试从词典API获取单词信息
+        # 尝试从词典API获取单词信息 (后台查询，不阻塞界面)
+        if hasattr(self.word_manager, 'dictionary_api') and self.word_manager.dictionary_api:
+            self.add_button.configure(state="disabled")
+            self.lookup_word_async(
+                word,
+                on_success=lambda word_info: self._on_word_info_loaded(word, existing_word, word_info),
+                on_error=lambda e: self._on_word_info_error(word, existing_word, e)
+            )
+        else:
+            self._save_word(word, existing_word)
+
+    def _on_word_info_loaded(self, word, existing_word, word_info):
+        """词典查询完成后显示信息并预填充表单"""
+        self.add_button.configure(state="normal")
         meaning = ""
         example = ""
         phonetic = ""
-        if hasattr(self.word_manager, 'dictionary_api') and self.word_manager.dictionary_api:
-            # 显示加载指示器
-            self.parent_gui.show_loading_indicator(f"正在获取单词 '{word}' 的信息...")
+        if word_info:
+            # 显示获取到的信息供用户确认
+            info_text = f"找到单词信息:\n单词: {word_info['word']}"
+            if word_info['phonetic']:
+                info_text += f"\n音标: {word_info['phonetic']}"
+                phonetic = word_info['phonetic']
             
-            try:
-                word_info = self.word_manager.dictionary_api.get_word_info(word)
-                if word_info:
-                    # 显示获取到的信息供用户确认
-                    info_text = f"找到单词信息:\n单词: {word_info['word']}"
-                    if word_info['phonetic']:
-                        info_text += f"\n音标: {word_info['phonetic']}"
-                        phonetic = word_info['phonetic']
-                    
-                    # 优先显示中文释义
-                    if word_info['chinese_meanings']:
-                        info_text += "\n中文释义:"
-                        for i, meaning_info in enumerate(word_info['chinese_meanings'][:3]):  # 只显示前3个中文释义
-                            info_text += f"\n  {i+1}. {meaning_info['part_of_speech']}: {meaning_info['definition']}"
-                        # 优先使用第一个中文释义作为默认释义
-                        meaning = word_info['chinese_meanings'][0]['definition']
-                    
-                    # 如果没有中文释义，显示英文释义
-                    elif word_info['meanings']:
-                        info_text += "\n英文释义:"
-                        for i, meaning_info in enumerate(word_info['meanings'][:3]):  # 只显示前3个释义
-                            info_text += f"\n  {i+1}. {meaning_info['part_of_speech']}: {meaning_info['definition']}"
-                        # 使用第一个释义作为默认释义
-                        meaning = word_info['meanings'][0]['definition']
-                    
-                    if word_info['examples']:
-                        info_text += "\n例句:"
-                        for i, ex in enumerate(word_info['examples'][:2]):  # 只显示前2个例句
-                            info_text += f"\n  {i+1}. {ex}"
-                        # 使用第一个例句作为默认例句
-                        example = word_info['examples'][0]
-                    
-                    # 显示获取到的信息
-                    messagebox.showinfo("词典信息", info_text)
-                else:
-                    # 如果没有获取到信息，显示提示
-                    messagebox.showinfo("词典信息", f"未找到单词 '{word}' 的定义")
-            except Exception as e:
-                # 网络请求或其他错误
-                messagebox.showerror("错误", f"获取单词信息时发生错误:\n{str(e)}")
-            finally:
-                # 隐藏加载指示器
-                self.parent_gui.hide_loading_indicator()
+            # 优先显示中文释义
+            if word_info['chinese_meanings']:
+                info_text += "\n中文释义:"
+                for i, meaning_info in enumerate(word_info['chinese_meanings'][:3]):  # 只显示前3个中文释义
+                    info_text += f"\n  {i+1}. {meaning_info['part_of_speech']}: {meaning_info['definition']}"
+                # 优先使用第一个中文释义作为默认释义
+                meaning = word_info['chinese_meanings'][0]['definition']
+            
+            # 如果没有中文释义，显示英文释义
+            elif word_info['meanings']:
+                info_text += "\n英文释义:"
+                for i, meaning_info in enumerate(word_info['meanings'][:3]):  # 只显示前3个释义
+                    info_text += f"\n  {i+1}. {meaning_info['part_of_speech']}: {meaning_info['definition']}"
+                # 使用第一个释义作为默认释义
+                meaning = word_info['meanings'][0]['definition']
+            
+            if word_info['examples']:
+                info_text += "\n例句:"
+                for i, ex in enumerate(word_info['examples'][:2]):  # 只显示前2个例句
+                    info_text += f"\n  {i+1}. {ex}"
+                # 使用第一个例句作为默认例句
+                example = word_info['examples'][0]
+            
+            # 显示获取到的信息
+            messagebox.showinfo("词典信息", info_text)
+        else:
+            # 如果没有获取到信息，显示提示
+            messagebox.showinfo("词典信息", f"未找到单词 '{word}' 的定义")
         
+        self._save_word(word, existing_word, meaning, example, phonetic)
+
+    def _on_word_info_error(self, word, existing_word, error):
+        """词典查询失败 (网络请求或其他错误)"""
+        self.add_button.configure(state="normal")
+        messagebox.showerror("错误", f"获取单词信息时发生错误:\n{str(error)}")
+        self._save_word(word, existing_word)
+
+    def _save_word(self, word, existing_word, meaning="", example="", phonetic=""):
+        """使用表单内容 (及自动获取的信息) 添加或更新单词"""
         # 获取用户输入的释义（如果有自动获取的释义，则预填充）
         if meaning:
             self.meaning_entry.delete(0, tk.END)
@@ -459,24 +469,14 @@ class AddTab(BaseTab):
         # 显示加载指示器
         self.parent_gui.show_loading_indicator("正在从词典获取随机单词...")
         
-        # 异步执行获取操作
-        def async_generate():
-            try:
-                # 获取1个随机单词
-                vocab_level = self.vocab_level_var.get()
-                
-                # 使用缓冲字典API
-                random_words_info = self.buffered_dictionary_api.get_random_words_info(1, vocabulary_level=vocab_level)
-                
-                # 在主线程中更新UI
-                self.parent_gui.root.after(0, lambda: self._update_ui_with_random_words(random_words_info))
-                
-            except Exception as e:
-                # 在主线程中显示错误
-                self.parent_gui.root.after(0, lambda: self._show_random_words_error(str(e)))
-        
-        # 启动异步操作
-        threading.Thread(target=async_generate, daemon=True).start()
+        # 获取1个随机单词，只从尚未加入词库的单词中抽取 (后台执行，结果在主线程中更新界面)
+        vocab_level = self.vocab_level_var.get()
+        self.parent_gui.task_runner.submit(
+            self.word_manager.get_random_new_words, 1, vocabulary_level=vocab_level, translate=True,
+            on_success=self._update_ui_with_random_words,
+            on_error=lambda e: self._show_random_words_error(str(e)),
+            owner=self
+        )
 
     def _update_ui_with_random_words(self, random_words_info):
         """在主线程中更新UI显示随机单词"""
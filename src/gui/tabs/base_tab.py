@@ -15,3 +15,42 @@ class BaseTab(ctk.CTkFrame):
         
         # 确保标签页填满父容器
         self.pack(fill="both", expand=True)
+
+    def lookup_word_async(self, word, on_success, on_error=None, on_progress=None, owner=None):
+        """在后台查询单词信息 (含中文释义)，结果在主线程中回调
+
+        未指定 on_progress 时使用全局加载指示器显示进度；
+        owner 销毁 (如对话框关闭) 时取消任务
+
+        Returns:
+            任务句柄
+        """
+        dictionary_api = self.word_manager.dictionary_api
+
+        def lookup(progress):
+            word_info = dictionary_api.get_word_info(word)
+            if word_info and not word_info.get('chinese_meanings'):
+                progress(f"正在翻译单词 '{word}' 的释义...")
+                dictionary_api.translate_meanings(word_info)
+            return word_info
+
+        use_indicator = on_progress is None
+        if use_indicator:
+            on_progress = self.parent_gui.show_loading_indicator
+
+        def finish(callback):
+            def wrapper(value):
+                if use_indicator:
+                    self.parent_gui.hide_loading_indicator()
+                if callback:
+                    callback(value)
+            return wrapper
+
+        on_progress(f"正在获取单词 '{word}' 的信息...")
+        return self.parent_gui.task_runner.submit(
+            lookup,
+            on_success=finish(on_success),
+            on_error=finish(on_error),
+            on_progress=on_progress,
+            owner=owner or self
+        )
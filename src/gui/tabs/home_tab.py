@@ -2,8 +2,12 @@
 # -*- coding: utf-8 -*-
 
 import tkinter as tk
+import logging
 import customtkinter as ctk
 from .base_tab import BaseTab
+from utils.decorators import timed
+
+logger = logging.getLogger(__name__)
 
 class HomeTab(BaseTab):
     """主页标签页"""
@@ -29,21 +33,21 @@ class HomeTab(BaseTab):
         self.total_card = ctk.CTkFrame(stats_frame, **card_settings)
         self.total_card.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 10))
         ctk.CTkLabel(self.total_card, text="📚 总单词数", font=('Arial', 14)).pack(pady=(15, 0))
-        self.total_val = ctk.CTkLabel(self.total_card, text="0", font=('Arial', 24, 'bold'))
+        self.total_val = ctk.CTkLabel(self.total_card, text="-", font=('Arial', 24, 'bold'))
         self.total_val.pack(pady=(5, 15))
         
         # 卡片2: 待复习
         self.review_card = ctk.CTkFrame(stats_frame, **card_settings)
         self.review_card.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=10)
         ctk.CTkLabel(self.review_card, text="⏳ 待复习", font=('Arial', 14)).pack(pady=(15, 0))
-        self.review_val = ctk.CTkLabel(self.review_card, text="0", font=('Arial', 24, 'bold'), text_color="#e74c3c")
+        self.review_val = ctk.CTkLabel(self.review_card, text="-", font=('Arial', 24, 'bold'), text_color="#e74c3c")
         self.review_val.pack(pady=(5, 15))
         
         # 卡片3: 已掌握
         self.mastered_card = ctk.CTkFrame(stats_frame, **card_settings)
         self.mastered_card.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(10, 0))
         ctk.CTkLabel(self.mastered_card, text="✅ 已掌握", font=('Arial', 14)).pack(pady=(15, 0))
-        self.mastered_val = ctk.CTkLabel(self.mastered_card, text="0", font=('Arial', 24, 'bold'), text_color="#2ecc71")
+        self.mastered_val = ctk.CTkLabel(self.mastered_card, text="-", font=('Arial', 24, 'bold'), text_color="#2ecc71")
         self.mastered_val.pack(pady=(5, 15))
 
         # 2. 中间区域: 快捷操作与建议
@@ -71,29 +75,42 @@ class HomeTab(BaseTab):
         btn_style = {"width": 160, "height": 45, "font": ('Arial', 14)}
         
         ctk.CTkButton(actions_container, text="➕ 添加单词", 
-                      command=lambda: self.parent_gui.tabview.set("添加单词"), 
+                      command=lambda: self.parent_gui.select_tab("添加单词"), 
                       **btn_style).pack(pady=10)
         
         self.start_review_btn = ctk.CTkButton(actions_container, text="🎯 开始复习", 
-                      command=lambda: self.parent_gui.review_tab_comp.quick_review(), 
+                      command=lambda: self.parent_gui.ensure_tab("复习单词").quick_review(), 
                       fg_color="#3498db", hover_color="#2980b9",
                       **btn_style)
         self.start_review_btn.pack(pady=10)
         
         ctk.CTkButton(actions_container, text="📊 查看统计", 
-                      command=lambda: self.parent_gui.tabview.set("学习统计"), 
+                      command=lambda: self.parent_gui.select_tab("学习统计"), 
                       fg_color="#9b59b6", hover_color="#8e44ad",
                       **btn_style).pack(pady=10)
         
         ctk.CTkButton(actions_container, text="⚙️ 系统设置", 
-                      command=lambda: self.parent_gui.tabview.set("设置"), 
+                      command=lambda: self.parent_gui.select_tab("系统设置"), 
                       fg_color="gray", hover_color="#555555",
                       **btn_style).pack(pady=10)
 
     def update_statistics(self):
-        """更新首页数据和统计"""
-        review_count = len(self.word_manager.get_words_for_review())
-        stats = self.word_manager.get_statistics()
+        """更新首页数据和统计 (在 io 队列中查询，不阻塞界面)"""
+        self.parent_gui.task_runner.submit(
+            self._load_statistics, queue_name='io',
+            on_success=self._show_statistics,
+            on_error=lambda e: logger.error(f"加载首页统计失败: {e}"),
+            owner=self
+        )
+
+    def _load_statistics(self):
+        """查询待复习数量和统计数据"""
+        return len(self.word_manager.get_words_for_review()), self.word_manager.get_statistics()
+
+    @timed("ui")
+    def _show_statistics(self, result):
+        """根据统计数据更新卡片和建议"""
+        review_count, stats = result
         total_words = stats['total_words']
         mastered_words = stats.get('mastered_words', 0)
         
@@ -194,8 +194,8 @@ class ReviewTab(BaseTab):
         info = self.word_manager.get_word(self.current_review_word)
         correct_meaning = info['meaning']
         
-        all_words = self.word_manager.get_all_words()
-        other_meanings = [w['meaning'] for w in all_words if w['word'] != self.current_review_word]
+        all_words = self.word_manager.list_word_rows(("word", "meaning"))
+        other_meanings = [w.meaning for w in all_words if w.word != self.current_review_word]
         
         if len(other_meanings) < 3:
             other_meanings += ["(占位选项1)", "(占位选项2)", "(占位选项3)"]
@@ -269,6 +269,9 @@ class ReviewTab(BaseTab):
         
         random.shuffle(self.review_words)
         self.review_results = []
+        
+        # 后台预合成本次复习单词的语音，朗读时直接播放缓存
+        self.word_manager.prerender_speech(self.review_words)
         self.current_review_index = 0
         
         # UI 切换
@@ -317,13 +320,16 @@ class ReviewTab(BaseTab):
         if self.config_manager.get("auto_play_tts", True):
             self.word_manager.speak(self.current_review_word)
             
-        # 补充详细信息
-        phonetic_text = ""
-        word_info = self.word_manager.dict_service.get_word_info(self.current_review_word)
-        if word_info and word_info.get('phonetic'):
-            phonetic_text = f"/{word_info['phonetic']}/"
+        # 补充详细信息 (音标在后台查询，切换到下一个单词后丢弃旧结果)
+        self.phonetic_label.configure(text="")
+        review_word = self.current_review_word
+        
+        def show_phonetic(word_info):
+            if word_info and word_info.get('phonetic') and self.current_review_word == review_word:
+                self.phonetic_label.configure(text=f"/{word_info['phonetic']}/")
         
-        self.phonetic_label.configure(text=phonetic_text)
+        self.parent_gui.task_runner.submit(self.word_manager.dict_service.get_word_info, review_word,
+                                           on_success=show_phonetic, owner=self)
         self.example_label.configure(text=info.get('example', ''))
         
         # 更新进度
@@ -415,9 +421,11 @@ class ReviewTab(BaseTab):
         total_count = len(self.review_results)
         accuracy = (known_count / total_count) * 100 if total_count > 0 else 0
         
-        difficulty_analysis = self._analyze_word_difficulty()
+        # 一次取出本轮单词的复习参数 (来自词库快照)，分析时不再逐个查询
+        metrics = self.word_manager.get_word_metrics([result['word'] for result in self.review_results])
+        difficulty_analysis = self._analyze_word_difficulty(metrics)
         time_analysis = self._analyze_review_time()
-        progress_analysis = self._analyze_learning_progress()
+        progress_analysis = self._analyze_learning_progress(metrics)
         
         stats_text = f"""\n📊 复习统计报告\n=================\n\n📈 基本统计\n复习单词数: {total_count}\n掌握单词数: {known_count}\n未掌握单词数: {unknown_count}\n稍后复习单词数: {later_count}\n正确率: {accuracy:.1f}%\n\n🎯 难度分析\n{difficulty_analysis}\n\n⏱️ 时间分析\n{time_analysis}\n\n📈 学习进度\n{progress_analysis}\n\n📋 详细记录:\n"""
         
@@ -432,11 +440,10 @@ class ReviewTab(BaseTab):
         self.stats_text.delete(1.0, tk.END)
         self.stats_text.insert(tk.END, stats_text)
 
-    def _analyze_word_difficulty(self):
+    def _analyze_word_difficulty(self, metrics):
         difficulty_stats = {"简单": 0, "中等": 0, "困难": 0}
         for result in self.review_results:
-            word = result['word']
-            word_info = self.word_manager.get_word(word)
+            word_info = metrics.get(result['word'], {})
             review_count = word_info.get('review_count', 0)
             interval = word_info.get('interval', 1)
             if review_count <= 1 and interval <= 1: difficulty_stats["困难"] += 1
@@ -452,9 +459,9 @@ class ReviewTab(BaseTab):
         avg_time = total_time / len(self.review_results) if self.review_results else 0
         return f"总复习时间: {total_time/60:.1f}分钟\n平均每个单词: {avg_time:.1f}秒"
 
-    def _analyze_learning_progress(self):
+    def _analyze_learning_progress(self, metrics):
         mastered = [r['word'] for r in self.review_results if r['known']]
-        struggling = [r['word'] for r in self.review_results if not r['known'] and self.word_manager.get_word(r['word']).get('review_count', 0) > 2]
+        struggling = [r['word'] for r in self.review_results if not r['known'] and metrics.get(r['word'], {}).get('review_count', 0) > 2]
         progress = f"掌握单词: {len(mastered)}个\n需要重点复习: {len(struggling)}个\n"
         if len(struggling) > len(mastered): progress += "建议: 需要加强复习困难单词"
         elif len(mastered) >= len(self.review_results) * 0.8: progress += "建议: 学习进度良好，继续保持"
@@ -472,11 +479,11 @@ class ReviewTab(BaseTab):
 
     def quick_review(self):
         """快速复习 (10个)"""
-        all_words = self.word_manager.get_all_words()
+        all_words = self.word_manager.list_word_rows(("word",))
         if not all_words:
             messagebox.showinfo("提示", "词库为空，请先添加单词。")
             return
         
         count = min(10, len(all_words))
-        words = [w['word'] for w in random.sample(all_words, count)]
+        words = [w.word for w in random.sample(all_words, count)]
         self.start_review(words=words)
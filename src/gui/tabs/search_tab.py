@@ -4,10 +4,15 @@
 import tkinter as tk
 from tkinter import messagebox, ttk
 import customtkinter as ctk
+import datetime
 import json
 import os
+from core.word_rows import EXPORT_COLUMNS
 from .base_tab import BaseTab
 
+# 搜索结果表格需要的列
+SEARCH_COLUMNS = ("word", "meaning", "category", "added_date", "review_count")
+
 class SearchTab(BaseTab):
     """搜索单词标签页"""
     def __init__(self, master, parent_gui, **kwargs):
@@ -159,17 +164,17 @@ class SearchTab(BaseTab):
         for item in self.search_tree.get_children():
             self.search_tree.delete(item)
             
-        # 获取所有单词
-        all_words = self.word_manager.get_all_words()
+        # 只查询结果表格需要的列
+        all_words = self.word_manager.list_word_rows(SEARCH_COLUMNS)
         results = []
         
         mode = self.search_mode_var.get()
         scope = self.search_scope_var.get()
         
         for info in all_words:
-            word = info['word'].lower()
-            meaning = info['meaning'].lower()
-            category = info.get('category', '').lower()
+            word = info.word.lower()
+            meaning = (info.meaning or '').lower()
+            category = (info.category or '').lower()
             
             match = False
             if mode == "exact":
@@ -200,13 +205,12 @@ class SearchTab(BaseTab):
         
         # 显示结果
         for info in results:
-            add_date = info.get('added_date', '')[:10] if info.get('added_date') else ''
             self.search_tree.insert("", tk.END, values=(
-                info['word'], 
-                info['meaning'], 
-                info.get('category', ''), 
-                add_date, 
-                info.get('review_count', 0)
+                info.word, 
+                info.meaning or '', 
+                info.category or '', 
+                info.date('added_date'), 
+                info.review_count or 0
             ))
             
         self.search_results = results
@@ -220,13 +224,13 @@ class SearchTab(BaseTab):
     def _sort_search_results(self, results, sort_by):
         """对搜索结果进行排序"""
         if sort_by == "word":
-            return sorted(results, key=lambda x: x['word'])
+            return sorted(results, key=lambda x: x.word)
         elif sort_by == "date":
-            return sorted(results, key=lambda x: x.get('added_date', ''), reverse=True)
+            return sorted(results, key=lambda x: x.added_date or datetime.datetime.min, reverse=True)
         elif sort_by == "category":
-            return sorted(results, key=lambda x: x.get('category', ''))
+            return sorted(results, key=lambda x: x.category or '')
         elif sort_by == "review_count":
-            return sorted(results, key=lambda x: x.get('review_count', 0), reverse=True)
+            return sorted(results, key=lambda x: x.review_count or 0, reverse=True)
         return results
 
     def _show_search_stats(self, result_count, keyword):
@@ -253,7 +257,7 @@ class SearchTab(BaseTab):
             self.after_cancel(self.search_debounce_timer)
         
         # 300ms后执行搜索（防抖）
-        from ..core.constants import Constants
+        from core.constants import Constants
         self.search_debounce_timer = self.after(Constants.DEBOUNCE_DELAY, self.search_words)
         """搜索框按键释放事件"""
         if self.realtime_search_var.get():
@@ -277,10 +281,11 @@ class SearchTab(BaseTab):
         word = self.search_tree.item(item, 'values')[0]
         
         # 切换到查看单词标签页并选中该单词
-        if hasattr(self.parent_gui, 'tabview') and hasattr(self.parent_gui, 'view_tab_comp'):
-            self.parent_gui.tabview.set("查看单词")
-            self.parent_gui.view_tab_comp.view_search_var.set(word)
-            self.parent_gui.view_tab_comp.refresh_word_list()
+        if hasattr(self.parent_gui, 'select_tab'):
+            self.parent_gui.select_tab("查看单词")
+            view_tab_comp = self.parent_gui.view_tab_comp
+            view_tab_comp.view_search_var.set(word)
+            view_tab_comp.refresh_word_list()
 
     def export_search_results(self):
         """导出搜索结果"""
@@ -299,10 +304,14 @@ class SearchTab(BaseTab):
             if file_path:
                 with open(file_path, 'w', encoding='utf-8') as f:
                     if file_path.endswith('.json'):
-                        json.dump(self.search_results, f, ensure_ascii=False, indent=4)
+                        # 结果表格只查询了显示的列，导出时按完整的列重新查询 (字段与 Word.to_dict() 一致)
+                        full_rows = {row.word: row for row in self.word_manager.list_word_rows(EXPORT_COLUMNS)}
+                        records = [full_rows[info.word].to_dict() for info in self.search_results
+                                   if info.word in full_rows]
+                        json.dump(records, f, ensure_ascii=False, indent=4)
                     else:
                         for info in self.search_results:
-                            f.write(f"单词: {info['word']}\n释义: {info['meaning']}\n分类: {info.get('category', '')}\n\n")
+                            f.write(f"单词: {info.word}\n释义: {info.meaning}\n分类: {info.category or ''}\n\n")
                 
                 messagebox.showinfo("成功", f"结果已成功导出至: {file_path}")
                 self.status_bar.configure(text=f"导出成功: {os.path.basename(file_path)}")
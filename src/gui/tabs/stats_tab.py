@@ -5,23 +5,124 @@ import tkinter as tk
 from tkinter import messagebox
 import customtkinter as ctk
 import datetime
+import os
+import logging
 from .base_tab import BaseTab
+from gui.chart_cache import ChartImageCache
+from gui.chart_models import build_stats_models, model_digest
+from utils.decorators import timed
+
+logger = logging.getLogger(__name__)
+
+# matplotlib 导入较慢，在首次绘制图表时才加载 (见 _load_matplotlib)
+Figure = None
+FigureCanvasTkAgg = None
+
+
+def _load_matplotlib():
+    """首次绘制图表时导入 matplotlib 并完成全局设置
+
+    图表直接使用 Figure 而不是 pyplot，不会登记到 pyplot 的全局图表列表中
+    """
+    global Figure, FigureCanvasTkAgg
+    if Figure is not None:
+        return
+    import matplotlib
+    matplotlib.use('TkAgg')
+    # 设置中文字体
+    matplotlib.rcParams['font.sans-serif'] = ['SimHei', 'Microsoft YaHei', 'Arial Unicode MS', 'sans-serif']
+    matplotlib.rcParams['axes.unicode_minus'] = False # 解决负号显示问题
+    from matplotlib.figure import Figure as figure_class
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg as canvas_class
+    Figure, FigureCanvasTkAgg = figure_class, canvas_class
+
+
+class ChartPanel:
+    """图表容器中常驻的 Figure 和画布
+
+    刷新时只更新图元数据并调用 draw_idle，不重新创建 Figure 和画布；
+    Figure 在首次实际绘制时创建，此前可以直接显示缓存的 PNG 图片；
+    没有数据时显示提示文字
+    """
+
+    def __init__(self, container, figsize, empty_text, dpi=100):
+        self.container = container
+        self.figsize = figsize
+        self.dpi = dpi
+        self.figure = None
+        self.ax = None
+        self.canvas = None
+        self.empty_label = ctk.CTkLabel(container, text=empty_text)
+        self.image_label = tk.Label(container, borderwidth=0)
+        self._image = None
+        # 需要原地更新的图元，如柱状图、折线、热力图
+        self.artists = {}
+        # 当前显示内容对应的缓存键，相同时无需重绘
+        self.rendered_key = None
+        self._current = None
+
+    def ensure_figure(self):
+        """获取 Figure 和坐标轴，首次调用时创建"""
+        if self.figure is None:
+            _load_matplotlib()
+            self.figure = Figure(figsize=self.figsize, dpi=self.dpi)
+            self.ax = self.figure.add_subplot(111)
+            self.canvas = FigureCanvasTkAgg(self.figure, master=self.container)
+        return self.figure, self.ax
+
+    def pixel_size(self):
+        """图表的像素尺寸 (用于图片缓存键)"""
+        if self.figure is not None:
+            width, height = self.figure.get_size_inches() * self.dpi
+            return int(width), int(height)
+        if self.container.winfo_ismapped() and self.container.winfo_width() > 1:
+            return self.container.winfo_width(), self.container.winfo_height()
+        return int(self.figsize[0] * self.dpi), int(self.figsize[1] * self.dpi)
+
+    def _show(self, widget, **pack_kwargs):
+        """在容器中只显示指定控件"""
+        if self._current is not widget:
+            if self._current is not None:
+                self._current.pack_forget()
+            widget.pack(**pack_kwargs)
+            self._current = widget
+
+    def show_empty(self):
+        """显示无数据提示"""
+        self._show(self.empty_label, expand=True)
+        self.rendered_key = None
+
+    def show_image(self, path, key):
+        """显示缓存的图表图片"""
+        self._image = tk.PhotoImage(file=path)
+        self.image_label.configure(image=self._image)
+        self._show(self.image_label, fill=tk.BOTH, expand=True)
+        self.rendered_key = key
+
+    def draw(self, key, relayout=False):
+        """显示画布并在空闲时重绘，relayout 为 True 时重新计算布局"""
+        self._show(self.canvas.get_tk_widget(), fill=tk.BOTH, expand=True)
+        if relayout:
+            self.figure.tight_layout()
+        self.canvas.draw_idle()
+        self.rendered_key = key
 
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib
-matplotlib.use('TkAgg')
-# 设置中文字体
-matplotlib.rcParams['font.sans-serif'] = ['SimHei', 'Microsoft YaHei', 'Arial Unicode MS', 'sans-serif']
-matplotlib.rcParams['axes.unicode_minus'] = False # 解决负号显示问题
 
 class StatsTab(BaseTab):
     """学习统计标签页"""
     def __init__(self, master, parent_gui, **kwargs):
         super().__init__(master, parent_gui, **kwargs)
         self.canvas = None
+        # 图表面板在首次绘制时创建
+        self.chart_panels = {}
+        self._models_request = 0
+        
+        # 渲染好的图表缓存为 PNG，再次进入时数据未变化可直接显示
+        self.image_cache = None
+        if self.config_manager.get("chart_image_cache", True):
+            base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+            self.image_cache = ChartImageCache(os.path.join(base_dir, "data", "chart_cache"))
         self._create_widgets()
-        self.show_statistics()
 
     def _create_widgets(self):
         """创建统计信息标签页内容"""
@@ -131,9 +232,28 @@ class StatsTab(BaseTab):
             self.heatmap_container.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
     def show_statistics(self):
-        """显示统计信息"""
-        stats = self.word_manager.get_statistics()
-        review_count = len(self.word_manager.get_words_for_review())
+        """显示统计信息 (数据在 io 队列中准备，完成后在主线程绘制)"""
+        self._models_request += 1
+        request = self._models_request
+        self.status_bar.configure(text="正在加载统计信息...")
+
+        def on_success(models):
+            # 只显示最后一次请求的结果
+            if request == self._models_request:
+                self._apply_models(models)
+
+        self.parent_gui.task_runner.submit(
+            build_stats_models, self.word_manager, int(self.time_range_var.get()),
+            queue_name='io', on_success=on_success,
+            on_error=lambda e: self.status_bar.configure(text=f"加载统计信息失败: {e}"),
+            owner=self
+        )
+
+    @timed("ui")
+    def _apply_models(self, models):
+        """根据统计数据模型更新概览和图表"""
+        stats = models.overview()
+        review_count = models.review_count
         mastered_words = stats.get('mastered_words', 0)
         total_words = stats['total_words']
         mastery_rate = (mastered_words / total_words * 100) if total_words > 0 else 0
@@ -162,16 +282,46 @@ class StatsTab(BaseTab):
             if i < len(detail_items) - 1:
                 ctk.CTkFrame(self.details_container, height=1, fg_color="gray30").pack(fill=tk.X, pady=2)
         
-        # 获取最近学习记录
-        recent_activity = self.word_manager.get_recent_activity(days=int(self.time_range_var.get()))
-        
         # 更新图表
-        self.update_trend_chart_real(recent_activity)
-        self.update_forecast_chart()
-        self.update_heatmap()
+        self._render_chart('trend', models.trend, self.update_trend_chart_real)
+        self._render_chart('forecast', models.forecast, self.update_forecast_chart)
+        self._render_chart('heatmap', models.heatmap, self.update_heatmap)
         
         self.status_bar.configure(text="统计信息已刷新")
 
+    def _render_chart(self, name, model, update):
+        """显示一个图表
+
+        数据、主题和尺寸都未变化时不重绘；图表尚未创建且有缓存图片时直接显示图片；
+        否则用 update(panel, model) 更新图元并重绘，然后在空闲时保存图片缓存
+        """
+        panel = self._get_chart_panel(name)
+        if name != 'heatmap' and not model.dates:
+            panel.show_empty()
+            return
+
+        theme = ctk.get_appearance_mode()
+        digest = model_digest(model)
+        key = ChartImageCache.make_key(name, digest, theme, panel.pixel_size())
+        if panel.rendered_key == key:
+            return
+        if panel.figure is None and self.image_cache:
+            path = self.image_cache.get(key)
+            if path:
+                panel.show_image(path, key)
+                return
+
+        panel.ensure_figure()
+        relayout = update(panel, model)
+        panel.draw(key, relayout)
+        if self.image_cache:
+            self.after_idle(self._save_chart_image, panel, name, digest, theme)
+
+    def _save_chart_image(self, panel, name, digest, theme):
+        """保存图表图片缓存 (按保存时的实际尺寸计算缓存键)"""
+        key = ChartImageCache.make_key(name, digest, theme, panel.pixel_size())
+        self.image_cache.put(key, panel.figure)
+
     def _apply_chart_theme(self, fig, ax):
         """应用统一的图表主题"""
         is_dark = ctk.get_appearance_mode() == "Dark"
@@ -202,117 +352,134 @@ class StatsTab(BaseTab):
             
         return text_color, grid_color
 
-    def update_trend_chart_real(self, activity_data):
-        """使用 Matplotlib 更新趋势图表"""
-        for widget in self.trend_container.winfo_children():
-            widget.destroy()
+    def _get_chart_panel(self, name):
+        """获取图表面板，首次使用时创建"""
+        panel = self.chart_panels.get(name)
+        if panel is None:
+            container, figsize, empty_text = {
+                'trend': (self.trend_container, (8, 4.5), "暂无足够的活动数据生成图表"),
+                'forecast': (self.forecast_container, (8, 4.5), "暂无预警数据"),
+                'heatmap': (self.heatmap_container, (10, 3.5), ""),
+            }[name]
+            panel = ChartPanel(container, figsize, empty_text)
+            self.chart_panels[name] = panel
+        return panel
 
-        daily_stats = activity_data.get('daily_stats', {})
-        if not daily_stats:
-            ctk.CTkLabel(self.trend_container, text="暂无足够的活动数据生成图表").pack(expand=True)
-            return
+    @staticmethod
+    def _update_bars(panel, ax, key, x, heights, **bar_kwargs):
+        """更新柱状图高度，柱子数量变化时重新创建
+
+        Returns:
+            (柱状图, 是否重新创建)
+        """
+        bars = panel.artists.get(key)
+        if bars is not None and len(bars) == len(heights):
+            for bar, height in zip(bars, heights):
+                bar.set_height(height)
+            return bars, False
+        if bars is not None:
+            bars.remove()
+        bars = ax.bar(x, heights, **bar_kwargs)
+        panel.artists[key] = bars
+        return bars, True
+
+    def update_trend_chart_real(self, panel, model):
+        """使用 Matplotlib 更新趋势图表
 
-        dates = sorted(daily_stats.keys())
-        new_counts = [daily_stats[d].get('new', 0) for d in dates]
-        review_counts = [daily_stats[d].get('review', 0) for d in dates]
+        Returns:
+            是否需要重新计算布局
+        """
+        dates = model.dates
+        new_counts = model.new_counts
+        review_counts = model.review_counts
 
-        fig, ax = plt.subplots(figsize=(8, 4.5), dpi=100)
+        fig, ax = panel.figure, panel.ax
         text_color, _ = self._apply_chart_theme(fig, ax)
         
-        x = range(len(dates))
+        x = list(range(len(dates)))
         
-        # 绘制渐变填充的面积图或柱状图
-        ax.bar(x, new_counts, label='新增单词', color='#3498db', alpha=0.6, width=0.6)
-        ax.plot(x, review_counts, label='复习次数', color='#e67e22', marker='o', 
-                markersize=4, linewidth=2, markerfacecolor='white', markeredgewidth=2)
+        # 新增单词柱状图
+        bars, relayout = self._update_bars(panel, ax, 'bars', x, new_counts,
+                                           label='新增单词', color='#3498db', alpha=0.6, width=0.6)
         
-        # 填充复习曲线下方区域
-        ax.fill_between(x, review_counts, color='#e67e22', alpha=0.1)
+        # 复习次数折线
+        line = panel.artists.get('line')
+        if line is None:
+            line, = ax.plot(x, review_counts, label='复习次数', color='#e67e22', marker='o', 
+                            markersize=4, linewidth=2, markerfacecolor='white', markeredgewidth=2)
+            panel.artists['line'] = line
+        else:
+            line.set_data(x, review_counts)
+        
+        # 填充复习曲线下方区域 (填充区域无法原地修改形状，直接替换)
+        if 'fill' in panel.artists:
+            panel.artists['fill'].remove()
+        panel.artists['fill'] = ax.fill_between(x, review_counts, color='#e67e22', alpha=0.1)
         
         ax.set_xticks(x)
         ax.set_xticklabels([d[5:] for d in dates], rotation=45)
+        ax.relim()
+        ax.autoscale_view()
         
         # 优化图例
-        legend = ax.legend(frameon=False, loc='upper left', fontsize=9)
+        legend = ax.legend([bars, line], ['新增单词', '复习次数'], frameon=False, loc='upper left', fontsize=9)
         for text in legend.get_texts():
             text.set_color(text_color)
             
-        ax.set_title(f"最近 {self.time_range_var.get()} 天学习趋势", pad=20)
-        fig.tight_layout()
-
-        canvas = FigureCanvasTkAgg(fig, master=self.trend_container)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        ax.set_title(f"最近 {model.days} 天学习趋势", pad=20)
+        return relayout
 
-    def update_forecast_chart(self):
-        """更新未来复习预警图表"""
-        for widget in self.forecast_container.winfo_children():
-            widget.destroy()
-
-        future_stats = self.word_manager.get_future_review_stats(days=7)
-        if not future_stats:
-            ctk.CTkLabel(self.forecast_container, text="暂无预警数据").pack(expand=True)
-            return
+    def update_forecast_chart(self, panel, model):
+        """更新未来复习预警图表
 
-        dates = sorted(future_stats.keys())
-        counts = [future_stats[d] for d in dates]
+        Returns:
+            是否需要重新计算布局
+        """
+        dates = model.dates
+        counts = model.counts
 
-        fig, ax = plt.subplots(figsize=(8, 4.5), dpi=100)
+        fig, ax = panel.figure, panel.ax
         text_color, _ = self._apply_chart_theme(fig, ax)
         
-        x = range(len(dates))
-        bars = ax.bar(x, counts, color='#2ecc71', alpha=0.7, width=0.5, edgecolor='#27ae60', linewidth=1)
+        x = list(range(len(dates)))
+        bars, relayout = self._update_bars(panel, ax, 'bars', x, counts, color='#2ecc71', alpha=0.7,
+                                           width=0.5, edgecolor='#27ae60', linewidth=1)
         
         # 在柱状图上方添加数值标签
-        for bar in bars:
+        labels = panel.artists.get('labels', [])
+        if relayout:
+            for label in labels:
+                label.remove()
+            labels = [ax.text(0, 0, "", ha='center', va='bottom', fontweight='bold') for _ in bars]
+            panel.artists['labels'] = labels
+        for bar, label in zip(bars, labels):
             height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                    f'{int(height)}', ha='center', va='bottom', 
-                    color=text_color, fontweight='bold')
+            label.set_position((bar.get_x() + bar.get_width()/2., height + 0.1))
+            label.set_text(f'{int(height)}')
+            label.set_color(text_color)
 
         ax.set_xticks(x)
         ax.set_xticklabels([d[5:] for d in dates], rotation=45)
+        ax.relim()
+        ax.autoscale_view()
         ax.set_title("未来 7 天复习任务量预警", pad=20)
         ax.set_ylabel("预计复习单词数")
         
-        fig.tight_layout()
+        return relayout
 
-        canvas = FigureCanvasTkAgg(fig, master=self.forecast_container)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+    def update_heatmap(self, panel, model):
+        """更新记忆热力图 (GitHub 风格)
 
-    def update_heatmap(self):
-        """更新记忆热力图 (GitHub 风格)"""
+        Returns:
+            是否需要重新计算布局
+        """
         import numpy as np
         from matplotlib.colors import LinearSegmentedColormap
         
-        for widget in self.heatmap_container.winfo_children():
-            widget.destroy()
-            
-        weeks = 25  # 增加周数
-        days_to_show = weeks * 7
-        activity = self.word_manager.get_recent_activity(days=days_to_show)
-        daily_stats = activity.get('daily_stats', {})
-        
-        data = np.zeros((7, weeks))
-        today = datetime.date.today()
-        end_date = today + datetime.timedelta(days=(6 - today.weekday()))
-        start_date = end_date - datetime.timedelta(days=days_to_show - 1)
-        
-        for date_str, stats in daily_stats.items():
-            try:
-                cur_date = datetime.datetime.strptime(date_str, '%Y-%m-%d').date()
-                if start_date <= cur_date <= end_date:
-                    diff = (cur_date - start_date).days
-                    col = diff // 7
-                    row = diff % 7
-                    if col < weeks:
-                        intensity = stats.get('new', 0) + stats.get('review', 0)
-                        data[row, col] = intensity
-            except:
-                continue
-
-        fig, ax = plt.subplots(figsize=(10, 3.5), dpi=100)
+        weeks = model.weeks
+        data = np.asarray(model.data, dtype=float)
+
+        fig, ax = panel.figure, panel.ax
         is_dark = ctk.get_appearance_mode() == "Dark"
         bg_color = '#2b2b2b' if is_dark else '#ffffff'
         fig.patch.set_facecolor(bg_color)
@@ -325,32 +492,38 @@ class StatsTab(BaseTab):
             colors = ['#ebedf0', '#9be9a8', '#40c463', '#30a14e', '#216e39']
         cmap = LinearSegmentedColormap.from_list('github', colors)
         
-        # 绘制热力图，增加间隙
-        im = ax.imshow(data, cmap=cmap, aspect='equal', interpolation='nearest')
-        
-        # 绘制网格线来模拟格子之间的间隙
-        ax.set_xticks(np.arange(-.5, weeks, 1), minor=True)
-        ax.set_yticks(np.arange(-.5, 7, 1), minor=True)
-        ax.grid(which='minor', color=bg_color, linestyle='-', linewidth=2)
-        ax.tick_params(which='minor', size=0)
+        im = panel.artists.get('image')
+        relayout = im is None
+        if relayout:
+            # 绘制热力图，增加间隙
+            im = ax.imshow(data, cmap=cmap, aspect='equal', interpolation='nearest')
+            panel.artists['image'] = im
+            
+            # 绘制网格线来模拟格子之间的间隙
+            ax.set_xticks(np.arange(-.5, weeks, 1), minor=True)
+            ax.set_yticks(np.arange(-.5, 7, 1), minor=True)
+            ax.tick_params(which='minor', size=0)
 
-        # 设置轴
-        ax.set_xticks([])
-        ax.set_yticks(range(7))
-        ax.set_yticklabels(['周一', '', '周三', '', '周五', '', '周日'], 
-                          fontsize=8, color='#8b949e' if is_dark else '#57606a')
-        
-        # 移除所有边框
-        for spine in ax.spines.values():
-            spine.set_visible(False)
+            # 设置轴
+            ax.set_xticks([])
+            ax.set_yticks(range(7))
+            ax.set_yticklabels(['周一', '', '周三', '', '周五', '', '周日'], fontsize=8)
             
-        ax.set_title("最近 25 周学习活跃度", color='white' if is_dark else '#2c3e50', 
+            # 移除所有边框
+            for spine in ax.spines.values():
+                spine.set_visible(False)
+        else:
+            im.set_data(data)
+            im.set_cmap(cmap)
+            im.autoscale()
+        
+        # 随主题变化的颜色原地更新
+        ax.grid(which='minor', color=bg_color, linestyle='-', linewidth=2)
+        for label in ax.get_yticklabels():
+            label.set_color('#8b949e' if is_dark else '#57606a')
+        ax.set_title(f"最近 {weeks} 周学习活跃度", color='white' if is_dark else '#2c3e50', 
                     fontsize=12, pad=15, fontweight='bold')
-        fig.tight_layout()
-
-        canvas = FigureCanvasTkAgg(fig, master=self.heatmap_container)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        return relayout
 
     def export_chart(self):
         """导出统计数据"""
@@ -7,6 +7,7 @@ import customtkinter as ctk
 import json
 import os
 from .base_tab import BaseTab
+from utils.decorators import timed
 
 class ViewTab(BaseTab):
     """查看单词标签页"""
@@ -167,46 +168,21 @@ class ViewTab(BaseTab):
         detail_scroll = ctk.CTkScrollableFrame(detail_tab, fg_color="transparent")
         detail_scroll.pack(fill=tk.BOTH, expand=True)
         
-        # 尝试从词典API获取更详细的信息
+        # 后台从词典API获取更详细的信息，关闭窗口时取消查询
         if hasattr(self.word_manager, 'dictionary_api') and self.word_manager.dictionary_api:
-            self.parent_gui.show_loading_indicator(f"正在获取单词 '{word}' 的详细信息...")
-            try:
-                word_info = self.word_manager.dictionary_api.get_word_info(word)
-                if word_info:
-                    # 显示音标
-                    if word_info.get('phonetic'):
-                        ctk.CTkLabel(detail_scroll, text="音标:", font=('Arial', 12, 'bold')).pack(anchor=tk.W, pady=(10, 2))
-                        ctk.CTkLabel(detail_scroll, text=word_info['phonetic'], font=('Arial', 12)).pack(anchor=tk.W, padx=20)
-                    
-                    # 显示英文释义
-                    if word_info.get('meanings'):
-                        ctk.CTkLabel(detail_scroll, text="英文释义:", font=('Arial', 12, 'bold')).pack(anchor=tk.W, pady=(10, 2))
-                        for i, meaning_info in enumerate(word_info['meanings']):
-                            part_of_speech = meaning_info.get('part_of_speech', '')
-                            definition = meaning_info.get('definition', '')
-                            meaning_text = f"{i+1}. {part_of_speech}: {definition}" if part_of_speech else f"{i+1}. {definition}"
-                            ctk.CTkLabel(detail_scroll, text=meaning_text, font=('Arial', 11), wraplength=450, justify=tk.LEFT).pack(anchor=tk.W, padx=30, pady=2)
-                    
-                    # 显示中文释义
-                    if word_info.get('chinese_meanings'):
-                        ctk.CTkLabel(detail_scroll, text="中文释义:", font=('Arial', 12, 'bold')).pack(anchor=tk.W, pady=(10, 2))
-                        for i, meaning_info in enumerate(word_info['chinese_meanings']):
-                            part_of_speech = meaning_info.get('part_of_speech', '')
-                            definition = meaning_info.get('definition', '')
-                            meaning_text = f"{i+1}. {part_of_speech}: {definition}" if part_of_speech else f"{i+1}. {definition}"
-                            ctk.CTkLabel(detail_scroll, text=meaning_text, font=('Arial', 11), wraplength=450, justify=tk.LEFT).pack(anchor=tk.W, padx=30, pady=2)
-                    
-                    # 显示例句
-                    if word_info.get('examples'):
-                        ctk.CTkLabel(detail_scroll, text="例句:", font=('Arial', 12, 'bold')).pack(anchor=tk.W, pady=(10, 2))
-                        for i, example in enumerate(word_info['examples']):
-                            ctk.CTkLabel(detail_scroll, text=f"{i+1}. {example}", font=('Arial', 11), wraplength=450, justify=tk.LEFT).pack(anchor=tk.W, padx=30, pady=2)
-                else:
-                    ctk.CTkLabel(detail_scroll, text="未找到该单词的详细信息", font=('Arial', 12)).pack(pady=20)
-            except Exception as e:
-                ctk.CTkLabel(detail_scroll, text=f"获取详细信息时发生错误: {str(e)}", font=('Arial', 12)).pack(pady=20)
-            finally:
-                self.parent_gui.hide_loading_indicator()
+            loading_label = ctk.CTkLabel(detail_scroll, text="", font=('Arial', 12))
+            loading_label.pack(pady=20)
+
+            def on_loaded(word_info):
+                loading_label.destroy()
+                self._render_dictionary_info(detail_scroll, word_info)
+
+            def on_error(e):
+                loading_label.configure(text=f"获取详细信息时发生错误: {str(e)}")
+
+            self.lookup_word_async(word, on_loaded, on_error,
+                                   on_progress=lambda message: loading_label.configure(text=message),
+                                   owner=detail_window)
         else:
             ctk.CTkLabel(detail_scroll, text="词典API不可用，无法获取详细信息", font=('Arial', 12)).pack(pady=20)
         
@@ -216,6 +192,41 @@ class ViewTab(BaseTab):
         
         ctk.CTkButton(button_frame, text="关闭", command=detail_window.destroy, width=100).pack(side=tk.RIGHT, padx=5)
 
+    def _render_dictionary_info(self, detail_scroll, word_info):
+        """在详情窗口中显示词典信息"""
+        if not word_info:
+            ctk.CTkLabel(detail_scroll, text="未找到该单词的详细信息", font=('Arial', 12)).pack(pady=20)
+            return
+        
+        # 显示音标
+        if word_info.get('phonetic'):
+            ctk.CTkLabel(detail_scroll, text="音标:", font=('Arial', 12, 'bold')).pack(anchor=tk.W, pady=(10, 2))
+            ctk.CTkLabel(detail_scroll, text=word_info['phonetic'], font=('Arial', 12)).pack(anchor=tk.W, padx=20)
+        
+        # 显示英文释义
+        if word_info.get('meanings'):
+            ctk.CTkLabel(detail_scroll, text="英文释义:", font=('Arial', 12, 'bold')).pack(anchor=tk.W, pady=(10, 2))
+            for i, meaning_info in enumerate(word_info['meanings']):
+                part_of_speech = meaning_info.get('part_of_speech', '')
+                definition = meaning_info.get('definition', '')
+                meaning_text = f"{i+1}. {part_of_speech}: {definition}" if part_of_speech else f"{i+1}. {definition}"
+                ctk.CTkLabel(detail_scroll, text=meaning_text, font=('Arial', 11), wraplength=450, justify=tk.LEFT).pack(anchor=tk.W, padx=30, pady=2)
+        
+        # 显示中文释义
+        if word_info.get('chinese_meanings'):
+            ctk.CTkLabel(detail_scroll, text="中文释义:", font=('Arial', 12, 'bold')).pack(anchor=tk.W, pady=(10, 2))
+            for i, meaning_info in enumerate(word_info['chinese_meanings']):
+                part_of_speech = meaning_info.get('part_of_speech', '')
+                definition = meaning_info.get('definition', '')
+                meaning_text = f"{i+1}. {part_of_speech}: {definition}" if part_of_speech else f"{i+1}. {definition}"
+                ctk.CTkLabel(detail_scroll, text=meaning_text, font=('Arial', 11), wraplength=450, justify=tk.LEFT).pack(anchor=tk.W, padx=30, pady=2)
+        
+        # 显示例句
+        if word_info.get('examples'):
+            ctk.CTkLabel(detail_scroll, text="例句:", font=('Arial', 12, 'bold')).pack(anchor=tk.W, pady=(10, 2))
+            for i, example in enumerate(word_info['examples']):
+                ctk.CTkLabel(detail_scroll, text=f"{i+1}. {example}", font=('Arial', 11), wraplength=450, justify=tk.LEFT).pack(anchor=tk.W, padx=30, pady=2)
+
     def fetch_detailed_info(self):
         """获取选中单词的详细信息"""
         selected = self.word_tree.selection()
@@ -231,73 +242,68 @@ class ViewTab(BaseTab):
             messagebox.showwarning("警告", "词典API不可用，无法获取详细信息！")
             return
         
-        # 显示加载指示器
-        self.parent_gui.show_loading_indicator(f"正在获取单词 '{word}' 的详细信息...")
+        # 后台获取详细信息，完成后更新单词
+        self.lookup_word_async(word, lambda word_info: self._apply_dictionary_info(word, word_info),
+                               lambda e: messagebox.showerror("错误", f"获取单词详细信息时发生错误:\n{str(e)}"))
+
+    def _apply_dictionary_info(self, word, word_info):
+        """用词典信息更新单词的释义、例句和音标"""
+        if not word_info:
+            messagebox.showwarning("警告", f"未找到单词 '{word}' 的详细信息！")
+            return
         
-        try:
-            # 从词典API获取详细信息
-            word_info = self.word_manager.dictionary_api.get_word_info(word)
-            if not word_info:
-                messagebox.showwarning("警告", f"未找到单词 '{word}' 的详细信息！")
-                return
-            
-            # 获取当前单词信息
-            current_info = self.word_manager.get_word(word)
-            if current_info:
-                meaning = current_info['meaning']
-                example = current_info.get('example', '')
-                phonetic = current_info.get('phonetic', '')
+        # 获取当前单词信息
+        current_info = self.word_manager.get_word(word)
+        if not current_info:
+            messagebox.showwarning("警告", f"单词 '{word}' 不在词库中！")
+            return
+        
+        meaning = current_info['meaning']
+        example = current_info.get('example', '')
+        phonetic = current_info.get('phonetic', '')
 
-                # 更新释义（如果获取到了中文释义则使用中文释义）
-                if word_info.get('chinese_meanings'):
-                    meaning = word_info['chinese_meanings'][0]['definition']
-                elif word_info.get('meanings'):
-                    meaning = word_info['meanings'][0]['definition']
-                
-                # 如果当前没有例句但获取到了例句，则添加例句
-                if not example and word_info.get('examples'):
-                    example = word_info['examples'][0]
-                
-                # 获取音标
-                if word_info.get('phonetic'):
-                    phonetic = word_info['phonetic']
-                
-                # 保存更新
-                if self.word_manager.update_word(word, meaning=meaning, example=example, phonetic=phonetic):
-                    # 刷新单词列表
-                    self.refresh_word_list()
-                    messagebox.showinfo("成功", f"单词 '{word}' 的信息已更新！")
-                else:
-                    messagebox.showerror("错误", f"更新单词 '{word}' 失败！")
-            else:
-                messagebox.showwarning("警告", f"单词 '{word}' 不在词库中！")
-        except Exception as e:
-            messagebox.showerror("错误", f"获取单词详细信息时发生错误:\n{str(e)}")
-        finally:
-            # 隐藏加载指示器
-            self.parent_gui.hide_loading_indicator()
+        # 更新释义（如果获取到了中文释义则使用中文释义）
+        if word_info.get('chinese_meanings'):
+            meaning = word_info['chinese_meanings'][0]['definition']
+        elif word_info.get('meanings'):
+            meaning = word_info['meanings'][0]['definition']
+        
+        # 如果当前没有例句但获取到了例句，则添加例句
+        if not example and word_info.get('examples'):
+            example = word_info['examples'][0]
+        
+        # 获取音标
+        if word_info.get('phonetic'):
+            phonetic = word_info['phonetic']
+        
+        # 保存更新
+        if self.word_manager.update_word(word, meaning=meaning, example=example, phonetic=phonetic):
+            # 刷新单词列表
+            self.refresh_word_list()
+            messagebox.showinfo("成功", f"单词 '{word}' 的信息已更新！")
+        else:
+            messagebox.showerror("错误", f"更新单词 '{word}' 失败！")
 
+    @timed("ui")
     def refresh_word_list(self):
         """刷新单词列表"""
         # 清空现有数据
         for item in self.word_tree.get_children():
             self.word_tree.delete(item)
         
-        # 获取所有数据
-        all_words = self.word_manager.get_all_words()
+        # 只查询表格显示的列 (轻量级行记录，日期在插入表格时才格式化)
+        rows = self.word_manager.list_word_rows()
         
         # 添加新数据
         search_term = self.view_search_var.get().lower()
-        for info in all_words:
-            word = info['word']
+        for row in rows:
+            meaning = row.meaning or ''
             # 如果有搜索条件，过滤数据
-            if search_term and search_term not in word.lower() and search_term not in info['meaning'].lower():
+            if search_term and search_term not in row.word.lower() and search_term not in meaning.lower():
                 continue
                 
-            add_date = info.get('added_date', '')[:10] if info.get('added_date') else ''
-            review_count = info.get('review_count', 0)
-            next_review = info.get('next_review', '')[:10] if info.get('next_review') else ''
-            self.word_tree.insert("", tk.END, values=(word, info['meaning'], info.get('category', ''), add_date, review_count, next_review))
+            self.word_tree.insert("", tk.END, values=(row.word, meaning, row.category or '', row.date('added_date'),
+                                                      row.review_count or 0, row.date('next_review')))
 
     def on_view_search_change(self, *args):
         """视图搜索框内容变化时触发（带防抖）"""
@@ -306,7 +312,7 @@ class ViewTab(BaseTab):
             self.after_cancel(self.search_debounce_timer)
         
         # 300ms后执行搜索（防抖）
-        from ..core.constants import Constants
+        from core.constants import Constants
         self.search_debounce_timer = self.after(Constants.DEBOUNCE_DELAY, self._perform_search)
     
     def _perform_search(self):
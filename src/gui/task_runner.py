@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+界面异步任务模块
+耗时操作 (如网络查询) 交给后台任务调度器执行，结果通过 root.after 轮询交回 Tk 主线程
+"""
+
+import logging
+import queue
+import threading
+from typing import Callable
+
+from core.exceptions import TaskRejectedError
+from core.task_scheduler import TaskScheduler, get_task_scheduler
+
+logger = logging.getLogger(__name__)
+
+
+class TaskHandle:
+    """后台任务句柄"""
+
+    def __init__(self, runner: "TkTaskRunner", on_success=None, on_error=None, on_progress=None):
+        self._runner = runner
+        self.on_success = on_success
+        self.on_error = on_error
+        self.on_progress = on_progress
+        self.owner = None
+        self.future = None
+        self._cancelled = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def cancel(self):
+        """取消任务：未开始的不再执行，已开始的结果和进度不再回调"""
+        self._cancelled.set()
+        if self.future is not None:
+            self.future.cancel()
+
+    def done(self) -> bool:
+        return self.future is not None and self.future.done()
+
+    def report_progress(self, value):
+        """在后台线程中报告进度，回调在 Tk 主线程中执行"""
+        if self.on_progress and not self.cancelled:
+            self._runner._post(self, 'progress', value)
+
+
+class TkTaskRunner:
+    """Tk 异步任务执行器
+
+    后台线程不直接操作界面，而是把结果放入队列，
+    由主线程通过 root.after 定时取出并调用回调
+    """
+
+    def __init__(self, root, scheduler: TaskScheduler = None, poll_interval: int = 50):
+        """初始化
+
+        Args:
+            root: Tk 根窗口 (只需提供 after 方法)
+            scheduler: 后台任务调度器，默认使用进程内共享的调度器
+            poll_interval: 结果轮询间隔 (毫秒)
+        """
+        self.root = root
+        self.scheduler = scheduler or get_task_scheduler()
+        self.poll_interval = poll_interval
+        self._results = queue.Queue()
+        self._pending = 0
+        self._polling = False
+        self._closed = False
+
+    def submit(self, func: Callable, *args, on_success: Callable = None, on_error: Callable = None,
+               on_progress: Callable = None, owner=None, queue_name: str = 'network', **kwargs) -> TaskHandle:
+        """提交后台任务
+
+        Args:
+            func: 在后台线程执行的函数；提供 on_progress 时会额外传入 progress 参数
+            on_success: 成功回调，参数为 func 的返回值
+            on_error: 失败回调，参数为异常对象
+            on_progress: 进度回调，参数为 progress() 报告的值
+            owner: 所属控件，控件销毁 (如对话框关闭) 时自动取消任务
+            queue_name: 调度器队列名；队列已满时通过 on_error 收到 TaskRejectedError
+
+        Returns:
+            任务句柄
+        """
+        handle = TaskHandle(self, on_success, on_error, on_progress)
+        if self._closed:
+            handle.cancel()
+            return handle
+        if on_progress:
+            kwargs['progress'] = handle.report_progress
+
+        def run():
+            if handle.cancelled:
+                self._post(handle, 'cancelled', None)
+                return
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                logger.error(f"后台任务执行失败: {e}")
+                self._post(handle, 'error', e)
+            else:
+                self._post(handle, 'success', result)
+
+        if owner is not None:
+            self._bind_owner(owner, handle)
+
+        self._pending += 1
+        self._schedule_poll()
+        try:
+            handle.future = self.scheduler.submit(queue_name, run)
+        except TaskRejectedError as e:
+            logger.warning(f"后台任务未执行: {e}")
+            self._post(handle, 'error', e)
+            return handle
+        handle.future.add_done_callback(lambda f: f.cancelled() and self._post(handle, 'cancelled', None))
+        return handle
+
+    def _bind_owner(self, owner, handle: TaskHandle):
+        """所属控件销毁时取消任务 (投递结果前还会再检查一次控件是否存在)"""
+        handle.owner = owner
+
+        def on_destroy(event):
+            if event.widget is owner:
+                handle.cancel()
+        owner.bind('<Destroy>', on_destroy, add='+')
+
+    def _post(self, handle: TaskHandle, kind: str, value):
+        """从后台线程投递回调"""
+        self._results.put((handle, kind, value))
+
+    def _schedule_poll(self):
+        if not self._polling and not self._closed:
+            self._polling = True
+            self.root.after(self.poll_interval, self._poll)
+
+    def _poll(self):
+        """在 Tk 主线程中执行已完成任务的回调"""
+        self._polling = False
+        while True:
+            try:
+                handle, kind, value = self._results.get_nowait()
+            except queue.Empty:
+                break
+
+            if kind != 'progress':
+                self._pending -= 1
+            if handle.owner is not None and not handle.cancelled and not self._owner_exists(handle.owner):
+                handle.cancel()
+            if handle.cancelled or self._closed:
+                continue
+
+            callback = {'success': handle.on_success, 'error': handle.on_error,
+                        'progress': handle.on_progress}.get(kind)
+            if callback:
+                try:
+                    callback(value)
+                except Exception as e:
+                    logger.error(f"任务回调执行失败: {e}")
+
+        if self._pending > 0:
+            self._schedule_poll()
+
+    @staticmethod
+    def _owner_exists(owner) -> bool:
+        try:
+            return bool(owner.winfo_exists())
+        except Exception:
+            return False
+
+    def pending_count(self) -> int:
+        """尚未完成的任务数"""
+        return self._pending
+
+    def shutdown(self):
+        """停止回调投递 (调度器由应用统一关闭)"""
+        self._closed = True
@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+本地 HTTP 服务模块
+用 Starlette 把 WordManager 封装为 JSON API (单词增删查、复习、统计)，
+多个轻量客户端共用一个已预热的进程、数据库连接池和词典缓存。
+数据库调用在有界线程池中执行，不阻塞事件循环
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import wraps
+from typing import Dict, Optional
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from core.constants import Constants
+from core.exceptions import NotFoundError, ValidationError
+from core.query_trace import query_tracer
+from core.word_manager import WordManager
+from core.word_rows import LIST_COLUMNS
+from utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# 请求头中的词库名称 (不指定时使用默认词库)
+DECK_HEADER = "X-Deck"
+
+# 词库名称的最大长度 (与 Deck.name 一致)
+MAX_DECK_NAME = 100
+
+
+class DeckManagers:
+    """按词库名称缓存的单词管理器
+
+    所有管理器由同一个根管理器的 for_deck 创建，共用数据库连接池、词典API和语音服务。
+    只缓存已存在的词库: 读取请求指定的词库不存在时返回 404，词库只在添加单词时创建
+    """
+
+    def __init__(self, db_path: str = None):
+        self.root = WordManager(db_path)
+        self._managers: Dict[str, WordManager] = {self.root.deck_name: self.root}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def normalize(deck: str = None) -> str:
+        """检查并规范化词库名称 (为空时为默认词库)"""
+        name = (deck or Constants.DEFAULT_DECK_NAME).strip()
+        if not name or len(name) > MAX_DECK_NAME:
+            raise ValidationError(f"无效的词库名称: {deck!r}")
+        return name
+
+    def cached(self, deck: str = None) -> Optional[WordManager]:
+        """已缓存的管理器 (不访问数据库)"""
+        with self._lock:
+            return self._managers.get(self.normalize(deck))
+
+    def get(self, deck: str = None, create: bool = False) -> WordManager:
+        """词库的管理器 (会访问数据库，须在数据库线程池中调用)
+
+        Args:
+            deck: 词库名称
+            create: 词库不存在时是否创建
+
+        Raises:
+            NotFoundError: 词库不存在且 create 为 False
+        """
+        name = self.normalize(deck)
+        manager = self.cached(name)
+        if manager is not None:
+            return manager
+        if create:
+            deck_id = self.root.deck_service.get_or_create_deck(name)
+        else:
+            deck_id = self.root.deck_service.get_deck_id(name)
+            if deck_id is None:
+                raise NotFoundError(f"词库不存在: {name}")
+        with self._lock:
+            manager = self._managers.get(name)
+            if manager is None:
+                manager = self._managers[name] = self.root.for_deck(name)
+                manager.deck_id = deck_id
+            return manager
+
+
+def endpoint(name: str):
+    """记录请求耗时和状态码的装饰器
+
+    耗时写入指标 "request.{name}"，状态码计入 "request.status.{状态码}"；
+    业务异常在这里转为 JSON 错误响应 (ValidationError 400、NotFoundError 404)
+    """
+    def decorator(func):
+        metric = f"request.{name}"
+
+        @wraps(func)
+        async def wrapper(request: Request):
+            start = time.perf_counter()
+            try:
+                response = await func(request)
+            except ValidationError as e:
+                response = JSONResponse({'error': str(e)}, status_code=400)
+            except NotFoundError as e:
+                response = JSONResponse({'error': str(e)}, status_code=404)
+            except Exception as e:
+                logger.exception(f"处理请求 {name} 失败: {e}")
+                response = JSONResponse({'error': "服务器内部错误"}, status_code=500)
+            metrics.observe(metric, time.perf_counter() - start, error=response.status_code >= 500)
+            metrics.increment(f"request.status.{response.status_code}")
+            return response
+        return wrapper
+    return decorator
+
+
+async def run_db(request: Request, func, *args):
+    """在数据库线程池中执行调用，排队等待时间写入指标 server.db_queue_wait"""
+    submitted = time.perf_counter()
+
+    def call():
+        metrics.observe("server.db_queue_wait", time.perf_counter() - submitted)
+        return func(*args)
+
+    return await asyncio.get_running_loop().run_in_executor(request.app.state.db_executor, call)
+
+
+async def _manager(request: Request, create: bool = False) -> WordManager:
+    """请求头指定的词库的管理器 (未缓存时在数据库线程池中查找或创建词库)"""
+    decks = request.app.state.decks
+    deck = request.headers.get(DECK_HEADER)
+    return decks.cached(deck) or await run_db(request, decks.get, deck, create)
+
+
+def _int_param(request: Request, name: str, default: int, minimum: int, maximum: int) -> int:
+    """读取整数查询参数并检查范围"""
+    value = request.query_params.get(name)
+    if value is None:
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        raise ValidationError(f"参数 {name} 必须是整数")
+    if not minimum <= number <= maximum:
+        raise ValidationError(f"参数 {name} 必须在 {minimum}-{maximum} 之间")
+    return number
+
+
+async def _json_body(request: Request) -> Dict:
+    try:
+        body = await request.json()
+    except ValueError:
+        raise ValidationError("请求体必须是 JSON")
+    if not isinstance(body, dict):
+        raise ValidationError("请求体必须是 JSON 对象")
+    return body
+
+
+# ----------------------------------------------------------------------
+# 接口
+# ----------------------------------------------------------------------
+
+@endpoint("health")
+async def health(request: Request):
+    return JSONResponse({'status': 'ok'})
+
+
+@endpoint("decks")
+async def list_decks(request: Request):
+    return JSONResponse({'decks': await run_db(request, request.app.state.decks.root.list_decks)})
+
+
+@endpoint("words.list")
+async def list_words(request: Request):
+    """单词列表，keyword 模糊匹配，columns 为逗号分隔的列名"""
+    columns = request.query_params.get("columns")
+    columns = tuple(c.strip() for c in columns.split(",")) if columns else LIST_COLUMNS
+    manager = await _manager(request)
+    try:
+        rows = await run_db(request, manager.list_word_rows, columns, request.query_params.get("keyword"))
+    except ValueError as e:
+        raise ValidationError(str(e))
+    return JSONResponse({'words': [row.to_dict() for row in rows]})
+
+
+@endpoint("words.add")
+async def add_word(request: Request):
+    body = await _json_body(request)
+    word, meaning = body.get("word"), body.get("meaning")
+    if not isinstance(word, str) or not isinstance(meaning, str) or not word.strip() or not meaning.strip():
+        raise ValidationError("word 和 meaning 不能为空")
+    manager = await _manager(request, create=True)
+    added = await run_db(request, manager.add_word_direct, word, meaning,
+                         body.get("example") or "", body.get("phonetic") or "")
+    if not added:
+        return JSONResponse({'error': f"单词已存在或添加失败: {word}"}, status_code=409)
+    return JSONResponse({'word': word.strip().lower()}, status_code=201)
+
+
+@endpoint("words.get")
+async def get_word(request: Request):
+    word = request.path_params["word"]
+    manager = await _manager(request)
+    info = await run_db(request, manager.get_word, word)
+    if info is None:
+        raise NotFoundError(f"单词不存在: {word}")
+    return JSONResponse(info)
+
+
+@endpoint("words.delete")
+async def delete_word(request: Request):
+    word = request.path_params["word"]
+    manager = await _manager(request)
+    if not await run_db(request, manager.delete_word, word):
+        raise NotFoundError(f"单词不存在: {word}")
+    return JSONResponse({'deleted': word.lower()})
+
+
+@endpoint("review.queue")
+async def review_queue(request: Request):
+    limit = _int_param(request, "limit", Constants.REVIEW_LIMIT, 1, Constants.REVIEW_LIMIT * 10)
+    manager = await _manager(request)
+    return JSONResponse({'words': await run_db(request, manager.get_words_for_review, limit)})
+
+
+@endpoint("review.submit")
+async def submit_review(request: Request):
+    body = await _json_body(request)
+    word, quality = body.get("word"), body.get("quality")
+    if not isinstance(word, str) or not word.strip():
+        raise ValidationError("word 不能为空")
+    if (not isinstance(quality, int) or isinstance(quality, bool)
+            or not Constants.MIN_QUALITY <= quality <= Constants.MAX_QUALITY):
+        raise ValidationError(f"quality 必须是 {Constants.MIN_QUALITY}-{Constants.MAX_QUALITY} 的整数")
+    manager = await _manager(request)
+    if not await run_db(request, manager.update_review_status, word, quality):
+        raise NotFoundError(f"单词不存在: {word}")
+    return JSONResponse({'word': word.lower(), 'quality': quality})
+
+
+@endpoint("stats.overview")
+async def stats_overview(request: Request):
+    manager = await _manager(request)
+    return JSONResponse(await run_db(request, manager.get_statistics))
+
+
+@endpoint("stats.activity")
+async def stats_activity(request: Request):
+    days = _int_param(request, "days", 30, 1, 366)
+    manager = await _manager(request)
+    return JSONResponse(await run_db(request, manager.get_recent_activity, days))
+
+
+@endpoint("stats.forecast")
+async def stats_forecast(request: Request):
+    days = _int_param(request, "days", 7, 1, 366)
+    manager = await _manager(request)
+    return JSONResponse(await run_db(request, manager.get_future_review_stats, days))
+
+
+@endpoint("metrics")
+async def server_metrics(request: Request):
+    """本进程的性能指标和 SQL 查询统计"""
+    return JSONResponse({'metrics': metrics.snapshot(), 'queries': query_tracer.snapshot()})
+
+
+ROUTES = [
+    Route("/health", health),
+    Route("/decks", list_decks),
+    Route("/words", list_words, methods=["GET"]),
+    Route("/words", add_word, methods=["POST"]),
+    Route("/words/{word}", get_word, methods=["GET"]),
+    Route("/words/{word}", delete_word, methods=["DELETE"]),
+    Route("/review", review_queue, methods=["GET"]),
+    Route("/review", submit_review, methods=["POST"]),
+    Route("/stats", stats_overview),
+    Route("/stats/activity", stats_activity),
+    Route("/stats/forecast", stats_forecast),
+    Route("/metrics", server_metrics),
+]
+
+
+def create_app(db_path: str = None, db_workers: int = Constants.SERVER_DB_WORKERS) -> Starlette:
+    """创建 ASGI 应用
+
+    Args:
+        db_path: 数据库文件路径 (默认 data/words.db)
+        db_workers: 数据库线程池大小 (同时执行的数据库调用数，不应超过连接池大小)
+    """
+    decks = DeckManagers(db_path)
+
+    @asynccontextmanager
+    async def lifespan(app):
+        app.state.db_executor = ThreadPoolExecutor(max_workers=db_workers, thread_name_prefix="db")
+        # 预热: 打开数据库 (执行迁移) 并执行一次默认词库的概览统计
+        await asyncio.get_running_loop().run_in_executor(app.state.db_executor, decks.root.get_statistics)
+        logger.info(f"HTTP 服务已就绪 (数据库线程池 {db_workers})")
+        try:
+            yield
+        finally:
+            app.state.db_executor.shutdown(wait=True)
+            decks.root.db.engine.dispose()
+
+    app = Starlette(routes=ROUTES, lifespan=lifespan)
+    app.state.decks = decks
+    return app
@@ -7,15 +7,40 @@
 
 import logging
 from core.database import Database
+from core.constants import Constants
 
 class BaseService:
     """所有服务的基类"""
     
-    def __init__(self, db: Database = None):
-        """初始化服务"""
+    def __init__(self, db: Database = None, deck_id: int = Constants.DEFAULT_DECK_ID):
+        """初始化服务
+
+        Args:
+            db: 数据库
+            deck_id: 服务所属的词库，查询和写入都限定在该词库内
+        """
         self.db = db or Database()
+        self.deck_id = deck_id
         self.logger = logging.getLogger(self.__class__.__name__)
+        self._listeners = []
     
     def get_session(self):
         """获取数据库会话"""
         return self.db.get_session()
+    
+    def add_listener(self, callback):
+        """注册数据变更监听器，回调签名为 callback(event, word_text)"""
+        self._listeners.append(callback)
+    
+    def remove_listener(self, callback):
+        """移除数据变更监听器"""
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+    
+    def _notify(self, event: str, word_text: str = None):
+        """通知所有监听器 (单个监听器出错不影响其他监听器)"""
+        for callback in list(self._listeners):
+            try:
+                callback(event, word_text)
+            except Exception as e:
+                self.logger.error(f"数据变更监听器执行失败 ({event}): {e}")
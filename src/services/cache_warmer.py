@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+词典缓存预热模块
+按复习队列的到期顺序在后台预加载词典信息，使复习时的查询尽量命中缓存
+"""
+
+import datetime
+import itertools
+import logging
+import queue
+import threading
+import time
+from typing import Dict, Iterable
+
+from core.constants import Constants
+
+logger = logging.getLogger(__name__)
+
+# 优先级 (数值越小越先处理)
+PRIORITY_DUE = 0          # 已到期的单词
+PRIORITY_UPCOMING = 1     # 未来几天内到期的单词
+PRIORITY_VOCABULARY = 2   # 默认词汇级别中尚未加入词库的单词
+
+
+class CacheWarmer:
+    """词典缓存预热器
+
+    单个后台线程按优先级从队列中取词，跳过已缓存的单词；
+    前台有查询时暂停，避免与用户请求争抢限流配额
+    """
+
+    def __init__(self, dictionary_api, word_manager, config_manager=None,
+                 days: int = Constants.WARMUP_DAYS,
+                 vocabulary_count: int = Constants.WARMUP_VOCABULARY_COUNT,
+                 idle_seconds: float = Constants.WARMUP_IDLE_SECONDS):
+        """初始化
+
+        Args:
+            dictionary_api: 带缓存的词典API (BufferedDictionaryAPI)
+            word_manager: 单词管理器，用于获取复习队列和未加入词库的单词
+            config_manager: 配置管理器，用于读取默认词汇级别
+            days: 预热未来几天内到期的单词
+            vocabulary_count: 预热默认词汇级别单词的数量
+            idle_seconds: 前台查询后暂停预热的时间 (秒)
+        """
+        self.dictionary_api = dictionary_api
+        self.word_manager = word_manager
+        self.config_manager = config_manager
+        self.days = days
+        self.vocabulary_count = vocabulary_count
+        self.idle_seconds = idle_seconds
+
+        self._queue = queue.PriorityQueue()
+        self._seq = itertools.count()
+        self._queued = set()
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._resume_event = threading.Event()
+        self._resume_event.set()
+        self._thread = None
+
+        self._progress = {'total': 0, 'done': 0, 'fetched': 0, 'skipped': 0, 'failed': 0}
+
+    def enqueue(self, words: Iterable[str], priority: int) -> int:
+        """按指定优先级加入预热队列，已排队过的单词会被跳过
+
+        Returns:
+            实际加入的单词数
+        """
+        added = 0
+        with self._lock:
+            for word in words:
+                key = word.lower()
+                if key in self._queued:
+                    continue
+                self._queued.add(key)
+                self._queue.put((priority, next(self._seq), key))
+                added += 1
+            self._progress['total'] += added
+        return added
+
+    def schedule(self):
+        """根据复习队列和默认词汇级别填充预热队列
+
+        复习单词按到期顺序最多取缓存容量个，大量单词积压到期时不会把刚预热的单词挤出缓存
+        """
+        now = datetime.datetime.now()
+        capacity = getattr(self.dictionary_api, 'max_cache_size', None)
+        upcoming = self.word_manager.review_service.get_upcoming_review_words(self.days, limit=capacity)
+        due = [w['word'] for w in upcoming if w['next_review'] is None or w['next_review'] <= now]
+        later = [w['word'] for w in upcoming if w['next_review'] is not None and w['next_review'] > now]
+        self.enqueue(due, PRIORITY_DUE)
+        self.enqueue(later, PRIORITY_UPCOMING)
+
+        # 缓存容量有限，词汇级别预热不挤占复习单词的位置
+        budget = self.vocabulary_count if capacity is None else min(self.vocabulary_count, capacity - len(upcoming))
+        if budget > 0:
+            level = "cet6"
+            if self.config_manager:
+                level = self.config_manager.get("default_vocabulary_level", level)
+            self.enqueue(self.word_manager.dict_service.sample_new_words(level, budget), PRIORITY_VOCABULARY)
+
+        logger.info(f"缓存预热已排队: 到期 {len(due)} 个, 即将到期 {len(later)} 个, "
+                    f"词汇 {max(budget, 0)} 个")
+
+    def start(self):
+        """启动后台预热线程"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._worker, name="cache-warmer", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """停止预热"""
+        self._stop_event.set()
+        self._resume_event.set()
+
+    def pause(self):
+        """手动暂停预热"""
+        self._resume_event.clear()
+
+    def resume(self):
+        """恢复预热"""
+        self._resume_event.set()
+
+    def _user_active(self) -> bool:
+        """前台最近是否有查询"""
+        last = getattr(self.dictionary_api, 'last_foreground_request', 0.0)
+        return time.monotonic() - last < self.idle_seconds
+
+    def _worker(self):
+        """预热工作线程"""
+        while not self._stop_event.is_set():
+            self._resume_event.wait()
+            if self._stop_event.is_set():
+                break
+            if self._user_active():
+                self._stop_event.wait(0.5)
+                continue
+
+            try:
+                _, _, word = self._queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+
+            try:
+                if self.dictionary_api.is_cached(word):
+                    outcome = 'skipped'
+                elif self.dictionary_api.get_word_info(word, background=True):
+                    outcome = 'fetched'
+                else:
+                    outcome = 'failed'
+            except Exception as e:
+                logger.error(f"预热单词 '{word}' 失败: {e}")
+                outcome = 'failed'
+
+            with self._lock:
+                self._progress[outcome] += 1
+                self._progress['done'] += 1
+
+    def get_progress(self) -> Dict:
+        """获取预热进度"""
+        with self._lock:
+            progress = dict(self._progress)
+        progress['pending'] = progress['total'] - progress['done']
+        progress['paused'] = not self._resume_event.is_set() or self._user_active()
+        progress['running'] = bool(self._thread and self._thread.is_alive())
+        return progress
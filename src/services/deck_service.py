@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+词库服务类
+负责词库的创建和查询 (每个学习者一个或多个词库)
+"""
+
+from typing import Dict, List, Optional
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from .base_service import BaseService
+from core.models import Deck, Word
+from utils.decorators import timed
+
+class DeckService(BaseService):
+    """词库服务"""
+
+    @timed("service")
+    def get_deck_id(self, name: str) -> Optional[int]:
+        """按名称查找词库"""
+        session = self.get_session()
+        try:
+            return session.query(Deck.id).filter_by(name=name).scalar()
+        finally:
+            session.close()
+
+    @timed("service")
+    def get_or_create_deck(self, name: str) -> int:
+        """按名称获取词库，不存在时创建 (并发创建同名词库时返回先创建的那个)"""
+        deck_id = self.get_deck_id(name)
+        if deck_id is not None:
+            return deck_id
+        session = self.get_session()
+        try:
+            deck = Deck(name=name)
+            session.add(deck)
+            session.commit()
+            self.logger.info(f"已创建词库: {name}")
+            return deck.id
+        except IntegrityError:
+            session.rollback()
+            return self.get_deck_id(name)
+        finally:
+            session.close()
+
+    @timed("service")
+    def list_decks(self) -> List[Dict]:
+        """所有词库及其单词数"""
+        session = self.get_session()
+        try:
+            rows = session.query(Deck.id, Deck.name, func.count(Word.id)).outerjoin(
+                Word, Word.deck_id == Deck.id).group_by(Deck.id).order_by(Deck.id).all()
+            return [{'id': deck_id, 'name': name, 'word_count': count} for deck_id, name, count in rows]
+        finally:
+            session.close()
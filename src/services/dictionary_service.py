@@ -6,7 +6,11 @@
 """
 
 import logging
+from typing import Dict, List
 from .base_service import BaseService
+from core.models import Word
+from core.constants import Constants
+from utils.decorators import counted, timed
 
 # 导入词典API模块
 try:
@@ -22,10 +26,19 @@ except ImportError:
 class DictionaryService(BaseService):
     """词典服务"""
     
-    def __init__(self, db=None):
-        super().__init__(db)
-        self.dictionary_api = None
-        self._init_api()
+    def __init__(self, db=None, deck_id=Constants.DEFAULT_DECK_ID, dictionary_api=None):
+        """初始化词典服务
+
+        Args:
+            db: 数据库
+            deck_id: 词库 (随机选词时排除该词库中已有的单词)
+            dictionary_api: 共用的词典API实例，为空时新建 (多个词库共用一份词典缓存)
+        """
+        super().__init__(db, deck_id)
+        self.dictionary_api = dictionary_api
+        self._deck_vocabulary = None
+        if dictionary_api is None:
+            self._init_api()
     
     def _init_api(self):
         """初始化 API"""
@@ -43,12 +56,53 @@ class DictionaryService(BaseService):
                     self.logger.error(f"无法初始化词典API: {e2}")
                     self.dictionary_api = None
     
-    def get_word_info(self, word_text: str):
-        """获取单词信息"""
+    @timed("service")
+    def get_word_info(self, word_text: str, translate: bool = False):
+        """获取单词信息（translate 为 True 时同步获取中文释义）"""
         if not self.dictionary_api:
             return None
         try:
-            return self.dictionary_api.get_word_info(word_text)
+            return self.dictionary_api.get_word_info(word_text, translate=translate)
         except Exception as e:
             self.logger.error(f"查询单词 '{word_text}' 失败: {e}")
             return None
+    
+    def _get_deck_vocabulary(self):
+        """获取词库成员位图 (首次使用时从数据库加载)"""
+        if self._deck_vocabulary is None:
+            from api.vocabulary_index import DeckVocabulary, get_vocabulary_index
+            session = self.get_session()
+            try:
+                deck_words = [w for (w,) in session.query(Word.word).filter(Word.deck_id == self.deck_id).all()]
+            finally:
+                session.close()
+            self._deck_vocabulary = DeckVocabulary(get_vocabulary_index(), deck_words)
+        return self._deck_vocabulary
+    
+    @counted("service")
+    def on_word_change(self, event: str, word_text: str = None):
+        """同步 WordService 的单词增删 (位图尚未加载时无需处理)"""
+        if self._deck_vocabulary is None:
+            return
+        if event == "word_added":
+            self._deck_vocabulary.add(word_text)
+        elif event == "word_deleted":
+            self._deck_vocabulary.discard(word_text)
+        elif event == "words_cleared":
+            self._deck_vocabulary.reset()
+    
+    @timed("service")
+    def sample_new_words(self, vocabulary_level: str, count: int) -> List[str]:
+        """从指定级别中抽取尚未加入词库的单词"""
+        return self._get_deck_vocabulary().sample_unseen(vocabulary_level, count)
+    
+    @timed("service")
+    def get_random_new_words(self, count: int = 1, vocabulary_level: str = "cet6", translate: bool = False) -> List[Dict]:
+        """获取尚未加入词库的随机单词信息"""
+        if not self.dictionary_api:
+            return []
+        words = self.sample_new_words(vocabulary_level, count)
+        if not words:
+            self.logger.info(f"{vocabulary_level.upper()} 词汇已全部加入词库")
+            return []
+        return self.dictionary_api.get_words_info(words, translate=translate)
@@ -10,16 +10,20 @@ from typing import List, Dict
 from sqlalchemy import or_
 from .base_service import BaseService
 from core.models import Word, ReviewHistory
+from core import review_log
+from utils.decorators import timed
 
 class ReviewService(BaseService):
     """复习服务"""
     
+    @timed("service")
     def get_words_for_review(self, limit: int = 100) -> List[Dict]:
         """获取待复习单词列表"""
         session = self.get_session()
         try:
             now = datetime.datetime.now()
             words = session.query(Word).filter(
+                Word.deck_id == self.deck_id,
                 or_(
                     Word.next_review <= now,
                     Word.next_review == None
@@ -29,22 +33,51 @@ class ReviewService(BaseService):
         finally:
             session.close()
 
+    @timed("service")
+    def get_upcoming_review_words(self, days: int = 3, limit: int = None) -> List[Dict]:
+        """获取未来几天内到期的单词 (含已到期)，按到期时间排序
+
+        Args:
+            days: 未来几天
+            limit: 最多返回的单词数 (为空时不限)
+
+        Returns:
+            [{'word': ..., 'next_review': datetime 或 None}, ...]
+        """
+        session = self.get_session()
+        try:
+            horizon = datetime.datetime.now() + datetime.timedelta(days=days)
+            rows = session.query(Word.word, Word.next_review).filter(
+                Word.deck_id == self.deck_id,
+                or_(
+                    Word.next_review <= horizon,
+                    Word.next_review == None
+                )
+            ).order_by(Word.next_review.asc()).limit(limit).all()
+            return [{'word': word, 'next_review': next_review} for word, next_review in rows]
+        finally:
+            session.close()
+
+    @timed("service")
     def update_review_status(self, word_text: str, quality: int) -> bool:
         """更新复习状态"""
         session = self.get_session()
         try:
-            word = session.query(Word).filter_by(word=word_text.lower()).first()
+            word = session.query(Word).filter_by(deck_id=self.deck_id, word=word_text.lower()).first()
             if not word:
                 return False
             
-            # 1. 记录复习历史
-            history = ReviewHistory(word_id=word.id, quality=quality)
+            # 1. 记录复习历史 (同时追加到紧凑复习日志，两边时间一致)
+            now = datetime.datetime.now()
+            history = ReviewHistory(word_id=word.id, deck_id=self.deck_id, quality=quality, review_date=now)
             session.add(history)
+            review_log.append(session, self.deck_id, word.id, quality, now)
             
             # 2. 执行 SM-2 算法更新
             self._apply_sm2(word, quality)
             
             session.commit()
+            self._notify("word_reviewed", word_text.lower())
             return True
         except Exception as e:
             self.logger.error(f"更新复习状态失败: {e}")
@@ -53,6 +86,7 @@ class ReviewService(BaseService):
         finally:
             session.close()
 
+    @timed("service")
     def get_future_review_stats(self, days: int = 7) -> Dict[str, int]:
         """获取未来几天的复习量预估"""
         session = self.get_session()
@@ -65,8 +99,8 @@ class ReviewService(BaseService):
                 func.date(Word.next_review).label('date'),
                 func.count(Word.id).label('count')
             ).filter(
-                Word.next_review >= now,
-                Word.next_review <= end_date
+                Word.deck_id == self.deck_id,
+                func.date(Word.next_review).between(now.isoformat(), end_date.isoformat())
             ).group_by('date').all()
             
             # 初始化日期字典
@@ -6,24 +6,60 @@
 """
 
 import datetime
-from typing import Dict
+from typing import Dict, List, Tuple
 from sqlalchemy import func
 from .base_service import BaseService
 from core.models import Word, ReviewHistory
+from core import review_log
+from core.constants import Constants
+from utils.decorators import timed
 
 class StatsService(BaseService):
     """统计服务"""
     
+    def __init__(self, db=None, snapshot=None, deck_id=Constants.DEFAULT_DECK_ID):
+        """初始化统计服务
+
+        Args:
+            db: 数据库
+            snapshot: 返回词库列式快照的函数 (DeckSnapshot，须属于同一词库)，由调用方负责转发单词变更事件；
+                第一次需要快照的统计时才调用，为空时每次临时加载一份
+            deck_id: 词库
+        """
+        super().__init__(db, deck_id)
+        self._snapshot_factory = snapshot
+        self.snapshot = None
+    
+    def _deck(self):
+        """词库快照 (首次使用时创建并加载，NumPy 也在这时才导入)"""
+        if self.snapshot is not None:
+            return self.snapshot
+        if self._snapshot_factory is not None:
+            self.snapshot = self._snapshot_factory()
+            return self.snapshot
+        from core.deck_snapshot import DeckSnapshot
+        return DeckSnapshot(self.db, self.deck_id)
+    
+    @timed("service")
     def get_overview_stats(self) -> Dict:
-        """获取概览统计数据"""
+        """获取概览统计数据 (快照已被其他统计加载时从快照计算，否则直接查询数据库，不为概览加载快照)"""
         session = self.get_session()
         try:
-            total = session.query(Word).count()
-            reviewed = session.query(Word).filter(Word.review_count > 0).count()
-            mastered = session.query(Word).filter(Word.mastery_level >= 4).count()
-            
-            # 计算平均记忆强度
-            avg_mastery = session.query(func.avg(Word.mastery_level)).scalar() or 0
+            if self.snapshot is not None:
+                overview = self.snapshot.overview()
+                total = overview["total_words"]
+                reviewed = overview["reviewed_words"]
+                mastered = overview["mastered_words"]
+                avg_mastery = overview["avg_mastery"]
+            else:
+                words = session.query(Word).filter(Word.deck_id == self.deck_id)
+                total = words.count()
+                reviewed = words.filter(Word.review_count > 0).count()
+                mastered = words.filter(Word.mastery_level >= 4).count()
+                
+                # 计算平均记忆强度
+                avg_mastery = session.query(func.avg(Word.mastery_level)).filter(
+                    Word.deck_id == self.deck_id).scalar() or 0
             
             # 计算连续打卡天数 (简化版逻辑)
             streak_days = self._calculate_streak(session)
@@ -39,20 +75,49 @@ class StatsService(BaseService):
         finally:
             session.close()
 
+    @timed("service")
+    def get_mastery_histogram(self) -> List[int]:
+        """各掌握程度 (0-5) 的单词数"""
+        return self._deck().mastery_histogram()
+
+    @timed("service")
+    def get_ef_distribution(self, bins: int = 10) -> Tuple[List[int], List[float]]:
+        """难度系数 (EF) 的分布: (各区间的单词数, 区间边界)"""
+        return self._deck().ef_distribution(bins)
+
+    @timed("service")
+    def get_due_forecast(self, days: int = 7) -> Dict[str, int]:
+        """从今天起每天到期的单词数"""
+        return self._deck().due_counts_by_day(days)
+
+    @timed("service")
+    def get_category_counts(self) -> Dict[str, int]:
+        """各分类的单词数"""
+        return self._deck().category_counts()
+
+    @timed("service")
+    def get_word_metrics(self, words: List[str]) -> Dict[str, Dict]:
+        """一组单词的复习次数、间隔、EF 和掌握程度"""
+        return self._deck().word_metrics(words)
+
     def _calculate_streak(self, session) -> int:
         """计算连续打卡天数"""
         # 获取所有有复习记录的日期
-        dates = session.query(func.date(ReviewHistory.review_date)).distinct().order_by(func.date(ReviewHistory.review_date).desc()).all()
-        if not dates:
+        if Constants.COMPACT_REVIEW_LOG:
+            review_dates = review_log.review_dates(session, self.deck_id)
+        else:
+            review_day = func.date(ReviewHistory.review_date)
+            dates = session.query(review_day).filter(
+                ReviewHistory.deck_id == self.deck_id).distinct().order_by(review_day.desc()).all()
+            # 将结果转换为 date 对象列表
+            review_dates = [datetime.datetime.strptime(d[0], '%Y-%m-%d').date() if isinstance(d[0], str) else d[0] for d in dates]
+        if not review_dates:
             return 0
         
         streak = 0
         today = datetime.date.today()
         current_check = today
         
-        # 将结果转换为 date 对象列表
-        review_dates = [datetime.datetime.strptime(d[0], '%Y-%m-%d').date() if isinstance(d[0], str) else d[0] for d in dates]
-        
         # 如果今天没打卡，从昨天开始算，或者直接返回0（取决于定义）
         # 这里定义为：如果今天打卡了，算上今天；如果今天没打卡但昨天打卡了，连续天数保留；否则断开
         if today not in review_dates:
@@ -68,23 +133,33 @@ class StatsService(BaseService):
                 break
         return streak
 
+    @timed("service")
     def get_recent_activity(self, days: int = 30) -> Dict:
         """获取最近活动统计"""
         session = self.get_session()
         try:
             start_date = datetime.date.today() - datetime.timedelta(days=days-1)
             
-            # 1. 查询每日新增
+            # 1. 查询每日新增 (条件与分组使用同一个 date 表达式，走表达式索引)
             new_words = session.query(
                 func.date(Word.added_date).label('date'),
                 func.count(Word.id).label('count')
-            ).filter(Word.added_date >= start_date).group_by('date').all()
+            ).filter(
+                Word.deck_id == self.deck_id,
+                func.date(Word.added_date) >= start_date.isoformat()
+            ).group_by('date').all()
             
             # 2. 查询每日复习
-            reviews = session.query(
-                func.date(ReviewHistory.review_date).label('date'),
-                func.count(ReviewHistory.id).label('count')
-            ).filter(ReviewHistory.review_date >= start_date).group_by('date').all()
+            if Constants.COMPACT_REVIEW_LOG:
+                reviews = review_log.daily_counts(session, start_date, self.deck_id).items()
+            else:
+                reviews = session.query(
+                    func.date(ReviewHistory.review_date).label('date'),
+                    func.count(ReviewHistory.id).label('count')
+                ).filter(
+                    ReviewHistory.deck_id == self.deck_id,
+                    func.date(ReviewHistory.review_date) >= start_date.isoformat()
+                ).group_by('date').all()
             
             # 合并结果
             daily_stats = {}
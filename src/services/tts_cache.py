@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+语音缓存模块
+按内容寻址保存合成好的音频文件，超出容量时淘汰最久未播放的文件
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class TTSAudioCache:
+    """语音音频缓存
+
+    文件名为 (文本, 声音, 语速) 的哈希值，按前两位分子目录存放；
+    命中时更新文件修改时间，淘汰时按修改时间从旧到新删除
+    """
+
+    SUFFIX = ".wav"
+
+    def __init__(self, cache_dir: str, max_bytes: int):
+        """初始化
+
+        Args:
+            cache_dir: 缓存目录
+            max_bytes: 缓存总大小上限 (字节)
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._total_bytes = None
+
+    @staticmethod
+    def make_key(text: str, voice: str = "", rate: int = 0) -> str:
+        """根据文本和语音参数计算缓存键"""
+        content = f"{text.strip().lower()}\0{voice}\0{rate}"
+        return hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+    def path_for(self, key: str) -> str:
+        """缓存键对应的文件路径 (目录不存在时创建)"""
+        directory = os.path.join(self.cache_dir, key[:2])
+        os.makedirs(directory, exist_ok=True)
+        return os.path.join(directory, key + self.SUFFIX)
+
+    def get(self, key: str) -> Optional[str]:
+        """查找缓存的音频文件，命中时返回路径"""
+        path = os.path.join(self.cache_dir, key[:2], key + self.SUFFIX)
+        try:
+            if os.path.getsize(path) > 0:
+                os.utime(path)
+                return path
+        except OSError:
+            pass
+        return None
+
+    def _scan(self):
+        """首次使用时统计已有文件总大小，调用方需持有锁"""
+        if self._total_bytes is None:
+            self._total_bytes = sum(os.path.getsize(path) for path, _ in self._iter_files())
+
+    def _iter_files(self):
+        """产出 (路径, 修改时间)"""
+        if not os.path.isdir(self.cache_dir):
+            return
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if name.endswith(self.SUFFIX):
+                    path = os.path.join(root, name)
+                    try:
+                        yield path, os.path.getmtime(path)
+                    except OSError:
+                        continue
+
+    def add(self, path: str):
+        """登记新生成的音频文件，超出容量时淘汰旧文件"""
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            return
+        with self._lock:
+            if self._total_bytes is None:
+                # 首次统计时已包含该文件
+                self._scan()
+            else:
+                self._total_bytes += size
+            if self._total_bytes > self.max_bytes:
+                self._evict(keep=path)
+
+    def _evict(self, keep: str):
+        """按修改时间从旧到新删除文件，直到低于容量上限的 90%，调用方需持有锁"""
+        target = self.max_bytes * 0.9
+        for path, _ in sorted(self._iter_files(), key=lambda item: item[1]):
+            if self._total_bytes <= target:
+                break
+            if path == keep:
+                continue
+            try:
+                size = os.path.getsize(path)
+                os.remove(path)
+                self._total_bytes -= size
+            except OSError as e:
+                logger.warning(f"删除语音缓存文件失败: {e}")
+
+    def total_bytes(self) -> int:
+        """缓存文件总大小 (字节)"""
+        with self._lock:
+            self._scan()
+            return self._total_bytes
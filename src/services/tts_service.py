@@ -5,60 +5,241 @@
 负责单词和例句的文本转语音 (TTS)
 """
 
+import os
+import shutil
+import subprocess
 import threading
-import pyttsx3
 import logging
+from typing import Iterable, List, Optional
+from core.constants import Constants
+from core.exceptions import TaskRejectedError
+from core.task_scheduler import get_task_scheduler
+from .tts_cache import TTSAudioCache
+from utils.decorators import counted, timed
+
+try:
+    import winsound
+except ImportError:
+    winsound = None
+
+# 非 Windows 平台上用于播放音频文件的命令 (按优先级)
+AUDIO_PLAYERS = [["afplay"], ["paplay"], ["aplay", "-q"]]
+
+# 通过环境变量选择 TTS 后端 (pyttsx3 或 stub)
+TTS_BACKEND_ENV = "WORD_HELPER_TTS"
+
+
+class StubTTSEngine:
+    """无声的 TTS 引擎，用于无音频设备的环境 (如 CI、服务器) 和测试"""
 
-class TTSService:
-    """TTS 服务"""
-    
     def __init__(self):
+        self._properties = {'rate': 150, 'volume': 1.0, 'voice': "", 'voices': []}
+
+    def setProperty(self, name, value):
+        self._properties[name] = value
+
+    def getProperty(self, name):
+        return self._properties.get(name)
+
+    def say(self, text):
+        pass
+
+    def save_to_file(self, text, path):
+        pass
+
+    def runAndWait(self):
+        pass
+
+    def stop(self):
+        pass
+
+
+class TTSService:
+    """TTS 服务
+
+    引擎在首次使用时于 tts 队列的工作线程中创建，之后所有引擎调用都在该线程执行；
+    界面可以在启动后调用 warm_up 提前创建
+    """
+
+    def __init__(self, cache_dir: str = None, backend: str = None):
+        """初始化 (不创建 TTS 引擎)
+
+        Args:
+            cache_dir: 语音缓存目录，默认为项目根目录下的 data/tts_cache
+            backend: TTS 后端，"pyttsx3" 或 "stub"，默认读取环境变量 WORD_HELPER_TTS
+        """
         self.logger = logging.getLogger(self.__class__.__name__)
+        self.backend = backend or os.environ.get(TTS_BACKEND_ENV, "pyttsx3")
         self._engine = None
+        self._warm_up_requested = False
         self._lock = threading.Lock()
-        self._init_engine()
+        self._voice_id = ""
+        self._rate = 150
+        self._player = None
+        self._player_command = self._find_player()
+
+        if cache_dir is None:
+            base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+            cache_dir = os.path.join(base_dir, "data", "tts_cache")
+        self.audio_cache = TTSAudioCache(cache_dir, Constants.TTS_CACHE_MAX_BYTES)
+
+    @property
+    def is_stub(self) -> bool:
+        """是否使用无声的 stub 后端"""
+        return self.backend == "stub" or isinstance(self._engine, StubTTSEngine)
+
+    def _ensure_engine(self):
+        """获取 TTS 引擎，首次调用时创建 (应在 tts 队列中调用)"""
+        if self._engine is None:
+            with self._lock:
+                if self._engine is None:
+                    self._init_engine()
+        return self._engine
 
     def _init_engine(self):
-        """初始化 TTS 引擎"""
+        """初始化 TTS 引擎，失败时退回 stub 后端"""
+        if self.backend == "stub":
+            self._engine = StubTTSEngine()
+            return
         try:
-            # 在单独的线程中初始化，避免阻塞主线程
+            import pyttsx3
             self._engine = pyttsx3.init()
             # 设置语速
-            self._engine.setProperty('rate', 150)
+            self._engine.setProperty('rate', self._rate)
             # 设置音量
             self._engine.setProperty('volume', 1.0)
-            
+
             # 尝试查找英文声音
             voices = self._engine.getProperty('voices')
             for voice in voices:
                 if 'EN-US' in voice.id.upper() or 'ENGLISH' in voice.name.upper():
                     self._engine.setProperty('voice', voice.id)
+                    self._voice_id = voice.id
                     break
+            self.logger.info("TTS 引擎已初始化")
+        except Exception as e:
+            self.logger.error(f"无法初始化 TTS 引擎，使用静音后端: {e}")
+            self._engine = StubTTSEngine()
+
+    def warm_up(self):
+        """在后台提前创建 TTS 引擎 (如界面首次绘制完成后)，不阻塞调用方"""
+        if self._engine is not None or self._warm_up_requested:
+            return
+        self._warm_up_requested = True
+        try:
+            get_task_scheduler().submit('tts', self._ensure_engine)
+        except TaskRejectedError as e:
+            self.logger.warning(f"TTS 预热已跳过: {e}")
+
+    @staticmethod
+    def _find_player() -> Optional[List[str]]:
+        """查找可用的音频播放命令，Windows 上使用 winsound"""
+        if winsound is not None:
+            return []
+        for command in AUDIO_PLAYERS:
+            if shutil.which(command[0]):
+                return command
+        return None
+
+    @timed("service")
+    def _get_audio(self, text: str) -> Optional[str]:
+        """获取文本对应的音频文件，未缓存时合成一次并写入缓存"""
+        engine = self._ensure_engine()
+        key = TTSAudioCache.make_key(text, self._voice_id, self._rate)
+        path = self.audio_cache.get(key)
+        if path or self.is_stub:
+            return path
+
+        path = self.audio_cache.path_for(key)
+        part_path = path + ".part"
+        with self._lock:
+            try:
+                engine.save_to_file(text, part_path)
+                engine.runAndWait()
+            except Exception as e:
+                self.logger.error(f"TTS 合成失败: {e}")
+                return None
+
+        if not os.path.exists(part_path) or os.path.getsize(part_path) == 0:
+            return None
+        os.replace(part_path, path)
+        self.audio_cache.add(path)
+        return path
+
+    def _play_file(self, path: str) -> bool:
+        """播放音频文件，成功返回 True"""
+        try:
+            if winsound is not None:
+                winsound.PlaySound(path, winsound.SND_FILENAME)
+                return True
+            self._player = subprocess.Popen(self._player_command + [path],
+                                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            return self._player.wait() == 0
         except Exception as e:
-            self.logger.error(f"无法初始化 TTS 引擎: {e}")
-            self._engine = None
+            self.logger.error(f"播放音频失败: {e}")
+            return False
+        finally:
+            self._player = None
 
+    @counted("service")
     def speak(self, text: str):
-        """播放语音"""
-        if not self._engine:
-            self._init_engine()
-        
-        if not self._engine:
+        """播放语音 (优先使用缓存的音频，无法播放文件时直接朗读)"""
+        if not text or not text.strip() or self.backend == "stub":
             return
 
         def _run():
+            engine = self._ensure_engine()
+            if self._player_command is not None:
+                path = self._get_audio(text)
+                if path and self._play_file(path):
+                    return
             with self._lock:
                 try:
-                    self._engine.say(text)
-                    self._engine.runAndWait()
+                    engine.say(text)
+                    engine.runAndWait()
                 except Exception as e:
                     self.logger.error(f"TTS 播放失败: {e}")
 
-        # 在新线程中运行，避免阻塞 GUI
-        threading.Thread(target=_run, daemon=True).start()
+        # 在 tts 队列中运行，避免阻塞 GUI；排队过多时丢弃本次朗读
+        try:
+            get_task_scheduler().submit('tts', _run)
+        except TaskRejectedError as e:
+            self.logger.warning(f"TTS 播放请求已丢弃: {e}")
+
+    @counted("service")
+    def prerender(self, texts: Iterable[str]):
+        """在后台为即将播放的文本 (如本次复习的单词) 预先合成音频
+
+        每个单词合成完后再提交下一个，期间的朗读请求可以插队执行
+        """
+        if self.is_stub or self._player_command is None:
+            return
+        texts = [t for t in texts if t and t.strip()][:Constants.TTS_PRERENDER_LIMIT]
+
+        def _render_next(i):
+            if i >= len(texts) or self.is_stub:
+                return
+            self._get_audio(texts[i])
+            try:
+                get_task_scheduler().submit('tts', _render_next, i + 1)
+            except TaskRejectedError:
+                pass
+
+        try:
+            get_task_scheduler().submit('tts', _render_next, 0)
+        except TaskRejectedError as e:
+            self.logger.warning(f"语音预合成已跳过: {e}")
 
     def stop(self):
         """停止所有正在播放的语音"""
+        player = self._player
+        if player is not None:
+            try:
+                player.terminate()
+            except Exception:
+                pass
+        if winsound is not None:
+            winsound.PlaySound(None, 0)
         if self._engine:
             try:
                 self._engine.stop()
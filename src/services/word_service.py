@@ -6,14 +6,17 @@
 """
 
 import datetime
-from typing import List, Optional, Dict
-from sqlalchemy import or_
+from typing import List, Optional, Dict, Sequence
+from sqlalchemy import or_, select
 from .base_service import BaseService
-from core.models import Word, ReviewHistory
+from core.models import Word, ReviewHistory, ReviewLog
+from core.word_rows import LIST_COLUMNS, word_row_type
+from utils.decorators import timed
 
 class WordService(BaseService):
     """单词服务"""
     
+    @timed("service")
     def add_word(self, word_text: str, meaning: str, example: str = "", phonetic: str = "", category: str = "默认") -> bool:
         """添加新单词"""
         if not word_text or not meaning:
@@ -22,11 +25,12 @@ class WordService(BaseService):
         word_text = word_text.strip().lower()
         session = self.get_session()
         try:
-            existing = session.query(Word).filter_by(word=word_text).first()
+            existing = session.query(Word).filter_by(deck_id=self.deck_id, word=word_text).first()
             if existing:
                 return False
             
             new_word = Word(
+                deck_id=self.deck_id,
                 word=word_text,
                 meaning=meaning,
                 example=example,
@@ -36,6 +40,7 @@ class WordService(BaseService):
             )
             session.add(new_word)
             session.commit()
+            self._notify("word_added", word_text)
             return True
         except Exception as e:
             self.logger.error(f"添加单词失败: {e}")
@@ -44,14 +49,19 @@ class WordService(BaseService):
         finally:
             session.close()
 
+    @timed("service")
     def delete_word(self, word_text: str) -> bool:
-        """删除单词"""
+        """删除单词 (复习历史随单词级联删除，复习日志没有外键关联，在同一事务中删除)"""
         session = self.get_session()
         try:
-            word = session.query(Word).filter_by(word=word_text.lower()).first()
+            word = session.query(Word).filter_by(deck_id=self.deck_id, word=word_text.lower()).first()
             if word:
+                # 单词的 id 会被之后添加的单词重用，留下的日志会被算到新单词上
+                session.query(ReviewLog).filter(
+                    ReviewLog.deck_id == self.deck_id, ReviewLog.word_id == word.id).delete()
                 session.delete(word)
                 session.commit()
+                self._notify("word_deleted", word_text.lower())
                 return True
             return False
         except Exception as e:
@@ -61,11 +71,12 @@ class WordService(BaseService):
         finally:
             session.close()
 
+    @timed("service")
     def update_word(self, word_text: str, **kwargs) -> bool:
         """更新单词信息"""
         session = self.get_session()
         try:
-            word = session.query(Word).filter_by(word=word_text.lower()).first()
+            word = session.query(Word).filter_by(deck_id=self.deck_id, word=word_text.lower()).first()
             if not word:
                 return False
             
@@ -74,6 +85,7 @@ class WordService(BaseService):
                     setattr(word, key, value)
                 
             session.commit()
+            self._notify("word_updated", word_text.lower())
             return True
         except Exception as e:
             self.logger.error(f"更新单词失败: {e}")
@@ -82,31 +94,62 @@ class WordService(BaseService):
         finally:
             session.close()
 
+    @timed("service")
     def get_word(self, word_text: str) -> Optional[Dict]:
         """获取单个单词"""
         session = self.get_session()
         try:
-            word = session.query(Word).filter_by(word=word_text.lower()).first()
+            word = session.query(Word).filter_by(deck_id=self.deck_id, word=word_text.lower()).first()
             return word.to_dict() if word else None
         finally:
             session.close()
 
+    @timed("service")
     def get_all_words(self) -> List[Dict]:
         """获取所有单词"""
         session = self.get_session()
         try:
-            words = session.query(Word).all()
+            words = session.query(Word).filter(Word.deck_id == self.deck_id).all()
             return [w.to_dict() for w in words]
         finally:
             session.close()
 
+    @timed("service")
+    def list_rows(self, columns: Sequence[str] = LIST_COLUMNS, keyword: str = None) -> List[tuple]:
+        """获取单词列表的轻量级行记录 (只查询需要的列，不创建 ORM 对象)
+
+        Args:
+            columns: 需要的列，默认为查看单词页显示的列
+            keyword: 按单词、释义或例句模糊匹配 (为空时返回全部)
+
+        Returns:
+            行记录列表，可按列名访问，日期列为 datetime，用 row.date(列名) 格式化
+        """
+        row_type = word_row_type(tuple(columns))
+        statement = select(*(getattr(Word, name) for name in row_type._fields)).where(Word.deck_id == self.deck_id)
+        if keyword:
+            search_pattern = f"%{keyword}%"
+            statement = statement.where(or_(
+                Word.word.like(search_pattern),
+                Word.meaning.like(search_pattern),
+                Word.example.like(search_pattern)
+            ))
+        session = self.get_session()
+        try:
+            return list(map(row_type._make, session.execute(statement)))
+        finally:
+            session.close()
+
+    @timed("service")
     def clear_all_words(self) -> bool:
-        """清空所有单词和复习记录"""
+        """清空词库中的所有单词和复习记录"""
         session = self.get_session()
         try:
-            session.query(ReviewHistory).delete()
-            session.query(Word).delete()
+            session.query(ReviewHistory).filter(ReviewHistory.deck_id == self.deck_id).delete()
+            session.query(ReviewLog).filter(ReviewLog.deck_id == self.deck_id).delete()
+            session.query(Word).filter(Word.deck_id == self.deck_id).delete()
             session.commit()
+            self._notify("words_cleared")
             return True
         except Exception as e:
             self.logger.error(f"清空数据失败: {e}")
@@ -115,12 +158,14 @@ class WordService(BaseService):
         finally:
             session.close()
 
+    @timed("service")
     def search_words(self, keyword: str) -> List[Dict]:
         """搜索单词"""
         session = self.get_session()
         try:
             search_pattern = f"%{keyword}%"
             words = session.query(Word).filter(
+                Word.deck_id == self.deck_id,
                 or_(
                     Word.word.like(search_pattern),
                     Word.meaning.like(search_pattern),
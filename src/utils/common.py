@@ -41,6 +41,13 @@ def confirm_action(prompt: str) -> bool:
             print("请输入 y(是) 或 n(否)")
 
 
+def get_log_dir() -> str:
+    """日志目录 (不存在时创建)"""
+    log_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "logs")
+    os.makedirs(log_dir, exist_ok=True)
+    return log_dir
+
+
 def init_logging(level: int = logging.INFO) -> None:
     """初始化统一的日志系统（控制台 + 轮转文件）"""
     logger = logging.getLogger()
@@ -59,10 +66,7 @@ def init_logging(level: int = logging.INFO) -> None:
     console.setFormatter(formatter)
     logger.addHandler(console)
     
-    base_dir = os.path.dirname(os.path.dirname(__file__))
-    log_dir = os.path.join(base_dir, "logs")
-    os.makedirs(log_dir, exist_ok=True)
-    file_path = os.path.join(log_dir, "app.log")
+    file_path = os.path.join(get_log_dir(), "app.log")
     
     file_handler = RotatingFileHandler(file_path, maxBytes=1024 * 1024, backupCount=3, encoding="utf-8")
     file_handler.setLevel(level)
@@ -2,18 +2,73 @@
 # -*- coding: utf-8 -*-
 """
 装饰器模块
-提供通用的装饰器函数
+提供通用的装饰器函数 (异常处理、性能监控)
 """
 
 import logging
+import time
 from functools import wraps
-from tkinter import messagebox
 
-from ..core.exceptions import DatabaseError, APIError, ValidationError
+from core.exceptions import DatabaseError, APIError, ValidationError
+from core.query_trace import query_tracer
+from utils.metrics import metrics
+
+try:
+    from tkinter import messagebox
+except ImportError:
+    # 无图形界面的环境 (如服务器) 中只记录日志
+    messagebox = None
 
 logger = logging.getLogger(__name__)
 
 
+def timed(category: str, name: str = None):
+    """记录函数耗时的装饰器
+
+    耗时写入指标 "{category}.{name}"，name 默认为函数的限定名 (如 WordService.add_word)；
+    抛出异常时同样记录耗时并计入出错次数。调用期间发出的 SQL 查询计入同名操作
+    (嵌套调用时计入最外层)
+
+    Args:
+        category: 指标类别，如 service、api、http、ui
+        name: 指标名称
+    """
+    def decorator(func):
+        metric = f"{category}.{name or func.__qualname__}"
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                with query_tracer.operation(metric):
+                    result = func(*args, **kwargs)
+            except BaseException:
+                metrics.observe(metric, time.perf_counter() - start, error=True)
+                raise
+            metrics.observe(metric, time.perf_counter() - start)
+            return result
+        return wrapper
+    return decorator
+
+
+def counted(category: str, name: str = None):
+    """记录函数调用次数的装饰器 (用于开销很小、只需计数的函数)
+
+    Args:
+        category: 指标类别
+        name: 指标名称，默认为函数的限定名
+    """
+    def decorator(func):
+        metric = f"{category}.{name or func.__qualname__}"
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            metrics.increment(metric)
+            return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
 def handle_exceptions(func):
     """统一异常处理装饰器"""
     @wraps(func)
@@ -22,7 +77,7 @@ def handle_exceptions(func):
             return func(*args, **kwargs)
         except DatabaseError as e:
             logger.error(f"数据库错误: {e}")
-            if hasattr(args[0], 'root') or (args and hasattr(args[0], 'parent_gui')):
+            if messagebox and args and (hasattr(args[0], 'root') or hasattr(args[0], 'parent_gui')):
                 # GUI环境，显示错误对话框
                 try:
                     root = args[0].root if hasattr(args[0], 'root') else args[0].parent_gui.root
@@ -32,7 +87,7 @@ def handle_exceptions(func):
             return None
         except APIError as e:
             logger.error(f"API错误: {e}")
-            if hasattr(args[0], 'root') or (args and hasattr(args[0], 'parent_gui')):
+            if messagebox and args and (hasattr(args[0], 'root') or hasattr(args[0], 'parent_gui')):
                 try:
                     root = args[0].root if hasattr(args[0], 'root') else args[0].parent_gui.root
                     root.after(0, lambda: messagebox.showwarning("网络错误", "无法连接到词典服务"))
@@ -41,7 +96,7 @@ def handle_exceptions(func):
             return None
         except ValidationError as e:
             logger.warning(f"验证错误: {e}")
-            if hasattr(args[0], 'root') or (args and hasattr(args[0], 'parent_gui')):
+            if messagebox and args and (hasattr(args[0], 'root') or hasattr(args[0], 'parent_gui')):
                 try:
                     root = args[0].root if hasattr(args[0], 'root') else args[0].parent_gui.root
                     root.after(0, lambda: messagebox.showwarning("输入错误", str(e)))
@@ -50,7 +105,7 @@ def handle_exceptions(func):
             return None
         except Exception as e:
             logger.exception(f"未预期的错误: {e}")
-            if hasattr(args[0], 'root') or (args and hasattr(args[0], 'parent_gui')):
+            if messagebox and args and (hasattr(args[0], 'root') or hasattr(args[0], 'parent_gui')):
                 try:
                     root = args[0].root if hasattr(args[0], 'root') else args[0].parent_gui.root
                     root.after(0, lambda: messagebox.showerror("错误", f"发生未知错误: {e}"))
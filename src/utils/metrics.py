@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+性能指标模块
+进程内的耗时直方图和计数器，由 @timed / @counted 装饰器和数据库查询钩子写入
+"""
+
+import json
+import logging
+import math
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict
+
+logger = logging.getLogger(__name__)
+
+# 每个耗时指标保留的最近样本数 (用于计算分位数)
+MAX_SAMPLES = 1024
+
+# 程序退出时保存指标的文件 (项目根目录下的 data/metrics.json)
+METRICS_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                            "data", "metrics.json")
+
+
+class Histogram:
+    """耗时直方图
+
+    累计调用次数、总耗时、最大值和出错次数，
+    分位数根据最近 MAX_SAMPLES 个样本计算
+    """
+
+    def __init__(self, max_samples: int = MAX_SAMPLES):
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._samples = deque(maxlen=max_samples)
+
+    def observe(self, seconds: float, error: bool = False):
+        """记录一次耗时 (调用方需持有锁)"""
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+        if error:
+            self.errors += 1
+        self._samples.append(seconds)
+
+    @staticmethod
+    def _percentile(samples, q: float) -> float:
+        """最近邻秩法计算分位数，samples 须已排序"""
+        if not samples:
+            return 0.0
+        return samples[max(0, math.ceil(q * len(samples)) - 1)]
+
+    def snapshot(self) -> Dict:
+        """导出统计结果，耗时单位为毫秒"""
+        samples = sorted(self._samples)
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'total_ms': self.total * 1000,
+            'avg_ms': self.total / self.count * 1000 if self.count else 0.0,
+            'p50_ms': self._percentile(samples, 0.50) * 1000,
+            'p95_ms': self._percentile(samples, 0.95) * 1000,
+            'p99_ms': self._percentile(samples, 0.99) * 1000,
+            'max_ms': self.max * 1000,
+        }
+
+
+class MetricsRegistry:
+    """性能指标注册表
+
+    指标名按 "类别.名称" 组织，如 service.WordService.add_word、db.query、
+    http.DictionaryAPI.get_word_info、ui.ViewTab.refresh_word_list
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._timers: Dict[str, Histogram] = {}
+        self._counters: Dict[str, int] = {}
+
+    def observe(self, name: str, seconds: float, error: bool = False):
+        """记录一次耗时"""
+        with self._lock:
+            histogram = self._timers.get(name)
+            if histogram is None:
+                histogram = self._timers[name] = Histogram()
+            histogram.observe(seconds, error)
+
+    def increment(self, name: str, amount: int = 1):
+        """计数器加一"""
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    @contextmanager
+    def time(self, name: str):
+        """记录代码块耗时的上下文管理器"""
+        start = time.perf_counter()
+        error = False
+        try:
+            yield
+        except BaseException:
+            error = True
+            raise
+        finally:
+            self.observe(name, time.perf_counter() - start, error)
+
+    def snapshot(self) -> Dict:
+        """导出所有指标
+
+        Returns:
+            {'timers': {名称: 统计}, 'counters': {名称: 次数}}
+        """
+        with self._lock:
+            return {
+                'timers': {name: h.snapshot() for name, h in sorted(self._timers.items())},
+                'counters': dict(sorted(self._counters.items())),
+            }
+
+    def reset(self):
+        """清空所有指标"""
+        with self._lock:
+            self._timers.clear()
+            self._counters.clear()
+
+    def dump(self, path: str = METRICS_FILE):
+        """把当前指标写入 JSON 文件 (如程序退出时)"""
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(self.snapshot(), f, ensure_ascii=False, indent=2)
+        except OSError as e:
+            logger.warning(f"保存性能指标失败: {e}")
+
+
+def load_metrics(path: str = METRICS_FILE) -> Dict:
+    """读取 dump 保存的指标，文件不存在或损坏时返回空字典"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def format_metrics(snapshot: Dict) -> str:
+    """把指标快照格式化为文本表格"""
+    lines = []
+    timers = snapshot.get('timers', {})
+    if timers:
+        width = max(len(name) for name in timers)
+        lines.append(f"{'指标':<{width}}  {'次数':>7}  {'出错':>5}  {'p50(ms)':>9}  "
+                     f"{'p95(ms)':>9}  {'p99(ms)':>9}  {'最大(ms)':>9}")
+        for name, t in timers.items():
+            lines.append(f"{name:<{width}}  {t['count']:>7}  {t['errors']:>5}  {t['p50_ms']:>9.2f}  "
+                         f"{t['p95_ms']:>9.2f}  {t['p99_ms']:>9.2f}  {t['max_ms']:>9.2f}")
+    counters = snapshot.get('counters', {})
+    if counters:
+        if lines:
+            lines.append("")
+        width = max(len(name) for name in counters)
+        lines.append(f"{'计数器':<{width}}  {'次数':>7}")
+        for name, count in counters.items():
+            lines.append(f"{name:<{width}}  {count:>7}")
+    return "\n".join(lines) if lines else "暂无性能数据"
+
+
+# 进程内共享的指标注册表
+metrics = MetricsRegistry()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+启动耗时分析模块
+记录启动过程中各阶段的耗时，供 --profile-startup 输出报告
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import List, Tuple
+
+
+class StartupProfiler:
+    """启动耗时记录器
+
+    未启用时 mark/phase 几乎没有开销；启用后按发生顺序记录
+    (阶段名, 开始时间, 耗时)，时间均相对于本模块首次导入
+    """
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.enabled = False
+        self._records: List[Tuple[str, float, float]] = []
+        self._lock = threading.Lock()
+
+    def enable(self):
+        """开始记录"""
+        self.enabled = True
+
+    def mark(self, label: str):
+        """记录一个时间点"""
+        if self.enabled:
+            with self._lock:
+                self._records.append((label, time.perf_counter() - self.origin, 0.0))
+
+    @contextmanager
+    def phase(self, label: str):
+        """记录一个阶段的耗时"""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            with self._lock:
+                self._records.append((label, start - self.origin, end - start))
+
+    def report(self) -> str:
+        """生成耗时报告"""
+        with self._lock:
+            # 同时开始的嵌套阶段，外层排在前面
+            records = sorted(self._records, key=lambda r: (r[1], -r[2]))
+        lines = ["启动耗时分析:", f"  {'开始(ms)':>10}  {'耗时(ms)':>10}  阶段"]
+        for label, start, duration in records:
+            duration_text = f"{duration * 1000:10.1f}" if duration else f"{'-':>10}"
+            lines.append(f"  {start * 1000:10.1f}  {duration_text}  {label}")
+        return "\n".join(lines)
+
+    def print_report(self):
+        """输出报告到标准输出"""
+        print(self.report())
+
+
+# 进程内共享的启动耗时记录器
+startup_profiler = StartupProfiler()
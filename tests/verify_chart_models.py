@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+验证统计图表数据模型与图表图片缓存 (不依赖图形界面)
+"""
+
+import sys
+import os
+import unittest
+import datetime
+import tempfile
+
+# 添加src目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from gui.chart_cache import ChartImageCache
+from gui.chart_models import build_heatmap_model, build_stats_models, model_digest
+
+
+class FakeWordManager:
+    """返回固定统计数据的单词管理器"""
+
+    def __init__(self):
+        self.daily_stats = {'2024-05-06': {'new': 2, 'review': 3}}
+
+    def get_statistics(self):
+        return {'total_words': 10, 'mastered_words': 4, 'reviewed_words': 6}
+
+    def get_words_for_review(self, limit=100):
+        return ['apple', 'banana']
+
+    def get_recent_activity(self, days=30):
+        return {'daily_stats': dict(self.daily_stats)}
+
+    def get_future_review_stats(self, days=7):
+        return {'2024-05-08': 1, '2024-05-07': 4}
+
+
+class TestChartModels(unittest.TestCase):
+    """验证后台生成的图表模型"""
+
+    def test_models_are_immutable_and_hashable(self):
+        """模型不可修改，相同数据得到相同哈希，数据变化后哈希改变"""
+        manager = FakeWordManager()
+        models = build_stats_models(manager, 30)
+        self.assertEqual(models.review_count, 2)
+        self.assertEqual(models.overview()['total_words'], 10)
+        self.assertEqual(models.forecast.dates, ('2024-05-07', '2024-05-08'))
+        self.assertEqual(models.forecast.counts, (4, 1))
+        with self.assertRaises(AttributeError):
+            models.trend.days = 7
+
+        digest = model_digest(models.trend)
+        self.assertEqual(digest, model_digest(build_stats_models(manager, 30).trend))
+        manager.daily_stats['2024-05-07'] = {'new': 1, 'review': 0}
+        self.assertNotEqual(digest, model_digest(build_stats_models(manager, 30).trend))
+
+    def test_heatmap_layout(self):
+        """热力图按 (星期, 周) 汇总，最后一列是本周"""
+        today = datetime.date(2024, 5, 8)  # 周三
+        activity = {'daily_stats': {'2024-05-06': {'new': 2, 'review': 3}, 'bad-date': {'new': 1}}}
+        model = build_heatmap_model(activity, weeks=4, today=today)
+        self.assertEqual(len(model.data), 7)
+        self.assertEqual(model.data[0], (0, 0, 0, 5))
+        self.assertEqual(sum(sum(row) for row in model.data), 5)
+
+
+class TestChartImageCache(unittest.TestCase):
+    """验证图表图片缓存"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_key_depends_on_theme_and_size(self):
+        """主题或尺寸不同时缓存键不同"""
+        key = ChartImageCache.make_key('trend', 'abc', 'Light', (800, 450))
+        self.assertEqual(key, ChartImageCache.make_key('trend', 'abc', 'Light', (800, 450)))
+        self.assertNotEqual(key, ChartImageCache.make_key('trend', 'abc', 'Dark', (800, 450)))
+        self.assertNotEqual(key, ChartImageCache.make_key('trend', 'abc', 'Light', (900, 450)))
+
+    def test_put_and_evict(self):
+        """保存 PNG 后可以命中，超出数量上限时删除最旧的图片"""
+        from matplotlib.figure import Figure
+
+        cache = ChartImageCache(self.temp_dir.name, max_entries=2)
+        figure = Figure(figsize=(1, 1), dpi=20)
+        figure.add_subplot(111).plot([0, 1], [1, 0])
+        paths = []
+        for i in range(3):
+            paths.append(cache.put(f"key{i}", figure))
+            os.utime(paths[-1], (i + 1, i + 1))
+        self.assertIsNone(cache.get("key0"))
+        self.assertEqual(cache.get("key2"), paths[2])
+        with open(paths[2], 'rb') as f:
+            self.assertEqual(f.read(8), b'\x89PNG\r\n\x1a\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
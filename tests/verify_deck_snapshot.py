@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+验证词库列式快照
+"""
+
+import sys
+import os
+import unittest
+import datetime
+
+# 添加src目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.word_manager import WordManager
+
+
+class TestDeckSnapshot(unittest.TestCase):
+    """验证快照的向量化查询和增量刷新"""
+
+    def setUp(self):
+        self.manager = WordManager(":memory:")
+        self.manager.add_word_direct("apple", "苹果")
+        self.manager.add_word_direct("banana", "香蕉")
+        self.manager.add_word_direct("cherry", "樱桃")
+        self.snapshot = self.manager.deck_snapshot
+
+    def tearDown(self):
+        self.manager.db.close()
+
+    def test_queries(self):
+        """概览、掌握程度直方图、到期预测和分类统计"""
+        self.manager.update_review_status("apple", 5)
+        overview = self.snapshot.overview()
+        self.assertEqual(overview['total_words'], 3)
+        self.assertEqual(overview['reviewed_words'], 1)
+        self.assertEqual(sum(self.snapshot.mastery_histogram()), 3)
+        self.assertEqual(self.snapshot.category_counts(), {"默认": 3})
+        self.assertEqual(self.snapshot.overdue_count(datetime.datetime.now() + datetime.timedelta(seconds=1)), 2)
+
+        due = self.snapshot.due_counts_by_day(7)
+        self.assertEqual(len(due), 7)
+        self.assertEqual(sum(due.values()), 3)
+        self.assertEqual(due[datetime.date.today().isoformat()], 2)
+
+        counts, edges = self.snapshot.ef_distribution(bins=4)
+        self.assertEqual(sum(counts), 3)
+        self.assertEqual(len(edges), 5)
+
+    def test_statistics_do_not_build_snapshot(self):
+        """概览统计不创建快照，第一次需要快照的统计才加载"""
+        manager = WordManager(":memory:")
+        try:
+            manager.add_word_direct("apple", "苹果")
+            overview = manager.get_statistics()
+            self.assertNotIn('deck_snapshot', manager.__dict__)
+            self.assertEqual(manager.stats_service.get_mastery_histogram(), [1, 0, 0, 0, 0, 0])
+            self.assertIn('deck_snapshot', manager.__dict__)
+            self.assertEqual(manager.get_statistics(), overview)
+        finally:
+            manager.db.close()
+
+    def test_incremental_refresh(self):
+        """单词增删改和复习后快照与数据库保持一致"""
+        self.assertEqual(len(self.snapshot), 3)
+        ids_before = self.snapshot.ids.copy()
+
+        self.manager.add_word_direct("date", "枣")
+        self.manager.delete_word("banana")
+        self.manager.update_review_status("cherry", 5)
+        self.manager.update_word("apple", category="水果")
+
+        self.assertEqual(len(self.snapshot), 3)
+        self.assertTrue((self.snapshot.ids[:-1] == ids_before[[0, 2]]).all())
+        self.assertEqual(self.snapshot.category_counts(), {"默认": 2, "水果": 1})
+        metrics = self.manager.get_word_metrics(["cherry", "date", "missing"])
+        self.assertEqual(set(metrics), {"cherry", "date"})
+        self.assertEqual(metrics["cherry"]['review_count'], 1)
+        self.assertEqual(metrics["date"]['review_count'], 0)
+
+        # 与数据库统计一致
+        stats = self.manager.get_statistics()
+        self.assertEqual(stats['total_words'], 3)
+        self.assertEqual(stats['reviewed_words'], 1)
+
+        self.manager.clear_all_words()
+        self.assertEqual(len(self.snapshot), 0)
+        self.assertEqual(self.snapshot.mastery_histogram(), [0] * 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
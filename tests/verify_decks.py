@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+验证按词库划分的存储
+"""
+
+import sys
+import os
+import sqlite3
+import unittest
+import datetime
+import tempfile
+
+# 添加src目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.word_manager import WordManager
+from core.constants import Constants
+
+# 分词库之前的表结构 (只保留迁移涉及的部分)
+LEGACY_SCHEMA = """
+CREATE TABLE words (
+    id INTEGER PRIMARY KEY, word VARCHAR(100) NOT NULL, phonetic VARCHAR(100), meaning TEXT, example TEXT,
+    category VARCHAR(100), added_date DATETIME, last_review DATETIME, next_review DATETIME,
+    review_count INTEGER, mastery_level INTEGER, easiness_factor FLOAT, interval INTEGER);
+CREATE UNIQUE INDEX ix_words_word ON words (word);
+CREATE INDEX ix_words_review_count ON words (review_count);
+CREATE TABLE review_history (
+    id INTEGER PRIMARY KEY, word_id INTEGER NOT NULL REFERENCES words (id), review_date DATETIME, quality INTEGER);
+CREATE INDEX ix_review_history_review_date ON review_history (review_date);
+INSERT INTO words (id, word, meaning, review_count, mastery_level, easiness_factor, interval)
+    VALUES (1, 'apple', '苹果', 1, 4, 2.5, 1);
+INSERT INTO review_history (word_id, review_date, quality) VALUES (1, :today, 4);
+"""
+
+
+class TestDecks(unittest.TestCase):
+    """验证词库之间的数据隔离、共用资源和已有数据库的迁移"""
+
+    def setUp(self):
+        self.manager = WordManager(":memory:")
+        self.other = self.manager.for_deck("alice")
+        self.manager.add_word_direct("apple", "苹果")
+        self.manager.add_word_direct("banana", "香蕉")
+        self.other.add_word_direct("apple", "apple (alice)")
+
+    def tearDown(self):
+        self.manager.db.close()
+
+    def test_words_are_isolated(self):
+        """同一单词可以出现在不同词库中，查询、复习和清空只影响本词库"""
+        self.assertEqual(self.manager.get_word("apple")['meaning'], "苹果")
+        self.assertEqual(self.other.get_word("apple")['meaning'], "apple (alice)")
+        self.assertEqual([w['word'] for w in self.other.get_all_words()], ["apple"])
+        self.assertEqual(self.other.get_words_for_review(), ["apple"])
+
+        self.other.update_review_status("apple", 5)
+        self.assertEqual(self.other.get_statistics()['reviewed_words'], 1)
+        self.assertEqual(self.manager.get_statistics()['reviewed_words'], 0)
+        self.assertEqual(self.manager.get_statistics()['streak_days'], 0)
+
+        self.assertTrue(self.other.clear_all_words())
+        self.assertEqual(self.other.get_all_words(), [])
+        self.assertEqual(len(self.manager.get_all_words()), 2)
+
+    def test_shared_resources(self):
+        """其他词库的管理器共用数据库和语音服务，词库列表包含单词数"""
+        self.assertIs(self.other.db, self.manager.db)
+        self.assertIs(self.other.tts_service, self.manager.tts_service)
+        self.assertNotEqual(self.other.deck_id, self.manager.deck_id)
+        self.assertEqual(self.manager.for_deck("alice").deck_id, self.other.deck_id)
+        decks = {deck['name']: deck['word_count'] for deck in self.manager.list_decks()}
+        self.assertEqual(decks, {Constants.DEFAULT_DECK_NAME: 2, "alice": 1})
+
+    def test_legacy_database_is_migrated(self):
+        """分词库之前的数据库迁移后数据归入默认词库，其他词库可以添加同名单词"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "words.db")
+            conn = sqlite3.connect(path)
+            today = datetime.datetime.now().replace(hour=0, minute=0, second=1)
+            conn.executescript(LEGACY_SCHEMA.replace(":today", today.strftime("'%Y-%m-%d %H:%M:%S.%f'")))
+            conn.close()
+
+            manager = WordManager(path)
+            try:
+                self.assertEqual(manager.get_word("apple")['meaning'], "苹果")
+                stats = manager.get_statistics()
+                self.assertEqual((stats['reviewed_words'], stats['streak_days']), (1, 1))
+                self.assertTrue(manager.for_deck("bob").add_word_direct("apple", "apple (bob)"))
+                self.assertFalse(manager.add_word_direct("apple", "重复"))
+                with manager.db.engine.connect() as conn:
+                    names = set(conn.exec_driver_sql(
+                        "SELECT name FROM sqlite_master WHERE type = 'index'").scalars())
+                    log_rows = conn.exec_driver_sql("SELECT deck_id, word_id, quality FROM review_log").all()
+            finally:
+                manager.db.engine.dispose()
+        self.assertEqual([tuple(row) for row in log_rows], [(Constants.DEFAULT_DECK_ID, 1, 4)])
+        self.assertIn("ix_words_deck_word", names)
+        self.assertNotIn("ix_words_word", names)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+验证词典API层 (离线，不发起网络请求)
+"""
+
+import sys
+import os
+import unittest
+import tempfile
+import json
+import time
+import threading
+import datetime
+from types import SimpleNamespace
+
+# 添加src目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from api.dictionary_api import DictionaryAPI
+from api.buffered_dictionary_api import BufferedDictionaryAPI
+from api.offline_pack import OfflineDictionaryPack, build_pack
+from services.cache_warmer import CacheWarmer
+from core.task_scheduler import get_task_scheduler
+
+SAMPLE_RESPONSE = {
+    "word": "apple",
+    "phonetic": "/ˈæp.əl/",
+    "meanings": [
+        {
+            "partOfSpeech": "noun",
+            "definitions": [
+                {"definition": "A common, round fruit.", "example": "An apple a day."},
+                {"definition": "The tree of this fruit."}
+            ]
+        }
+    ]
+}
+
+
+class FakeTranslator:
+    """记录调用次数的假翻译器"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def translate_to_chinese(self, text):
+        self.calls += 1
+        return f"译:{text}"
+
+
+class FakeDictionaryAPI(DictionaryAPI):
+    """不访问网络的词典API"""
+
+    def __init__(self):
+        super().__init__()
+        self.translation_api = FakeTranslator()
+        self.lookups = 0
+
+    def get_word_info(self, word, translate=False):
+        self.lookups += 1
+        result = self._parse_response(SAMPLE_RESPONSE)
+        if translate:
+            self.translate_meanings(result)
+        return result
+
+
+class TestLazyTranslation(unittest.TestCase):
+    """验证中文释义按需翻译"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.api = BufferedDictionaryAPI(cache_file=os.path.join(self.temp_dir.name, "cache.json"),
+                                         pack_file=os.path.join(self.temp_dir.name, "pack.db"))
+        self.api.dictionary_api = FakeDictionaryAPI()
+        self.api.min_interval = 0
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_parse_does_not_translate(self):
+        """解析响应时不触发翻译"""
+        info = self.api.get_word_info("apple")
+        self.assertEqual(info['meanings'][0]['definition'], "A common, round fruit.")
+        self.assertEqual(info['chinese_meanings'], [])
+        self.assertEqual(self.api.dictionary_api.translation_api.calls, 0)
+
+    def test_translate_on_demand_is_cached(self):
+        """按需翻译的结果写回缓存，再次获取不重复翻译"""
+        info = self.api.get_word_info("apple")
+        chinese = self.api.translate_meanings_async(info).result(timeout=5)
+        self.assertEqual(chinese[0]['definition'], "译:A common, round fruit.")
+
+        calls = self.api.dictionary_api.translation_api.calls
+        again = self.api.get_word_info("apple", translate=True)
+        self.assertEqual(again['chinese_meanings'], chinese)
+        self.assertEqual(self.api.dictionary_api.translation_api.calls, calls)
+        self.assertEqual(self.api.dictionary_api.lookups, 1)
+
+    def test_batch_lookup_runs_in_calling_thread(self):
+        """批量查询在调用线程中依次请求，不创建线程池"""
+        threads = []
+        fetch = self.api.dictionary_api.get_word_info
+        self.api.dictionary_api.get_word_info = lambda word, translate=False: (
+            threads.append(threading.get_ident()) or fetch(word, translate))
+        self.assertEqual(len(self.api.get_words_info(["apple", "pear", "plum"])), 3)
+        self.assertEqual(threads, [threading.get_ident()] * 3)
+        # 等待后台的缓存写盘完成再清理临时目录
+        while get_task_scheduler().pending('io'):
+            time.sleep(0.01)
+
+
+class TestOfflinePack(unittest.TestCase):
+    """验证离线词典包"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_file = os.path.join(self.temp_dir.name, "cache.json")
+        self.pack_file = os.path.join(self.temp_dir.name, "pack.db")
+        entry = FakeDictionaryAPI()._parse_response(SAMPLE_RESPONSE)
+        with open(self.cache_file, 'w', encoding='utf-8') as f:
+            json.dump({"apple": {"data": entry, "last_accessed": 0}}, f)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_build_and_lookup(self):
+        """编译后可以按单词查询"""
+        self.assertEqual(build_pack([self.cache_file], self.pack_file), 1)
+        pack = OfflineDictionaryPack.open(self.pack_file)
+        self.assertIn("Apple", pack)
+        self.assertEqual(pack.get("apple")['phonetic'], "/ˈæp.əl/")
+        self.assertIsNone(pack.get("banana"))
+        pack.close()
+
+    def test_buffered_api_prefers_pack(self):
+        """缓冲API在访问网络前先查询离线词典包"""
+        build_pack([self.cache_file], self.pack_file)
+        api = BufferedDictionaryAPI(cache_file=os.path.join(self.temp_dir.name, "empty.json"),
+                                    pack_file=self.pack_file)
+        api.dictionary_api = FakeDictionaryAPI()
+        info = api.get_word_info("apple")
+        self.assertEqual(info['word'], "apple")
+        self.assertEqual(api.dictionary_api.lookups, 0)
+        self.assertEqual(api.get_cache_stats()['pack_hits'], 1)
+        api.offline_pack.close()
+
+
+class TestCacheWarmer(unittest.TestCase):
+    """验证按复习队列预热缓存"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.api = BufferedDictionaryAPI(cache_file=os.path.join(self.temp_dir.name, "cache.json"),
+                                         pack_file=os.path.join(self.temp_dir.name, "pack.db"))
+        self.api.dictionary_api = FakeDictionaryAPI()
+        self.api.min_interval = 0
+        now = datetime.datetime.now()
+        upcoming = [
+            {'word': "due", 'next_review': now - datetime.timedelta(hours=1)},
+            {'word': "later", 'next_review': now + datetime.timedelta(days=1)},
+        ]
+        self.word_manager = SimpleNamespace(
+            review_service=SimpleNamespace(get_upcoming_review_words=lambda days, limit=None: upcoming[:limit]),
+            dict_service=SimpleNamespace(sample_new_words=lambda level, count: ["vocab"])
+        )
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_priority_order_and_progress(self):
+        """到期单词先于词汇级别单词预热，完成后进度归零"""
+        warmer = CacheWarmer(self.api, self.word_manager, idle_seconds=0)
+        warmer.enqueue(["vocab2"], 2)
+        warmer.schedule()
+        self.assertEqual([item[2] for item in sorted(warmer._queue.queue)], ["due", "later", "vocab2", "vocab"])
+
+        warmer.start()
+        deadline = time.time() + 5
+        while warmer.get_progress()['pending'] and time.time() < deadline:
+            time.sleep(0.05)
+        warmer.stop()
+        progress = warmer.get_progress()
+        self.assertEqual(progress['fetched'], 4)
+        self.assertTrue(self.api.is_cached("due"))
+
+    def test_schedule_is_capped_by_cache_size(self):
+        """排队的复习单词不超过缓存容量，按到期顺序保留"""
+        self.api.max_cache_size = 1
+        warmer = CacheWarmer(self.api, self.word_manager, idle_seconds=0)
+        warmer.schedule()
+        self.assertEqual([item[2] for item in sorted(warmer._queue.queue)], ["due"])
+
+    def test_pauses_during_foreground_lookups(self):
+        """前台查询后暂停预热"""
+        warmer = CacheWarmer(self.api, self.word_manager, idle_seconds=60)
+        self.api.get_word_info("apple")
+        warmer.schedule()
+        warmer.start()
+        time.sleep(0.3)
+        warmer.stop()
+        progress = warmer.get_progress()
+        self.assertTrue(progress['paused'])
+        self.assertEqual(progress['done'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+验证启动时的模块导入 (解析 python -X importtime 的输出)
+防止 matplotlib、numpy 和非首页标签页重新出现在启动路径上
+"""
+
+import sys
+import os
+import subprocess
+import unittest
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+
+# 启动时不应导入的模块 (首次切换到对应标签页时才导入)
+DEFERRED_MODULES = [
+    'matplotlib',
+    'numpy',
+    'gui.tabs.add_tab',
+    'gui.tabs.view_tab',
+    'gui.tabs.review_tab',
+    'gui.tabs.search_tab',
+    'gui.tabs.stats_tab',
+    'gui.tabs.settings_tab',
+]
+
+
+def import_times(statement):
+    """在子进程中执行导入语句，返回 {模块名: 累计耗时(微秒)}"""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement],
+                            cwd=SRC_DIR, capture_output=True, text=True, timeout=120)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    times = {}
+    for line in result.stderr.splitlines():
+        # 格式: "import time: self [us] | cumulative | imported package"
+        if not line.startswith('import time:'):
+            continue
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        times[parts[2].strip()] = int(parts[1])
+    return times
+
+
+class TestStartupImports(unittest.TestCase):
+    """验证主窗口模块的导入开销"""
+
+    def test_main_window_defers_heavy_modules(self):
+        """导入主窗口时不加载 matplotlib、numpy 和其余标签页"""
+        try:
+            times = import_times('import gui.main_window')
+        except RuntimeError as e:
+            self.skipTest(f"无法导入图形界面模块: {e}")
+        self.assertIn('gui.tabs.home_tab', times)
+        loaded = [name for name in DEFERRED_MODULES if name in times]
+        self.assertEqual(loaded, [])
+
+    def test_tab_package_is_lazy(self):
+        """通过 gui.tabs 访问标签页类时才导入对应模块"""
+        # importlib.import_module 的导入不会出现在 importtime 输出中，这里直接检查 sys.modules
+        statement = ("import sys, gui.tabs; gui.tabs.SearchTab; "
+                     "print(' '.join(m for m in sys.modules if m.startswith('gui.tabs.')))")
+        result = subprocess.run([sys.executable, '-c', statement],
+                                cwd=SRC_DIR, capture_output=True, text=True, timeout=120)
+        if result.returncode != 0:
+            self.skipTest(f"无法导入图形界面模块: {result.stderr.strip().splitlines()[-1]}")
+        loaded = result.stdout.split()
+        self.assertIn('gui.tabs.search_tab', loaded)
+        self.assertNotIn('gui.tabs.stats_tab', loaded)
+
+
+if __name__ == '__main__':
+    unittest.main()
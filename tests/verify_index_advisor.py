@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+验证索引顾问和按查询形状建立的索引
+"""
+
+import sys
+import os
+import unittest
+import datetime
+import tempfile
+
+# 添加src目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.word_manager import WordManager
+from core.database import Database
+from core.models import Word
+from core.index_advisor import advise, plan_warnings, format_report
+
+
+class TestIndexAdvisor(unittest.TestCase):
+    """验证查询计划分析、索引补建和改写后的统计查询"""
+
+    def setUp(self):
+        self.manager = WordManager(":memory:")
+        for word in ("apple", "banana", "cherry"):
+            self.manager.add_word_direct(word, "释义")
+        self.manager.update_review_status("apple", 4)
+
+    def tearDown(self):
+        self.manager.db.close()
+
+    def test_plan_warnings(self):
+        """带条件的全表扫描和临时排序会被标出，不带条件的全表读取不算"""
+        self.assertEqual(len(plan_warnings(["SCAN words"])), 1)
+        self.assertEqual(plan_warnings(["SCAN words"], filtered=False), [])
+        self.assertEqual(plan_warnings(["SCAN words USING COVERING INDEX ix_words_word"]), [])
+        self.assertEqual(len(plan_warnings(["SEARCH words USING INDEX ix", "USE TEMP B-TREE FOR GROUP BY"])), 1)
+
+    def test_grouped_queries_use_expression_indexes(self):
+        """按天分组的统计查询走表达式索引，不再使用临时B树"""
+        report = advise(self.manager)
+        self.assertIn("共分析", format_report(report))
+        grouped = [item for item in report if "date(" in item['statement']]
+        self.assertTrue(grouped)
+        for item in grouped:
+            self.assertEqual(item['warnings'], [], item['statement'])
+
+    def test_existing_database_gains_indexes(self):
+        """已有数据库缺少的索引在初始化时补建"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "words.db")
+            db = Database(path)
+            with db.engine.begin() as conn:
+                conn.exec_driver_sql("DROP INDEX ix_review_history_deck_day")
+            db.engine.dispose()
+
+            db = Database(path)
+            with db.engine.connect() as conn:
+                names = set(conn.exec_driver_sql(
+                    "SELECT name FROM sqlite_master WHERE type = 'index'").scalars())
+            db.engine.dispose()
+        self.assertIn("ix_review_history_deck_day", names)
+
+    def test_future_review_stats_include_last_day(self):
+        """复习量预估包含最后一天到期的单词"""
+        last_day = datetime.date.today() + datetime.timedelta(days=6)
+        session = self.manager.db.get_session()
+        try:
+            word = session.query(Word).filter_by(word="banana").one()
+            word.next_review = datetime.datetime.combine(last_day, datetime.time(12))
+            session.commit()
+        finally:
+            session.close()
+        stats = self.manager.get_future_review_stats(7)
+        self.assertEqual(len(stats), 7)
+        self.assertEqual(stats[last_day.isoformat()], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+验证性能监控装饰器与指标注册表
+"""
+
+import sys
+import os
+import unittest
+import tempfile
+
+# 添加src目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.decorators import timed, counted
+from utils.metrics import Histogram, metrics, load_metrics, format_metrics
+from core.word_manager import WordManager
+from core.query_trace import QueryTracer, statement_shape
+from sqlalchemy import create_engine, text
+
+
+class TestMetrics(unittest.TestCase):
+    """验证耗时直方图、计数器和各层的埋点"""
+
+    def setUp(self):
+        metrics.reset()
+
+    def test_percentiles(self):
+        """分位数按最近邻秩法计算"""
+        histogram = Histogram()
+        for ms in range(1, 101):
+            histogram.observe(ms / 1000)
+        snapshot = histogram.snapshot()
+        self.assertEqual(snapshot['count'], 100)
+        self.assertAlmostEqual(snapshot['p50_ms'], 50)
+        self.assertAlmostEqual(snapshot['p95_ms'], 95)
+        self.assertAlmostEqual(snapshot['p99_ms'], 99)
+        self.assertAlmostEqual(snapshot['max_ms'], 100)
+
+    def test_decorators(self):
+        """timed 记录耗时和出错次数，counted 只计数"""
+        class Service:
+            @timed("service")
+            def work(self, fail=False):
+                if fail:
+                    raise ValueError("boom")
+                return 1
+
+            @counted("service")
+            def ping(self):
+                return "pong"
+
+        service = Service()
+        service.work()
+        with self.assertRaises(ValueError):
+            service.work(fail=True)
+        service.ping()
+        service.ping()
+
+        snapshot = metrics.snapshot()
+        timer = snapshot['timers']['service.TestMetrics.test_decorators.<locals>.Service.work']
+        self.assertEqual((timer['count'], timer['errors']), (2, 1))
+        self.assertEqual(snapshot['counters']['service.TestMetrics.test_decorators.<locals>.Service.ping'], 2)
+        self.assertIn('p95(ms)', format_metrics(snapshot))
+
+    def test_services_and_queries_instrumented(self):
+        """服务调用和数据库查询都会写入指标，指标可以保存后读回"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = WordManager(db_path=os.path.join(temp_dir, "words.db"))
+            manager.add_word_direct("apple", "苹果")
+            manager.get_statistics()
+            manager.db.engine.dispose()
+
+            snapshot = metrics.snapshot()
+            self.assertIn('service.WordService.add_word', snapshot['timers'])
+            self.assertIn('service.StatsService.get_overview_stats', snapshot['timers'])
+            self.assertGreater(snapshot['timers']['db.query']['count'], 0)
+
+            path = os.path.join(temp_dir, "metrics.json")
+            metrics.dump(path)
+            self.assertEqual(load_metrics(path)['timers'].keys(), snapshot['timers'].keys())
+
+
+class TestQueryTrace(unittest.TestCase):
+    """验证 SQL 查询追踪"""
+
+    def setUp(self):
+        self.engine = create_engine('sqlite://')
+        self.tracer = QueryTracer(slow_query_ms=60000, n_plus_one_threshold=5)
+        self.tracer.install(self.engine)
+
+    def tearDown(self):
+        self.engine.dispose()
+
+    def test_statement_shape(self):
+        """字面量和 IN 列表归一化后得到相同的语句形状"""
+        self.assertEqual(statement_shape("SELECT * FROM words\n WHERE id IN (?, ?, ?) AND word = 'a'"),
+                         statement_shape("SELECT * FROM words WHERE id IN (?) AND word = 'bb'"))
+        self.assertEqual(statement_shape("SELECT 1 LIMIT 10"), "SELECT ? LIMIT ?")
+
+    def test_operation_counts_and_n_plus_one(self):
+        """按操作统计查询数，循环执行同一语句时警告"""
+        with self.assertLogs('core.query_trace', level='WARNING') as logs:
+            with self.tracer.operation("ui.refresh"):
+                with self.engine.connect() as conn:
+                    for i in range(6):
+                        conn.execute(text("SELECT :i"), {"i": i})
+        self.assertEqual(len(logs.records), 1)
+        self.assertIn("ui.refresh", logs.output[0])
+
+        snapshot = self.tracer.snapshot()
+        self.assertEqual(snapshot['operations']['ui.refresh']['queries'], 6)
+        self.assertEqual(snapshot['operations']['ui.refresh']['calls'], 1)
+        self.assertEqual(snapshot['statements'][0]['count'], 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+验证数据库迁移
+"""
+
+import sys
+import os
+import unittest
+import tempfile
+
+# 添加src目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.database import Database
+from core import migrations
+from core.migrations import Migration, run_migrations, applied_versions
+
+
+class TestMigrations(unittest.TestCase):
+    """验证迁移的版本记录、加列、分批回填和中断后重跑"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "words.db")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _open(self, **kwargs):
+        db = Database(self.path, **kwargs)
+        self.addCleanup(db.engine.dispose)
+        return db
+
+    def test_new_database_is_up_to_date(self):
+        """新数据库打开后所有迁移都已记录"""
+        db = self._open()
+        self.assertEqual(applied_versions(db), [m.version for m in migrations.MIGRATIONS])
+        self.assertEqual(migrations.pending_migrations(db), [])
+
+    def test_existing_history_is_backfilled(self):
+        """升级前的数据库打开时 review_history 回填到复习日志"""
+        db = self._open(migrate=False)
+        with db.engine.begin() as conn:
+            conn.exec_driver_sql("INSERT INTO words (id, word) VALUES (1, 'apple')")
+            conn.exec_driver_sql(
+                "INSERT INTO review_history (word_id, review_date, quality) VALUES "
+                "(1, '2024-05-01 10:00:00.000000', 4), (1, '2024-05-02 10:00:00.000000', 5)")
+        db.engine.dispose()
+
+        db = self._open()
+        with db.engine.connect() as conn:
+            self.assertEqual(conn.exec_driver_sql("SELECT COUNT(*) FROM review_log").scalar(), 2)
+
+    def test_add_column_and_batched_backfill(self):
+        """加列可重复执行，回填按批提交并报告进度"""
+        db = self._open()
+        with db.engine.begin() as conn:
+            for i in range(1, 8):
+                conn.exec_driver_sql("INSERT INTO words (id, word) VALUES (?, ?)", (i, f"w{i}"))
+
+        def upgrade(ctx):
+            ctx.add_column("words", "flag", "INTEGER NOT NULL DEFAULT 0")
+            ctx.add_column("words", "flag", "INTEGER NOT NULL DEFAULT 0")
+            ctx.backfill("words", "UPDATE words SET flag = 1 WHERE rowid > ? AND rowid <= ?")
+
+        progress = []
+        extra = migrations.MIGRATIONS + [Migration(1000, "add_flag", upgrade)]
+        executed = run_migrations(db, extra, batch_size=3, progress=lambda *args: progress.append(args))
+        self.assertEqual(executed, [1000])
+        self.assertEqual(progress, [("add_flag", 3, 7), ("add_flag", 6, 7), ("add_flag", 7, 7)])
+        with db.engine.connect() as conn:
+            self.assertEqual(conn.exec_driver_sql("SELECT SUM(flag) FROM words").scalar(), 7)
+        self.assertEqual(run_migrations(db, extra), [])
+
+    def test_failed_migration_is_retried(self):
+        """迁移失败时不记录版本，下次重新执行"""
+        db = self._open()
+        calls = []
+
+        def upgrade(ctx):
+            calls.append(1)
+            if len(calls) == 1:
+                raise RuntimeError("中断")
+
+        extra = [Migration(1000, "flaky", upgrade)]
+        with self.assertRaises(RuntimeError):
+            run_migrations(db, extra)
+        self.assertNotIn(1000, applied_versions(db))
+        self.assertEqual(run_migrations(db, extra), [1000])
+        self.assertEqual(len(calls), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
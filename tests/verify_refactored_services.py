@@ -14,6 +14,7 @@ import datetime
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from core.word_manager import WordManager
+from core.word_rows import EXPORT_COLUMNS
 
 class TestRefactoredServices(unittest.TestCase):
     """验证服务层重构后的功能"""
@@ -51,6 +52,25 @@ class TestRefactoredServices(unittest.TestCase):
         all_words = self.manager.get_all_words()
         self.assertEqual(len(all_words), 1)
 
+    def test_list_rows(self):
+        """测试列表视图的轻量级行记录"""
+        rows = self.manager.list_word_rows()
+        self.assertEqual(sorted(row.word for row in rows), ["apple", "banana"])
+        row = rows[0]
+        self.assertIsInstance(row.added_date, datetime.datetime)
+        self.assertEqual(row.date('added_date'), row.added_date.strftime("%Y-%m-%d"))
+        self.assertEqual(row.to_dict()['added_date'], self.manager.get_word(row.word)['added_date'])
+        
+        # 只查询指定的列，并可按关键词过滤
+        rows = self.manager.list_word_rows(("word", "meaning"), keyword="香蕉")
+        self.assertEqual([tuple(r) for r in rows], [("banana", "香蕉")])
+        with self.assertRaises(ValueError):
+            self.manager.list_word_rows(("word", "no_such_column"))
+
+        # 导出的列与完整的单词记录一致
+        row = self.manager.list_word_rows(EXPORT_COLUMNS, keyword="apple")[0]
+        self.assertEqual(row.to_dict(), self.manager.get_word("apple"))
+
     def test_review_service(self):
         """测试 ReviewService 功能"""
         # 获取待复习列表 (初始都应该在列表里)
@@ -90,6 +110,32 @@ class TestRefactoredServices(unittest.TestCase):
         except Exception as e:
             self.fail(f"TTS Service failed: {e}")
 
+    def test_lazy_services(self):
+        """服务按需创建，且只创建一次"""
+        manager = WordManager(":memory:")
+        self.assertNotIn('db', manager.__dict__)
+        self.assertIs(manager.review_service, manager.review_service)
+        self.assertIn('db', manager.__dict__)
+        self.assertNotIn('dict_service', manager.__dict__)
+        self.assertNotIn('tts_service', manager.__dict__)
+        self.assertIs(manager.dictionary_api, manager.dict_service.dictionary_api)
+        manager.db.close()
+
+    def test_deck_vocabulary_sync(self):
+        """测试随机选词的词库成员位图随单词增删同步"""
+        self.manager.dict_service.sample_new_words("cet4", 1)
+        deck = self.manager.dict_service._deck_vocabulary
+        self.assertIn("apple", deck)
+        
+        self.manager.add_word_direct("ability", "能力")
+        self.assertIn("ability", deck)
+        
+        self.manager.delete_word("apple")
+        self.assertNotIn("apple", deck)
+        
+        self.manager.clear_all_words()
+        self.assertEqual(len(deck), 0)
+
     def test_clear_all(self):
         """测试清空功能"""
         self.manager.clear_all_words()
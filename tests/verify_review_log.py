@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+验证紧凑复习日志
+"""
+
+import sys
+import os
+import unittest
+import datetime
+from unittest import mock
+
+# 添加src目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.word_manager import WordManager
+from core.constants import Constants
+from core.models import Word
+from core import review_log
+
+
+class TestReviewLog(unittest.TestCase):
+    """验证复习日志的双写、迁移、扫描和压缩"""
+
+    def setUp(self):
+        self.manager = WordManager(":memory:")
+        for word in ("apple", "banana", "cherry"):
+            self.manager.add_word_direct(word, "释义")
+        self.db = self.manager.db
+
+    def tearDown(self):
+        self.db.close()
+
+    def _log_rows(self):
+        return [row for batch in review_log.scan(self.db, Constants.DEFAULT_DECK_ID, batch_size=2) for row in batch]
+
+    def test_dual_write_and_migration(self):
+        """复习时同时写入两张表，迁移可重复执行且不产生重复记录"""
+        self.manager.update_review_status("apple", 4)
+        self.manager.update_review_status("banana", 2)
+        self.assertEqual(len(self._log_rows()), 2)
+
+        with self.db.engine.begin() as conn:
+            conn.exec_driver_sql("DELETE FROM review_log")
+        self.assertEqual(review_log.migrate_from_history(self.db, batch_size=1), 2)
+        self.assertEqual(review_log.migrate_from_history(self.db), 0)
+
+        self.manager.update_review_status("cherry", 5)
+        self.assertEqual(review_log.migrate_from_history(self.db), 0)
+        rows = self._log_rows()
+        self.assertEqual([quality for _, _, quality in rows], [4, 2, 5])
+        self.assertEqual(rows, sorted(rows))
+        self.assertEqual(review_log.day_of(rows[0][0]), datetime.date.today())
+
+    def test_stats_from_log(self):
+        """统计从复习日志读取时结果与 review_history 一致"""
+        self.manager.update_review_status("apple", 4)
+        self.manager.update_review_status("banana", 3)
+        with mock.patch.object(Constants, 'COMPACT_REVIEW_LOG', False):
+            expected = self.manager.get_recent_activity(7)
+            expected_stats = self.manager.get_statistics()
+        with mock.patch.object(Constants, 'COMPACT_REVIEW_LOG', True):
+            self.assertEqual(self.manager.get_recent_activity(7), expected)
+            self.assertEqual(self.manager.get_statistics()['streak_days'], expected_stats['streak_days'])
+
+    def test_delete_word_removes_log(self):
+        """删除单词时日志一并删除，重用其 id 的新单词不会继承复习记录"""
+        self.manager.add_word_direct("pear", "梨")
+        self.manager.update_review_status("pear", 4)
+        self.manager.update_review_status("pear", 5)
+        self.manager.delete_word("pear")
+        self.assertEqual(self._log_rows(), [])
+
+        self.manager.add_word_direct("kiwi", "猕猴桃")
+        with mock.patch.object(Constants, 'COMPACT_REVIEW_LOG', True):
+            self.assertEqual(self.manager.get_recent_activity(1)['daily_stats'][
+                datetime.date.today().isoformat()]['review'], 0)
+            self.assertEqual(self.manager.get_statistics()['streak_days'], 0)
+
+    def test_compact(self):
+        """压缩时按词库和单词删除旧版本留下的无效记录，清空词库时日志一并清空"""
+        self.manager.update_review_status("banana", 4)
+        session = self.db.get_session()
+        try:
+            review_log.append(session, Constants.DEFAULT_DECK_ID, 999, 3)
+            # 单词 id 存在但属于其他词库
+            banana_id = session.query(Word.id).filter_by(word="banana").scalar()
+            review_log.append(session, Constants.DEFAULT_DECK_ID + 1, banana_id, 3)
+            session.commit()
+        finally:
+            session.close()
+        self.assertEqual(review_log.compact(self.db), 2)
+        self.assertEqual(len(self._log_rows()), 1)
+
+        self.manager.clear_all_words()
+        self.assertEqual(self._log_rows(), [])
+
+if __name__ == '__main__':
+    unittest.main()
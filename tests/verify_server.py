@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+验证本地 HTTP 服务
+"""
+
+import sys
+import os
+import unittest
+import tempfile
+
+# 添加src目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+try:
+    from starlette.testclient import TestClient
+    from server.app import create_app, DECK_HEADER
+    SERVER_AVAILABLE = True
+except ImportError:
+    SERVER_AVAILABLE = False
+
+from utils.metrics import metrics
+
+
+@unittest.skipUnless(SERVER_AVAILABLE, "需要安装 starlette 和 httpx")
+class TestServer(unittest.TestCase):
+    """验证 JSON 接口、词库隔离和请求指标"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.client = TestClient(create_app(os.path.join(self.tmp.name, "words.db"), db_workers=2))
+        self.client.__enter__()
+        self.client.post("/words", json={"word": "Apple", "meaning": "苹果"})
+        self.client.post("/words", json={"word": "banana", "meaning": "香蕉"})
+
+    def tearDown(self):
+        self.client.__exit__(None, None, None)
+        self.tmp.cleanup()
+
+    def test_words_and_review(self):
+        """添加、查询、复习和统计"""
+        self.assertEqual(self.client.post("/words", json={"word": "apple", "meaning": "重复"}).status_code, 409)
+        self.assertEqual(self.client.get("/words/apple").json()["meaning"], "苹果")
+        self.assertEqual(self.client.get("/words/cherry").status_code, 404)
+        words = self.client.get("/words", params={"keyword": "香", "columns": "word,meaning"}).json()["words"]
+        self.assertEqual(words, [{"word": "banana", "meaning": "香蕉"}])
+
+        self.assertEqual(sorted(self.client.get("/review").json()["words"]), ["apple", "banana"])
+        self.assertEqual(self.client.post("/review", json={"word": "apple", "quality": 5}).status_code, 200)
+        stats = self.client.get("/stats").json()
+        self.assertEqual((stats["total_words"], stats["reviewed_words"]), (2, 1))
+        self.assertEqual(len(self.client.get("/stats/forecast", params={"days": 3}).json()), 3)
+
+        self.assertEqual(self.client.delete("/words/banana").status_code, 200)
+        self.assertEqual(self.client.delete("/words/banana").status_code, 404)
+
+    def test_validation(self):
+        """无效的参数返回 400"""
+        self.assertEqual(self.client.post("/review", json={"word": "apple", "quality": 9}).status_code, 400)
+        self.assertEqual(self.client.post("/review", json={"word": "apple", "quality": True}).status_code, 400)
+        self.assertEqual(self.client.post("/words", content=b"not json").status_code, 400)
+        self.assertEqual(self.client.get("/review", params={"limit": "x"}).status_code, 400)
+        self.assertEqual(self.client.get("/words", params={"columns": "password"}).status_code, 400)
+
+    def test_decks_and_metrics(self):
+        """请求头指定词库时数据相互隔离，词库只在添加单词时创建，请求耗时和状态码写入指标"""
+        alice = {DECK_HEADER: "alice"}
+        self.assertEqual(self.client.get("/words", headers=alice).status_code, 404)
+        self.assertEqual(self.client.get("/stats", headers={DECK_HEADER: "mallory"}).status_code, 404)
+        self.assertEqual(self.client.post("/words", json={"word": "apple", "meaning": "apple"}, headers=alice)
+                         .status_code, 201)
+        self.assertEqual(self.client.get("/words", headers=alice).json()["words"][0]["word"], "apple")
+        decks = {deck["name"]: deck["word_count"] for deck in self.client.get("/decks").json()["decks"]}
+        self.assertEqual(decks, {"default": 2, "alice": 1})
+
+        snapshot = self.client.get("/metrics").json()["metrics"]
+        self.assertIn("request.words.add", snapshot["timers"])
+        self.assertIn("server.db_queue_wait", snapshot["timers"])
+        self.assertGreater(metrics.snapshot()["counters"].get("request.status.201", 0), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
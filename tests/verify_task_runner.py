@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+验证后台任务调度器与界面异步任务执行器 (不依赖图形界面)
+"""
+
+import sys
+import os
+import unittest
+import threading
+import time
+
+# 添加src目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.exceptions import TaskRejectedError
+from core.task_scheduler import TaskScheduler
+from gui.task_runner import TkTaskRunner
+
+
+class FakeRoot:
+    """模拟 Tk 根窗口的 after 调度，记录回调所在线程"""
+
+    def __init__(self):
+        self.callbacks = []
+
+    def after(self, ms, func):
+        self.callbacks.append(func)
+
+    def pump(self, timeout=5):
+        """像主循环一样执行排队的回调，直到没有待执行的回调"""
+        deadline = time.time() + timeout
+        while self.callbacks and time.time() < deadline:
+            callbacks, self.callbacks = self.callbacks, []
+            for func in callbacks:
+                func()
+            time.sleep(0.01)
+
+
+class FakeOwner:
+    """模拟可被销毁的控件"""
+
+    def __init__(self):
+        self.exists = True
+
+    def bind(self, sequence, func, add=None):
+        pass
+
+    def winfo_exists(self):
+        return self.exists
+
+
+class TestTkTaskRunner(unittest.TestCase):
+    """验证结果交回主线程、进度回调、取消与排队上限"""
+
+    def setUp(self):
+        self.root = FakeRoot()
+        self.scheduler = TaskScheduler({'network': (2, 8), 'io': (1, 1)})
+        self.runner = TkTaskRunner(self.root, self.scheduler)
+
+    def tearDown(self):
+        self.runner.shutdown()
+        self.scheduler.shutdown()
+
+    def test_callbacks_on_main_thread(self):
+        """成功、失败和进度回调都在调用 pump 的线程中执行"""
+        events = []
+        main_thread = threading.current_thread()
+
+        def work(x, progress):
+            progress("half")
+            return x * 2
+
+        def fail():
+            raise ValueError("boom")
+
+        self.runner.submit(work, 21, on_success=lambda r: events.append(('ok', r, threading.current_thread())),
+                           on_progress=lambda p: events.append(('progress', p, threading.current_thread())))
+        self.runner.submit(fail, on_error=lambda e: events.append(('error', str(e), threading.current_thread())))
+        self.root.pump()
+
+        self.assertIn(('ok', 42, main_thread), events)
+        self.assertIn(('progress', "half", main_thread), events)
+        self.assertIn(('error', "boom", main_thread), events)
+        self.assertLess(events.index(('progress', "half", main_thread)), events.index(('ok', 42, main_thread)))
+        self.assertEqual(self.runner.pending_count(), 0)
+
+    def test_cancel_when_owner_destroyed(self):
+        """所属控件销毁后不再回调"""
+        owner = FakeOwner()
+        release = threading.Event()
+        results = []
+        self.runner.submit(release.wait, 5, on_success=results.append, owner=owner)
+        owner.exists = False
+        release.set()
+        self.root.pump()
+        self.assertEqual(results, [])
+        self.assertEqual(self.runner.pending_count(), 0)
+
+    def test_explicit_cancel(self):
+        """取消的任务不回调，也不会残留在待完成计数中"""
+        release = threading.Event()
+        results = []
+        blockers = [self.runner.submit(release.wait, 5) for _ in range(2)]
+        handle = self.runner.submit(lambda: "late", on_success=results.append)
+        handle.cancel()
+        release.set()
+        self.root.pump()
+        self.assertEqual(results, [])
+        self.assertTrue(all(b.done() for b in blockers))
+        self.assertEqual(self.runner.pending_count(), 0)
+
+    def test_backpressure(self):
+        """队列已满时拒绝新任务，并通过 on_error 通知"""
+        release = threading.Event()
+        errors = []
+        self.runner.submit(release.wait, 5, queue_name='io')
+        self.runner.submit(lambda: None, queue_name='io', on_error=errors.append)
+        with self.assertRaises(TaskRejectedError):
+            self.scheduler.submit('io', lambda: None)
+        release.set()
+        self.root.pump()
+        self.assertEqual(len(errors), 1)
+        self.assertIsInstance(errors[0], TaskRejectedError)
+        self.assertEqual(self.scheduler.get_stats()['io']['rejected'], 2)
+        self.assertEqual(self.scheduler.pending('io'), 0)
+        self.assertEqual(self.runner.pending_count(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
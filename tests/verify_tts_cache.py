@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+验证语音缓存与 TTS 引擎延迟初始化 (不依赖声卡和 TTS 引擎)
+"""
+
+import sys
+import os
+import unittest
+import tempfile
+import time
+
+# 添加src目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from services.tts_cache import TTSAudioCache
+from services.tts_service import StubTTSEngine, TTSService
+
+
+class FakeEngine:
+    """把文本写入文件的假 TTS 引擎"""
+
+    def __init__(self):
+        self.renders = 0
+        self._pending = None
+
+    def save_to_file(self, text, path):
+        self._pending = (text, path)
+
+    def runAndWait(self):
+        text, path = self._pending
+        with open(path, 'wb') as f:
+            f.write(text.encode('utf-8') * 100)
+        self.renders += 1
+
+
+class TestTTSAudioCache(unittest.TestCase):
+    """验证内容寻址与容量淘汰"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _write(self, cache, key, size):
+        path = cache.path_for(key)
+        with open(path, 'wb') as f:
+            f.write(b'x' * size)
+        cache.add(path)
+        return path
+
+    def test_key_ignores_case_and_whitespace(self):
+        """同一单词不同大小写得到相同的缓存键"""
+        self.assertEqual(TTSAudioCache.make_key(" Apple", "v", 150), TTSAudioCache.make_key("apple", "v", 150))
+        self.assertNotEqual(TTSAudioCache.make_key("apple", "v", 150), TTSAudioCache.make_key("apple", "v", 200))
+
+    def test_evicts_least_recently_played(self):
+        """超出容量时先删除最久未播放的文件"""
+        cache = TTSAudioCache(self.temp_dir.name, max_bytes=250)
+        old = self._write(cache, TTSAudioCache.make_key("old"), 100)
+        recent = self._write(cache, TTSAudioCache.make_key("recent"), 100)
+        os.utime(old, (time.time() - 100, time.time() - 100))
+        os.utime(recent, (time.time() - 50, time.time() - 50))
+        self.assertEqual(cache.get(TTSAudioCache.make_key("recent")), recent)
+
+        self._write(cache, TTSAudioCache.make_key("new"), 100)
+        self.assertFalse(os.path.exists(old))
+        self.assertTrue(os.path.exists(recent))
+        self.assertEqual(cache.total_bytes(), 200)
+
+    def test_service_renders_once(self):
+        """同一单词只合成一次，之后复用缓存文件"""
+        service = TTSService(cache_dir=self.temp_dir.name)
+        service._engine = FakeEngine()
+        first = service._get_audio("apple")
+        second = service._get_audio("Apple")
+        self.assertEqual(first, second)
+        self.assertTrue(first.endswith(".wav"))
+        self.assertEqual(service._engine.renders, 1)
+
+    def test_lazy_stub_backend(self):
+        """创建服务时不初始化引擎，stub 后端预热后得到静音引擎"""
+        service = TTSService(cache_dir=self.temp_dir.name, backend="stub")
+        self.assertIsNone(service._engine)
+        service.speak("apple")
+        service.prerender(["apple"])
+        self.assertIsNone(service._engine)
+        self.assertIsInstance(service._ensure_engine(), StubTTSEngine)
+        self.assertIsNone(service._get_audio("apple"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+验证词库索引
+"""
+
+import sys
+import os
+import unittest
+import tempfile
+
+# 添加src目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from api.vocabulary_index import DeckVocabulary, VocabularyIndex, VocabularyLevel
+
+
+class TestVocabularyIndex(unittest.TestCase):
+    """验证词库加载、成员查询与抽样"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        with open(os.path.join(self.temp_dir.name, "cet4_words.txt"), 'w', encoding='utf-8') as f:
+            f.write("apple\nBanana\n\ncherry\napple\n")
+        self.index = VocabularyIndex(self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_load_once_and_membership(self):
+        """词库只加载一次，单词统一小写去重"""
+        level = self.index.get_level("cet4")
+        self.assertIs(self.index.get_level("cet4"), level)
+        self.assertEqual(level.words, ("apple", "banana", "cherry"))
+        self.assertIn("BANANA", level)
+        self.assertNotIn("durian", level)
+
+    def test_fallback_level(self):
+        """缺失的级别退回到可用的词库文件"""
+        self.assertEqual(len(self.index.get_level("gre")), 3)
+
+    def test_sample_with_exclude(self):
+        """排除已有单词后抽样"""
+        level = self.index.get_level("cet4")
+        for _ in range(20):
+            self.assertEqual(level.sample(5, exclude={"apple", "cherry"}), ["banana"])
+        self.assertEqual(sorted(level.sample(10)), ["apple", "banana", "cherry"])
+
+    def test_sample_sparse_exclusion(self):
+        """大词库少量排除时结果不重复且不含排除项"""
+        level = VocabularyLevel("big", (f"w{i}" for i in range(10000)))
+        exclude = {f"w{i}" for i in range(0, 10000, 2)}
+        result = level.sample(50, exclude=exclude)
+        self.assertEqual(len(set(result)), 50)
+        self.assertFalse(exclude.intersection(result))
+
+
+class TestDeckVocabulary(unittest.TestCase):
+    """验证只抽取尚未加入词库的单词"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        with open(os.path.join(self.temp_dir.name, "cet6_words.txt"), 'w', encoding='utf-8') as f:
+            f.write("\n".join(f"w{i:03d}" for i in range(100)))
+        self.index = VocabularyIndex(self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_sample_unseen_sparse_and_dense(self):
+        """少量和大量已加入两种情况下都不会抽到已有单词"""
+        deck = DeckVocabulary(self.index, [f"w{i:03d}" for i in range(10)])
+        self.assertEqual(deck.unseen_count("cet6"), 90)
+        result = deck.sample_unseen("cet6", 50)
+        self.assertEqual(len(set(result)), 50)
+        self.assertFalse(any(w in deck for w in result))
+
+        deck = DeckVocabulary(self.index, [f"w{i:03d}" for i in range(97)])
+        self.assertEqual(sorted(deck.sample_unseen("cet6", 50)), ["w097", "w098", "w099"])
+
+    def test_incremental_updates(self):
+        """单词增删后位图同步更新"""
+        deck = DeckVocabulary(self.index, [f"w{i:03d}" for i in range(99)])
+        self.assertEqual(deck.sample_unseen("cet6", 5), ["w099"])
+        deck.add("W099")
+        self.assertEqual(deck.sample_unseen("cet6", 5), [])
+        deck.discard("w042")
+        self.assertEqual(deck.sample_unseen("cet6", 5), ["w042"])
+        deck.reset()
+        self.assertEqual(deck.unseen_count("cet6"), 100)
+
+
+if __name__ == '__main__':
+    unittest.main()